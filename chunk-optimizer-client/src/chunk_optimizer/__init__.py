@@ -1,7 +1,24 @@
 """Chunk Optimizer Client SDK"""
 from .client import ChunkOptimizerClient, SyncChunkOptimizerClient
-from .models import Optimization, Metrics, OptimizationOptions, BatchResult
-from .exceptions import ChunkOptimizerError, AuthenticationError, RateLimitError
+from .models import (
+    Optimization,
+    Metrics,
+    OptimizationOptions,
+    BatchResult,
+    ChunkResult,
+    StreamSummary,
+    BatchJob,
+    BatchJobResultsPage,
+    CacheStats
+)
+from .exceptions import (
+    ChunkOptimizerError,
+    AuthenticationError,
+    RateLimitError,
+    ServiceUnavailableError,
+    NetworkError,
+    DeadlineExceededError
+)
 
 __version__ = "0.1.0"
 __all__ = [
@@ -11,7 +28,15 @@ __all__ = [
     "Metrics",
     "OptimizationOptions",
     "BatchResult",
+    "ChunkResult",
+    "StreamSummary",
+    "BatchJob",
+    "BatchJobResultsPage",
+    "CacheStats",
     "ChunkOptimizerError",
     "AuthenticationError",
     "RateLimitError",
+    "ServiceUnavailableError",
+    "NetworkError",
+    "DeadlineExceededError",
 ]
@@ -0,0 +1,79 @@
+"""Micro-batching of individual calls into combined requests"""
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+# Sends a batch of items and returns one result or exception per item, in order
+BatchSender = Callable[[List[Any]], Awaitable[List[Any]]]
+
+
+class MicroBatcher:
+    """Buffer submitted items for up to ``window`` seconds or ``max_size`` items
+    
+    Each buffered batch goes to ``send`` as one call and every submitter gets
+    its own item's result. An exception returned in place of a result fails
+    only that item; an exception raised by ``send`` fails the whole batch.
+    """
+    
+    def __init__(self, send: BatchSender, window: float = 0.005, max_size: int = 64):
+        if window < 0:
+            raise ValueError("window must not be negative")
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._send = send
+        self.window = window
+        self.max_size = max_size
+        self._pending: List[Tuple[Any, "asyncio.Future[Any]"]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._sending: Set["asyncio.Task[None]"] = set()
+        self.batches = 0
+        self.items = 0
+    
+    async def submit(self, item: Any) -> Any:
+        """Result of ``item``, sent along with the other items of its batch"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        
+        if len(self._pending) >= self.max_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self.flush)
+        
+        return await future
+    
+    def flush(self):
+        """Send the buffered items now"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        
+        batch, self._pending = self._pending, []
+        self.batches += 1
+        self.items += len(batch)
+        task = asyncio.ensure_future(self._send_batch(batch))
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+    
+    async def _send_batch(self, batch: List[Tuple[Any, "asyncio.Future[Any]"]]):
+        try:
+            results = await self._send([item for item, _ in batch])
+        except Exception as e:
+            results = [e] * len(batch)
+        
+        for position, (_, future) in enumerate(batch):
+            # Submitters cancelled meanwhile no longer wait for a result
+            if future.done():
+                continue
+            result = results[position] if position < len(results) else RuntimeError("No result for batched item")
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+    
+    async def drain(self):
+        """Send the buffered items and wait for every batch in flight"""
+        self.flush()
+        if self._sending:
+            await asyncio.gather(*self._sending, return_exceptions=True)
@@ -0,0 +1,112 @@
+"""Bounded LRU result cache with TTL and single-flight loading"""
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from .models import CacheStats
+
+_MISSING = object()
+
+
+def content_digest(*parts: Any) -> str:
+    """128-bit BLAKE2 digest of JSON-serializable request parts"""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class ResultCache:
+    """LRU cache of analysis results bounded by entry count, with a per-entry TTL
+    
+    ``get_or_load`` shares one call to the loader among concurrent callers of
+    the same missing key. ``clear`` starts a new generation: loads already in
+    flight still answer their callers but are not stored, and later callers
+    start a new load instead of joining them.
+    """
+    
+    def __init__(self, max_entries: int = 10000, ttl: float = 3600):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple[Any, float]]" = OrderedDict()
+        self._in_flight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def _lookup(self, key: Hashable) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            self.expirations += 1
+            return _MISSING
+        
+        self._entries.move_to_end(key)
+        return value
+    
+    def put(self, key: Hashable, value: Any):
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (value, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def clear(self):
+        self._entries.clear()
+        self._in_flight.clear()
+        self._generation += 1
+    
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Cached value of ``key``, loading it once however many callers miss concurrently"""
+        value = self._lookup(key)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+        
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(loader())
+            self._in_flight[key] = task
+            generation = self._generation
+            task.add_done_callback(lambda done: self._loaded(key, done, generation))
+        
+        # A cancelled caller must not cancel the load shared with the others
+        return await asyncio.shield(task)
+    
+    def _loaded(self, key: Hashable, task: "asyncio.Future[Any]", generation: int):
+        # After a clear the key may already be loading again in a newer generation
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        if generation == self._generation:
+            self.put(key, task.result())
+    
+    def stats(self) -> CacheStats:
+        lookups = self.hits + self.misses + self.coalesced
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            coalesced=self.coalesced,
+            evictions=self.evictions,
+            expirations=self.expirations,
+            size=len(self._entries),
+            max_entries=self.max_entries,
+            hit_ratio=self.hits / lookups if lookups else 0.0
+        )
@@ -1,28 +1,144 @@
 """Chunk Optimizer Client"""
 import asyncio
+import concurrent.futures
+import contextlib
+import itertools
+import json
+import random
+import threading
+import time
 import uuid
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import (
+    List,
+    Optional,
+    Dict,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    TypeVar,
+    Union
+)
 
 import aiohttp
 from loguru import logger
 
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - msgpack is an optional dependency
+    msgpack = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - pyarrow is an optional dependency
+    pa = None
+
+from .batching import MicroBatcher
+from .cache import ResultCache, content_digest
 from .models import (
+    CacheStats,
     Optimization,
     Metrics,
     OptimizationOptions,
-    BatchResult
+    BatchResult,
+    ChunkResult,
+    StreamSummary,
+    BatchJob,
+    BatchJobResultsPage
 )
 from .exceptions import (
     ChunkOptimizerError,
     AuthenticationError,
     RateLimitError,
-    NetworkError
+    ServiceUnavailableError,
+    NetworkError,
+    DeadlineExceededError
 )
 
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+WIRE_FORMATS = {"json": JSON_MEDIA_TYPE, "msgpack": MSGPACK_MEDIA_TYPE}
+
+# Transient overload or restart of the service, worth retrying
+UNAVAILABLE_STATUSES = (502, 503, 504)
+
+T = TypeVar("T")
+
+Chunks = Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]]
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header, in delta-seconds or HTTP-date form"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+async def _batches(chunks: Chunks, batch_size: int, max_batch_chars: int) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Chunks of a sync or async iterable grouped into batches, pulled only as batches are taken"""
+    if hasattr(chunks, "__aiter__"):
+        source = chunks
+    else:
+        async def iterate() -> AsyncIterator[Dict[str, Any]]:
+            for chunk in chunks:
+                yield chunk
+        source = iterate()
+    
+    batch: List[Dict[str, Any]] = []
+    batch_chars = 0
+    async for chunk in source:
+        chars = len(chunk.get("content") or "")
+        if batch and (len(batch) >= batch_size or batch_chars + chars > max_batch_chars):
+            yield batch
+            batch, batch_chars = [], 0
+        batch.append(chunk)
+        batch_chars += chars
+    if batch:
+        yield batch
+
 
 class ChunkOptimizerClient:
-    """Async Chunk Optimizer Client"""
+    """Async Chunk Optimizer Client
+    
+    ``wire_format="msgpack"`` sends and receives MessagePack instead of JSON,
+    which is cheaper to encode and parse for large documents and batches.
+    
+    Chunk, document and batch results are cached by content digest and
+    domain in a bounded LRU; concurrent identical calls share one request.
+    The cache is flushed whenever the service reports a new algorithm
+    version, so it only ever holds results of the version being served.
+    
+    ``micro_batch=True`` buffers ``analyze_chunk`` calls that miss the cache
+    for up to ``micro_batch_window`` seconds or ``micro_batch_max_size``
+    calls and sends them as one request per domain; each call still gets
+    its own result, or its own error when only its chunk is rejected.
+    
+    Connections are pooled and kept alive (``pool_size``, ``pool_size_per_host``,
+    ``keepalive_timeout``), and ``max_concurrency`` caps requests in flight.
+    429 and 502/503/504 responses and dropped connections are retried up to
+    ``max_retries`` times with jittered exponential backoff, waiting at least
+    as long as the service's Retry-After. ``request_deadline`` bounds a call
+    with all its retries, while ``timeout`` bounds each attempt.
+    """
     
     def __init__(
         self,
@@ -30,14 +146,47 @@ class ChunkOptimizerClient:
         base_url: str = "http://localhost:8000",
         timeout: int = 30,
         enable_cache: bool = True,
-        cache_ttl: int = 3600
+        cache_ttl: int = 3600,
+        wire_format: str = "json",
+        cache_max_entries: int = 10000,
+        micro_batch: bool = False,
+        micro_batch_window: float = 0.005,
+        micro_batch_max_size: int = 64,
+        pool_size: int = 100,
+        pool_size_per_host: int = 0,
+        keepalive_timeout: float = 30,
+        max_concurrency: Optional[int] = None,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30,
+        request_deadline: Optional[float] = None
     ):
+        if wire_format not in WIRE_FORMATS:
+            raise ValueError(f"wire_format must be one of: {', '.join(WIRE_FORMATS)}")
+        if wire_format == "msgpack" and msgpack is None:
+            raise ValueError("The msgpack wire format requires the msgpack package")
+        
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self.enable_cache = enable_cache
         self.cache_ttl = cache_ttl
-        self._cache: Dict[str, tuple] = {}
+        self.wire_format = wire_format
+        self._media_type = WIRE_FORMATS[wire_format]
+        self._cache = ResultCache(max_entries=cache_max_entries, ttl=cache_ttl)
+        self.algorithm_version: Optional[str] = None
+        self.micro_batch = micro_batch
+        self.micro_batch_window = micro_batch_window
+        self.micro_batch_max_size = micro_batch_max_size
+        self._batchers: Dict[str, MicroBatcher] = {}
+        self.pool_size = pool_size
+        self.pool_size_per_host = pool_size_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.request_deadline = request_deadline
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
         self._session: Optional[aiohttp.ClientSession] = None
     
     async def __aenter__(self):
@@ -50,144 +199,645 @@ class ChunkOptimizerClient:
     async def _ensure_session(self):
         if self._session is None:
             timeout = aiohttp.ClientTimeout(total=self.timeout)
-            self._session = aiohttp.ClientSession(
-                timeout=timeout,
-                headers={
-                    "Content-Type": "application/json"
-                }
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                limit_per_host=self.pool_size_per_host,
+                keepalive_timeout=self.keepalive_timeout
             )
+            self._session = aiohttp.ClientSession(timeout=timeout, connector=connector)
     
     async def close(self):
+        for batcher in self._batchers.values():
+            await batcher.drain()
         if self._session:
             await self._session.close()
             self._session = None
     
+    def _encode(self, data: Optional[Dict[str, Any]]) -> tuple[Optional[bytes], Dict[str, str]]:
+        """Request body in the wire format, with its Content-Type header"""
+        if data is None:
+            return None, {}
+        if self._media_type == MSGPACK_MEDIA_TYPE:
+            return msgpack.packb(data), {"Content-Type": MSGPACK_MEDIA_TYPE}
+        return json.dumps(data).encode("utf-8"), {"Content-Type": JSON_MEDIA_TYPE}
+    
+    @staticmethod
+    def _decode(content_type: str, body: bytes) -> Any:
+        """Response body decoded by its Content-Type"""
+        if content_type == MSGPACK_MEDIA_TYPE:
+            return msgpack.unpackb(body)
+        if content_type == ARROW_MEDIA_TYPE:
+            return pa.ipc.open_stream(body).read_all()
+        return json.loads(body)
+    
     async def _request(
         self,
         method: str,
         endpoint: str,
-        data: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
-        await self._ensure_session()
+        data: Optional[Dict[str, Any]] = None,
+        accept: Optional[str] = None,
+        deadline: Optional[float] = None,
+        idempotent: bool = True
+    ) -> Any:
         url = f"{self.base_url}{endpoint}"
+        body, headers = self._encode(data)
+        headers["Accept"] = accept or self._media_type
         
-        try:
-            async with self._session.request(method, url, json=data) as response:
-                if response.status == 401:
-                    raise AuthenticationError("Invalid API key")
-                elif response.status == 429:
-                    raise RateLimitError("Rate limit exceeded")
-                elif response.status != 200:
-                    error_text = await response.text()
-                    raise ChunkOptimizerError(f"API error: {error_text}")
-                
-                return await response.json()
-        except aiohttp.ClientError as e:
-            raise NetworkError(f"Network error: {str(e)}")
+        async def attempt(remaining: Optional[float]) -> Any:
+            timeout = aiohttp.ClientTimeout(total=self.timeout if remaining is None else min(self.timeout, remaining))
+            async with self._session.request(method, url, data=body, headers=headers, timeout=timeout) as response:
+                await self._raise_for_status(response)
+                self._observe_version(response)
+                return self._decode(response.content_type, await response.read())
+        
+        return await self._send(attempt, deadline, idempotent)
     
-    def _get_from_cache(self, key: str) -> Optional[Any]:
-        if not self.enable_cache:
-            return None
+    async def _send(
+        self,
+        attempt: Callable[[Optional[float]], Awaitable[T]],
+        deadline: Optional[float] = None,
+        idempotent: bool = True
+    ) -> T:
+        """Run request attempts under the concurrency limit until one succeeds or must not be retried
         
-        if key in self._cache:
-            data, timestamp = self._cache[key]
-            if datetime.now().timestamp() - timestamp < self.cache_ttl:
-                return data
-            else:
-                del self._cache[key]
+        ``attempt`` gets the seconds left before the deadline, which bounds
+        every attempt and backoff of the call together. Calls that are not
+        idempotent are only retried after a 429, which the service sends
+        before acting on the request; after a 5xx or a dropped connection
+        the service may already have acted on the request.
+        """
+        await self._ensure_session()
+        loop = asyncio.get_running_loop()
+        deadline = self.request_deadline if deadline is None else deadline
+        deadline_at = loop.time() + deadline if deadline is not None else None
         
-        return None
+        for retry in itertools.count():
+            try:
+                async with self._semaphore or contextlib.nullcontext():
+                    remaining = None
+                    if deadline_at is not None:
+                        remaining = deadline_at - loop.time()
+                        if remaining <= 0:
+                            raise DeadlineExceededError(f"Request deadline of {deadline}s exceeded")
+                    return await attempt(remaining)
+            except (RateLimitError, ServiceUnavailableError) as e:
+                error, retry_after = e, e.retry_after
+            except asyncio.TimeoutError:
+                # Before connection errors: aiohttp's read timeouts are both
+                if deadline_at is not None and loop.time() >= deadline_at:
+                    raise DeadlineExceededError(f"Request deadline of {deadline}s exceeded")
+                raise NetworkError(f"Request timed out after {self.timeout}s")
+            except aiohttp.ClientConnectionError as e:
+                error, retry_after = NetworkError(f"Network error: {str(e)}"), None
+            except aiohttp.ClientError as e:
+                raise NetworkError(f"Network error: {str(e)}")
+            
+            if not idempotent and not isinstance(error, RateLimitError):
+                raise error
+            
+            delay = self._backoff(retry, retry_after)
+            if retry >= self.max_retries or (deadline_at is not None and loop.time() + delay >= deadline_at):
+                raise error
+            logger.debug(f"Retrying in {delay:.2f}s after: {error}")
+            await asyncio.sleep(delay)
+    
+    def _backoff(self, retry: int, retry_after: Optional[float]) -> float:
+        """Delay before a retry: full jitter over an exponential ceiling, or Retry-After plus jitter"""
+        if retry_after is not None:
+            # Spread out clients told to come back at the same moment
+            return retry_after + random.uniform(0, self.backoff_base)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** retry))
     
-    def _set_cache(self, key: str, data: Any):
-        if self.enable_cache:
-            self._cache[key] = (data, datetime.now().timestamp())
+    async def _iter_messages(self, response: aiohttp.ClientResponse) -> AsyncIterator[Dict[str, Any]]:
+        """Messages of a streamed response, NDJSON lines or a MessagePack sequence"""
+        if response.content_type == MSGPACK_MEDIA_TYPE:
+            unpacker = msgpack.Unpacker()
+            async for data in response.content.iter_any():
+                unpacker.feed(data)
+                for message in unpacker:
+                    yield message
+            return
+        
+        async for line in response.content:
+            if line.strip():
+                yield json.loads(line)
+    
+    async def _raise_for_status(self, response: aiohttp.ClientResponse):
+        if response.status == 401:
+            raise AuthenticationError("Invalid API key")
+        elif response.status == 429:
+            raise RateLimitError("Rate limit exceeded", _retry_after(response.headers.get("Retry-After")))
+        elif response.status in UNAVAILABLE_STATUSES:
+            error_text = await response.text()
+            raise ServiceUnavailableError(
+                f"API error: {error_text}",
+                _retry_after(response.headers.get("Retry-After"))
+            )
+        elif not 200 <= response.status < 300:
+            error_text = await response.text()
+            raise ChunkOptimizerError(f"API error: {error_text}")
+    
+    def _observe_version(self, response: aiohttp.ClientResponse):
+        """Track the service's algorithm version, flushing results of an older one"""
+        version = response.headers.get("X-Algorithm-Version")
+        if version and version != self.algorithm_version:
+            if self.algorithm_version is not None:
+                self._cache.clear()
+            self.algorithm_version = version
+    
+    async def _cached(self, key: tuple, load: Callable[[], Awaitable[Any]]) -> Any:
+        if not self.enable_cache:
+            return await load()
+        return await self._cache.get_or_load(key, load)
+    
+    def cache_stats(self) -> CacheStats:
+        """Hit, miss, coalescing and eviction counts of the result cache"""
+        return self._cache.stats()
+    
+    @staticmethod
+    def _chunks_digest(chunks: List[Dict[str, Any]], options: Optional[OptimizationOptions]) -> str:
+        """Digest of what the service analyzes: chunk ids, contents and options"""
+        return content_digest(
+            [(chunk.get("chunk_id"), chunk.get("content")) for chunk in chunks],
+            options.dict() if options else {}
+        )
     
     async def analyze_chunk(
         self,
         chunk_id: str,
         content: str,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        domain: str = "default"
     ) -> tuple[Optimization, Metrics]:
-        cache_key = f"chunk:{chunk_id}"
-        cached = self._get_from_cache(cache_key)
-        if cached:
-            return cached
-        
         data = {
             "chunk_id": chunk_id,
             "content": content,
-            "metadata": metadata or {}
+            "metadata": metadata or {},
+            "domain": domain
         }
         
-        response = await self._request("POST", "/api/v1/chunks/analyze", data)
+        async def load() -> tuple[Optimization, Metrics]:
+            if self.micro_batch:
+                return await self._batcher(domain).submit(data)
+            return await self._request_chunk(data)
         
-        optimization = Optimization(**response["optimization"])
-        metrics = Metrics(**response["metrics"])
+        optimization, metrics = await self._cached(("chunk", content_digest(content), domain), load)
         
-        result = (optimization, metrics)
-        self._set_cache(cache_key, result)
+        if metrics.chunk_id != chunk_id:
+            # Identical content was cached under another chunk id; the copy is a distinct optimization
+            optimization = optimization.model_copy(update={"id": str(uuid.uuid4()), "chunk_id": chunk_id})
+            metrics = metrics.model_copy(update={"chunk_id": chunk_id})
         
-        return result
+        return optimization, metrics
+    
+    async def _request_chunk(self, data: Dict[str, Any]) -> tuple[Optimization, Metrics]:
+        response = await self._request("POST", "/api/v1/chunks/analyze", data)
+        return Optimization(**response["optimization"]), Metrics(**response["metrics"])
+    
+    def _batcher(self, domain: str) -> MicroBatcher:
+        """Micro-batcher of single-chunk calls in a domain"""
+        batcher = self._batchers.get(domain)
+        if batcher is None:
+            async def send(items: List[Dict[str, Any]]) -> List[Any]:
+                return await self._request_chunks(domain, items)
+            
+            batcher = MicroBatcher(send, self.micro_batch_window, self.micro_batch_max_size)
+            self._batchers[domain] = batcher
+        return batcher
+    
+    async def _request_chunks(self, domain: str, items: List[Dict[str, Any]]) -> List[Any]:
+        """Results of single-chunk requests sent as one request, an exception in place of each failed item"""
+        if len(items) == 1:
+            return [await self._request_chunk(items[0])]
+        
+        data = {
+            "chunks": [
+                {"chunk_id": item["chunk_id"], "content": item["content"], "metadata": item["metadata"]}
+                for item in items
+            ],
+            "domain": domain
+        }
+        try:
+            response = await self._request("POST", "/api/v1/chunks/analyze/batch", data)
+        except (AuthenticationError, RateLimitError, ServiceUnavailableError, NetworkError):
+            raise
+        except ChunkOptimizerError:
+            # One rejected chunk fails the whole request; resend each so it fails alone
+            return await asyncio.gather(*(self._request_chunk(item) for item in items), return_exceptions=True)
+        
+        results: List[Any] = []
+        for position, item in enumerate(items):
+            if position < len(response):
+                entry = response[position]
+                results.append((Optimization(**entry["optimization"]), Metrics(**entry["metrics"])))
+            else:
+                results.append(ChunkOptimizerError(f"No result for chunk {item['chunk_id']}"))
+        return results
     
     async def analyze_document(
         self,
         document_id: str,
         chunks: List[Dict[str, Any]],
-        options: Optional[OptimizationOptions] = None
+        options: Optional[OptimizationOptions] = None,
+        domain: Optional[str] = None
     ) -> List[Optimization]:
         data = {
             "document_id": document_id,
             "chunks": chunks,
-            "options": options.dict() if options else {}
+            "options": options.dict() if options else {},
+            "domain": domain or "default"
+        }
+        
+        async def load() -> List[Optimization]:
+            response = await self._request("POST", "/api/v1/documents/analyze", data)
+            return [Optimization(**opt) for opt in response["optimizations"]]
+        
+        key = ("document", self._chunks_digest(chunks, options), domain or "default")
+        return list(await self._cached(key, load))
+    
+    async def analyze_document_arrow(
+        self,
+        document_id: str,
+        chunks: List[Dict[str, Any]],
+        options: Optional[OptimizationOptions] = None,
+        domain: Optional[str] = None
+    ) -> "pa.Table":
+        """Analyze a document into an Arrow table with one row per chunk
+        
+        Scores are float64 columns, null where a metric was not computed, and
+        ``optimizations`` is a list of structs; ``table.to_pandas()`` loads it
+        into a dataframe without any JSON decoding.
+        """
+        data = {
+            "document_id": document_id,
+            "chunks": chunks,
+            "options": options.dict() if options else {},
+            "domain": domain or "default"
+        }
+        
+        key = ("document_arrow", self._chunks_digest(chunks, options), domain or "default")
+        return await self._cached(key, lambda: self._request_arrow("/api/v1/documents/analyze", data))
+    
+    async def analyze_document_stream(
+        self,
+        document_id: str,
+        chunks: List[Dict[str, Any]],
+        options: Optional[OptimizationOptions] = None,
+        domain: Optional[str] = None
+    ) -> AsyncIterator[Union[ChunkResult, StreamSummary]]:
+        """Yield a ChunkResult per chunk as the service computes it, then a StreamSummary
+        
+        Retries and the request deadline apply until the stream starts.
+        """
+        url = f"{self.base_url}/api/v1/documents/analyze/stream"
+        data = {
+            "document_id": document_id,
+            "chunks": chunks,
+            "options": options.dict() if options else {},
+            "domain": domain or "default"
         }
+        body, headers = self._encode(data)
+        headers["Accept"] = self._media_type
+        
+        async def attempt(remaining: Optional[float]) -> aiohttp.ClientResponse:
+            # The stream may outlive the session timeout; bound idle reads instead
+            timeout = aiohttp.ClientTimeout(total=None, connect=remaining, sock_read=self.timeout)
+            response = await self._session.post(url, data=body, headers=headers, timeout=timeout)
+            try:
+                await self._raise_for_status(response)
+            except BaseException:
+                response.release()
+                raise
+            self._observe_version(response)
+            return response
+        
+        response = await self._send(attempt)
+        try:
+            async with response:
+                async for message in self._iter_messages(response):
+                    message_type = message.pop("type", "result")
+                    
+                    if message_type == "result":
+                        yield ChunkResult(**message)
+                    elif message_type == "summary":
+                        yield StreamSummary(**message)
+                    elif message_type == "error":
+                        raise ChunkOptimizerError(f"API error: {message.get('detail')}")
+        except aiohttp.ClientError as e:
+            raise NetworkError(f"Network error: {str(e)}")
+    
+    async def analyze_iter(
+        self,
+        chunks: Chunks,
+        options: Optional[OptimizationOptions] = None,
+        domain: Optional[str] = None,
+        batch_size: int = 100,
+        max_batch_chars: int = 1_000_000,
+        max_in_flight: int = 4,
+        ordered: bool = True
+    ) -> AsyncIterator[ChunkResult]:
+        """Yield a ChunkResult per chunk of a sync or async iterable of any length
+        
+        Chunks are grouped into requests of up to ``batch_size`` chunks and
+        ``max_batch_chars`` characters of content, and at most
+        ``max_in_flight`` requests run at once; the source is only read ahead
+        to refill them, so memory stays bounded however many chunks it yields.
+        Results come in input order, or batch by batch as each completes with
+        ``ordered=False``. A sync iterable is read on the event loop.
+        """
+        if batch_size < 1 or max_in_flight < 1:
+            raise ValueError("batch_size and max_in_flight must be at least 1")
+        
+        document_id = str(uuid.uuid4())
+        batches = _batches(chunks, batch_size, max_batch_chars)
+        in_flight: Deque["asyncio.Task[List[ChunkResult]]"] = deque()
+        submitted = 0
+        exhausted = False
         
-        response = await self._request("POST", "/api/v1/documents/analyze", data)
+        async def analyze(batch: List[Dict[str, Any]], index: int) -> List[ChunkResult]:
+            return [
+                message
+                async for message in self.analyze_document_stream(f"{document_id}:{index}", batch, options, domain)
+                if isinstance(message, ChunkResult)
+            ]
         
-        return [Optimization(**opt) for opt in response["optimizations"]]
+        try:
+            while True:
+                while not exhausted and len(in_flight) < max_in_flight:
+                    batch = await anext(batches, None)
+                    if batch is None:
+                        exhausted = True
+                    else:
+                        in_flight.append(asyncio.ensure_future(analyze(batch, submitted)))
+                        submitted += 1
+                
+                if not in_flight:
+                    return
+                
+                if ordered:
+                    task = in_flight.popleft()
+                else:
+                    done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    task = next(pending for pending in in_flight if pending in done)
+                    in_flight.remove(task)
+                
+                for result in await task:
+                    yield result
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+            await batches.aclose()
     
     async def analyze_batch(
         self,
         items: List[Dict[str, Any]],
-        options: Optional[OptimizationOptions] = None
+        options: Optional[OptimizationOptions] = None,
+        domain: Optional[str] = None
     ) -> BatchResult:
         batch_id = str(uuid.uuid4())
         data = {
             "batch_id": batch_id,
             "items": items,
-            "options": options.dict() if options else {}
+            "options": options.dict() if options else {},
+            "domain": domain or "default"
+        }
+        
+        async def load() -> BatchResult:
+            response = await self._request("POST", "/api/v1/batch/analyze", data)
+            return BatchResult(
+                batch_id=batch_id,
+                total=len(items),
+                processed=response.get("processed", 0),
+                optimizations=[Optimization(**response["optimization"])] if response.get("optimization") else []
+            )
+        
+        result = await self._cached(("batch", self._chunks_digest(items, options), domain or "default"), load)
+        return result if result.batch_id == batch_id else result.model_copy(update={"batch_id": batch_id})
+    
+    async def analyze_batch_arrow(
+        self,
+        items: List[Dict[str, Any]],
+        options: Optional[OptimizationOptions] = None,
+        domain: Optional[str] = None
+    ) -> "pa.Table":
+        """Analyze a batch into an Arrow table with one row per item, like ``analyze_document_arrow``"""
+        data = {
+            "batch_id": str(uuid.uuid4()),
+            "items": items,
+            "options": options.dict() if options else {},
+            "domain": domain or "default"
+        }
+        
+        key = ("batch_arrow", self._chunks_digest(items, options), domain or "default")
+        return await self._cached(key, lambda: self._request_arrow("/api/v1/batch/analyze", data))
+    
+    async def _request_arrow(self, endpoint: str, data: Dict[str, Any]) -> "pa.Table":
+        if pa is None:
+            raise ChunkOptimizerError("Arrow results require the pyarrow package")
+        
+        table = await self._request("POST", endpoint, data, accept=ARROW_MEDIA_TYPE)
+        if not isinstance(table, pa.Table):
+            raise ChunkOptimizerError("The service did not return Arrow results")
+        return table
+    
+    async def submit_batch_job(
+        self,
+        items: List[Dict[str, Any]],
+        options: Optional[OptimizationOptions] = None,
+        batch_id: Optional[str] = None,
+        domain: Optional[str] = None
+    ) -> BatchJob:
+        data = {
+            "batch_id": batch_id or str(uuid.uuid4()),
+            "items": items,
+            "options": options.dict() if options else {},
+            "domain": domain or "default"
         }
         
-        response = await self._request("POST", "/api/v1/batch/analyze", data)
+        # Resending after a lost response could start the same job twice
+        response = await self._request("POST", "/api/v1/batch/jobs", data, idempotent=False)
         
-        return BatchResult(
-            batch_id=batch_id,
-            total=len(items),
-            processed=response.get("processed", 0),
-            optimizations=[Optimization(**response["optimization"])] if response.get("optimization") else []
+        return BatchJob(**response)
+    
+    async def get_batch_job(self, job_id: str) -> BatchJob:
+        response = await self._request("GET", f"/api/v1/batch/jobs/{job_id}")
+        
+        return BatchJob(**response)
+    
+    async def get_batch_job_results(
+        self,
+        job_id: str,
+        offset: int = 0,
+        limit: int = 100
+    ) -> BatchJobResultsPage:
+        response = await self._request(
+            "GET",
+            f"/api/v1/batch/jobs/{job_id}/results?offset={offset}&limit={limit}"
         )
+        
+        return BatchJobResultsPage(**response)
 
 
 class SyncChunkOptimizerClient:
-    """Synchronous wrapper for Chunk Optimizer Client"""
+    """Synchronous, thread-safe wrapper for Chunk Optimizer Client
+    
+    The async client runs on an event loop in a background thread owned by
+    this wrapper, so calls work from any thread, including threads already
+    running an event loop such as Jupyter, and calls from many threads run
+    concurrently over one session and connection pool. ``submit`` and ``map``
+    return ``concurrent.futures`` futures for parallel calls from one thread.
+    """
+    
+    # Async client methods returning a single result
+    METHODS = (
+        "analyze_chunk",
+        "analyze_document",
+        "analyze_document_arrow",
+        "analyze_batch",
+        "analyze_batch_arrow",
+        "submit_batch_job",
+        "get_batch_job",
+        "get_batch_job_results"
+    )
     
     def __init__(self, *args, **kwargs):
         self._async_client = ChunkOptimizerClient(*args, **kwargs)
-        self._loop = asyncio.get_event_loop()
+        self._loop = asyncio.new_event_loop()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run_loop, name="chunk-optimizer-client", daemon=True)
+        self._thread.start()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+    
+    def _run(self, coro: Awaitable[T]) -> "concurrent.futures.Future[T]":
+        """Schedule a coroutine on the client's loop"""
+        with self._lock:
+            if self._closed:
+                coro.close()
+                raise ChunkOptimizerError("Client is closed")
+            return asyncio.run_coroutine_threadsafe(coro, self._loop)
+    
+    def _wait(self, future: "concurrent.futures.Future[T]") -> T:
+        if threading.current_thread() is self._thread:
+            # Blocking the loop thread on its own work would never return
+            raise RuntimeError("Synchronous calls cannot be made from the client's event loop")
+        return future.result()
+    
+    def submit(self, method: str, *args, **kwargs) -> "concurrent.futures.Future[Any]":
+        """Start a call of the async client method ``method`` and return its future"""
+        if method not in self.METHODS:
+            raise ValueError(f"method must be one of: {', '.join(self.METHODS)}")
+        return self._run(getattr(self._async_client, method)(*args, **kwargs))
+    
+    def map(self, method: str, *iterables: Iterable[Any], timeout: Optional[float] = None) -> Iterator[Any]:
+        """Results of ``method`` over the arguments zipped from ``iterables``, like ``Executor.map``
+        
+        Every call is started up front and runs concurrently; results are
+        yielded in argument order, and unfinished calls are cancelled if
+        iteration stops early or a call fails.
+        """
+        end_time = time.monotonic() + timeout if timeout is not None else None
+        futures = [self.submit(method, *args) for args in zip(*iterables)]
+        
+        def results() -> Iterator[Any]:
+            try:
+                for future in futures:
+                    if end_time is None:
+                        yield self._wait(future)
+                    else:
+                        yield future.result(max(0.0, end_time - time.monotonic()))
+            finally:
+                for future in futures:
+                    future.cancel()
+        
+        return results()
+    
+    def _iterate(self, iterator: AsyncIterator[T]) -> Iterator[T]:
+        """Sync iterator pulling the items of an async iterator from the client's loop"""
+        async def step() -> tuple[bool, Optional[T]]:
+            try:
+                return True, await iterator.__anext__()
+            except StopAsyncIteration:
+                return False, None
+        
+        try:
+            while True:
+                has_item, item = self._wait(self._run(step()))
+                if not has_item:
+                    return
+                yield item
+        finally:
+            try:
+                closing = self._run(iterator.aclose())
+            except ChunkOptimizerError:
+                pass
+            else:
+                self._wait(closing)
     
     def analyze_chunk(self, *args, **kwargs):
-        return self._loop.run_until_complete(
-            self._async_client.analyze_chunk(*args, **kwargs)
-        )
+        return self._wait(self.submit("analyze_chunk", *args, **kwargs))
     
     def analyze_document(self, *args, **kwargs):
-        return self._loop.run_until_complete(
-            self._async_client.analyze_document(*args, **kwargs)
-        )
+        return self._wait(self.submit("analyze_document", *args, **kwargs))
+    
+    def analyze_document_arrow(self, *args, **kwargs):
+        return self._wait(self.submit("analyze_document_arrow", *args, **kwargs))
+    
+    def analyze_document_stream(self, *args, **kwargs):
+        return self._iterate(self._async_client.analyze_document_stream(*args, **kwargs))
+    
+    def analyze_iter(self, *args, **kwargs):
+        return self._iterate(self._async_client.analyze_iter(*args, **kwargs))
     
     def analyze_batch(self, *args, **kwargs):
-        return self._loop.run_until_complete(
-            self._async_client.analyze_batch(*args, **kwargs)
-        )
+        return self._wait(self.submit("analyze_batch", *args, **kwargs))
+    
+    def analyze_batch_arrow(self, *args, **kwargs):
+        return self._wait(self.submit("analyze_batch_arrow", *args, **kwargs))
+    
+    def submit_batch_job(self, *args, **kwargs):
+        return self._wait(self.submit("submit_batch_job", *args, **kwargs))
+    
+    def get_batch_job(self, *args, **kwargs):
+        return self._wait(self.submit("get_batch_job", *args, **kwargs))
+    
+    def get_batch_job_results(self, *args, **kwargs):
+        return self._wait(self.submit("get_batch_job_results", *args, **kwargs))
+    
+    def cache_stats(self) -> CacheStats:
+        async def stats() -> CacheStats:
+            return self._async_client.cache_stats()
+        return self._wait(self._run(stats()))
+    
+    async def _shutdown(self):
+        await self._async_client.close()
+        # Calls still running would otherwise leave their callers waiting forever
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
     
     def close(self):
-        self._loop.run_until_complete(self._async_client.close())
+        """Close the session, cancel unfinished calls and stop the loop thread; safe to call more than once"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            future = asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop)
+        try:
+            self._wait(future)
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
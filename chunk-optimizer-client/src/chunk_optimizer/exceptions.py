@@ -1,4 +1,5 @@
 """Exceptions for Chunk Optimizer Client"""
+from typing import Optional
 
 
 class ChunkOptimizerError(Exception):
@@ -13,7 +14,18 @@ class AuthenticationError(ChunkOptimizerError):
 
 class RateLimitError(ChunkOptimizerError):
     """Rate limit exceeded"""
-    pass
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class ServiceUnavailableError(ChunkOptimizerError):
+    """Service temporarily unavailable"""
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class NetworkError(ChunkOptimizerError):
@@ -21,6 +33,11 @@ class NetworkError(ChunkOptimizerError):
     pass
 
 
+class DeadlineExceededError(NetworkError):
+    """Request deadline exceeded"""
+    pass
+
+
 class ValidationError(ChunkOptimizerError):
     """Validation error"""
     pass
@@ -21,11 +21,15 @@ class Optimization(BaseModel):
 class Metrics(BaseModel):
     """Quality metrics for a chunk"""
     chunk_id: str
-    quality_score: float = Field(ge=0, le=1)
-    redundancy_score: float = Field(ge=0, le=1)
-    size_score: float = Field(ge=0, le=1)
-    similarity_score: float = Field(ge=0, le=1)
-    overall_score: float = Field(ge=0, le=1)
+    quality_score: Optional[float] = Field(default=None, ge=0, le=1)
+    redundancy_score: Optional[float] = Field(default=None, ge=0, le=1)
+    size_score: Optional[float] = Field(default=None, ge=0, le=1)
+    similarity_score: Optional[float] = Field(default=None, ge=0, le=1)
+    overall_score: Optional[float] = Field(default=None, ge=0, le=1)
+    computed_metrics: List[str] = Field(
+        default_factory=lambda: ["quality", "redundancy", "size", "similarity"],
+        description="Metrics that were computed; the scores of the others are null"
+    )
 
 
 class OptimizationOptions(BaseModel):
@@ -44,3 +48,50 @@ class BatchResult(BaseModel):
     processed: int
     optimizations: List[Optimization]
     failed: Optional[List[str]] = Field(default_factory=list)
+
+
+class ChunkResult(BaseModel):
+    """Analysis result of a single chunk in a streamed document"""
+    chunk_id: str
+    metrics: Metrics
+    optimizations: List[Optimization]
+
+
+class StreamSummary(BaseModel):
+    """Trailing summary of a streamed document analysis"""
+    total: int
+    high_priority: int
+
+
+class BatchJob(BaseModel):
+    """State of a background batch analysis job"""
+    job_id: str
+    batch_id: str
+    status: str = Field(..., description="Status: pending, running, completed, failed")
+    processed: int
+    total: int
+    error: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+
+class BatchJobResultsPage(BaseModel):
+    """A page of results of a batch analysis job"""
+    job_id: str
+    results: List[ChunkResult]
+    offset: int
+    limit: int
+    processed: int
+    next_offset: Optional[int] = None
+
+
+class CacheStats(BaseModel):
+    """Statistics of the client-side result cache"""
+    hits: int
+    misses: int
+    coalesced: int = Field(..., description="Lookups that joined a request already in flight")
+    evictions: int
+    expirations: int
+    size: int
+    max_entries: int
+    hit_ratio: float
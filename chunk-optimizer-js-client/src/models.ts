@@ -19,11 +19,12 @@ export interface Optimization {
 
 export interface Metrics {
   chunk_id: string;
-  quality_score: number;
-  redundancy_score: number;
-  size_score: number;
-  similarity_score: number;
-  overall_score: number;
+  quality_score: number | null;
+  redundancy_score: number | null;
+  size_score: number | null;
+  similarity_score: number | null;
+  overall_score: number | null;
+  computed_metrics?: string[];
 }
 
 export interface OptimizationOptions {
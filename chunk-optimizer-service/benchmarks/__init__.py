@@ -0,0 +1,14 @@
+"""
+Reproducible micro-benchmarks for the chunk optimizer service
+
+Every benchmark runs on deterministic synthetic corpora (see ``corpus``) and
+reports per-chunk timings. Runs are saved as JSON so a later run can be
+compared against a stored baseline. ``baselines/main.json`` is a reference
+run at the defaults (size 50, repeat 5, seed 42); timings depend on the
+machine, so regenerate it on the machine you compare on.
+
+Usage (from chunk-optimizer-service/):
+    PYTHONPATH=src python -m benchmarks run --output benchmarks/baselines/main.json
+    PYTHONPATH=src python -m benchmarks run --output /tmp/current.json
+    PYTHONPATH=src python -m benchmarks compare benchmarks/baselines/main.json /tmp/current.json
+"""
@@ -0,0 +1,95 @@
+"""Command line entry point: ``python -m benchmarks run|compare``"""
+import argparse
+import json
+import os
+import platform
+import sys
+from datetime import datetime, timezone
+
+from algorithms import ALGORITHM_VERSION
+from benchmarks.suite import GROUPS, compare_results, run_suite
+
+
+def run(args) -> int:
+    def progress(name, result):
+        print(f"{name:<48} {result['median_us']:>12.1f} us/chunk", file=sys.stderr)
+    
+    results = run_suite(
+        size=args.size,
+        repeat=args.repeat,
+        seed=args.seed,
+        groups=args.group or tuple(GROUPS),
+        match=args.match,
+        progress=progress
+    )
+    report = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "algorithm_version": ALGORITHM_VERSION,
+            "size": args.size,
+            "repeat": args.repeat,
+            "seed": args.seed
+        },
+        "results": results
+    }
+    
+    directory = os.path.dirname(args.output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    print(f"Wrote {len(results)} results to {args.output}", file=sys.stderr)
+    return 0
+
+
+def compare(args) -> int:
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(args.current, encoding="utf-8") as f:
+        current = json.load(f)
+    
+    for key in ("size", "seed"):
+        if baseline["meta"].get(key) != current["meta"].get(key):
+            print(f"warning: runs used different {key}", file=sys.stderr)
+    
+    rows = compare_results(baseline["results"], current["results"], args.threshold)
+    print(f"{'benchmark':<48} {'baseline us':>12} {'current us':>12} {'change':>8}")
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(
+            f"{row['name']:<48} {row['baseline_us']:>12.1f} {row['current_us']:>12.1f} "
+            f"{row['change']:>+8.1%}{flag}"
+        )
+    
+    regressions = [row for row in rows if row["regression"]]
+    print(f"{len(regressions)} of {len(rows)} benchmarks regressed by more than {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Chunk optimizer benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    run_parser = commands.add_parser("run", help="run the suite and save a JSON report")
+    run_parser.add_argument("--output", default="benchmarks/results/latest.json")
+    run_parser.add_argument("--size", type=int, default=50, help="chunks per corpus")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--seed", type=int, default=42)
+    run_parser.add_argument("--group", action="append", choices=tuple(GROUPS), help="repeatable; default all")
+    run_parser.add_argument("--match", help="only benchmarks whose name contains this")
+    run_parser.set_defaults(handler=run)
+    
+    compare_parser = commands.add_parser("compare", help="compare a report against a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current", nargs="?", default="benchmarks/results/latest.json")
+    compare_parser.add_argument("--threshold", type=float, default=0.1, help="allowed slowdown, 0.1 = 10%%")
+    compare_parser.set_defaults(handler=compare)
+    
+    args = parser.parse_args()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""Deterministic synthetic corpora for benchmarks"""
+import random
+from typing import Callable, Dict, List
+
+LATIN_WORDS = (
+    "the server restarted after the disk filled up however the cluster recovered "
+    "quickly therefore no data was lost and the operator cleaned old log files "
+    "before the next deployment window while monitoring stayed green"
+).split()
+
+CJK_WORDS = "服务器 重启 磁盘 已满 日志 清理 集群 恢复 因此 数据 没有 丢失 运维 人员 检查 配置".split()
+
+DOMAIN_WORDS = {
+    "operations": (
+        "kubernetes pod node restart rollback deployment alert latency cpu memory disk "
+        "incident runbook oncall escalation nginx timeout retry cluster upgrade backup"
+    ).split(),
+    "ecommerce": (
+        "product price discount cart checkout order shipping return refund coupon "
+        "inventory sku size color customer review rating delivery warehouse promotion"
+    ).split(),
+    "medical": (
+        "patient diagnosis symptom dosage treatment clinical trial adverse event "
+        "prescription contraindication physician hospital chronic acute therapy mg daily"
+    ).split()
+}
+
+DOMAINS = tuple(DOMAIN_WORDS)
+
+
+def _sentence(rng: random.Random, words: List[str], length: int) -> str:
+    return " ".join(rng.choice(words) for _ in range(length)).capitalize() + "."
+
+
+def _cjk_sentence(rng: random.Random, length: int) -> str:
+    return "".join(rng.choice(CJK_WORDS) for _ in range(length)) + "。"
+
+
+def _paragraph(rng: random.Random, words: List[str], total: int, cjk_ratio: float = 0.0) -> str:
+    sentences = []
+    while total > 0:
+        length = rng.randint(6, 20)
+        if rng.random() < cjk_ratio:
+            sentences.append(_cjk_sentence(rng, length))
+        else:
+            sentences.append(_sentence(rng, words, length))
+        total -= length
+    return " ".join(sentences)
+
+
+def short_chunk(rng: random.Random) -> str:
+    return _paragraph(rng, LATIN_WORDS, rng.randint(10, 40))
+
+
+def long_chunk(rng: random.Random) -> str:
+    return _paragraph(rng, LATIN_WORDS, rng.randint(600, 1500))
+
+
+def repetitive_chunk(rng: random.Random) -> str:
+    """A few sentences repeated many times"""
+    sentences = [_sentence(rng, LATIN_WORDS, rng.randint(6, 14)) for _ in range(rng.randint(2, 4))]
+    return " ".join(rng.choice(sentences) for _ in range(rng.randint(20, 60)))
+
+
+def mixed_chunk(rng: random.Random) -> str:
+    """Half Chinese, half English sentences"""
+    return _paragraph(rng, LATIN_WORDS, rng.randint(80, 300), cjk_ratio=0.5)
+
+
+def chinese_chunk(rng: random.Random) -> str:
+    return _paragraph(rng, LATIN_WORDS, rng.randint(80, 300), cjk_ratio=1.0)
+
+
+def domain_chunk(domain: str) -> Callable[[random.Random], str]:
+    def generate(rng: random.Random) -> str:
+        return _paragraph(rng, DOMAIN_WORDS[domain] + LATIN_WORDS, rng.randint(60, 250))
+    return generate
+
+
+GENERATORS: Dict[str, Callable[[random.Random], str]] = {
+    "short": short_chunk,
+    "long": long_chunk,
+    "repetitive": repetitive_chunk,
+    "mixed": mixed_chunk,
+    "chinese": chinese_chunk,
+    **{domain: domain_chunk(domain) for domain in DOMAINS}
+}
+
+KINDS = tuple(GENERATORS)
+
+
+def make_corpus(kind: str, size: int, seed: int = 42) -> List[str]:
+    """``size`` chunks of one kind; the same seed always yields the same corpus"""
+    rng = random.Random(f"{kind}:{seed}")
+    return [GENERATORS[kind](rng) for _ in range(size)]
@@ -0,0 +1,66 @@
+"""
+Segmentation throughput benchmark
+
+Measures TextProfile tokenization and full chunk scoring on the Latin, CJK
+and mixed-language synthetic corpora, so changes to the segmentation layer can be
+checked for throughput regressions.
+
+Usage:
+    PYTHONPATH=src python -m benchmarks.segmentation [--chunks 2000] [--repeat 3]
+"""
+import argparse
+import time
+from typing import Callable, List
+
+from algorithms.quality_analyzer import QualityAnalyzer
+from algorithms.redundancy_detector import RedundancyDetector
+from algorithms.similarity_calculator import SimilarityCalculator
+from algorithms.size_analyzer import SizeAnalyzer
+from algorithms.text_profile import TextProfile
+from benchmarks.corpus import make_corpus
+
+CORPORA = ("short", "long", "repetitive", "mixed", "chinese")
+
+
+def measure(fn: Callable[[str], object], corpus: List[str], repeat: int) -> float:
+    """Best-of-``repeat`` throughput in characters per second"""
+    chars = sum(len(chunk) for chunk in corpus)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for chunk in corpus:
+            fn(chunk)
+        best = min(best, time.perf_counter() - start)
+    return chars / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    
+    quality = QualityAnalyzer()
+    redundancy = RedundancyDetector()
+    size = SizeAnalyzer()
+    similarity = SimilarityCalculator()
+    
+    def score(chunk: str):
+        profile = TextProfile.from_text(chunk)
+        return (
+            quality.analyze(profile),
+            redundancy.analyze(profile),
+            size.analyze(profile),
+            similarity.analyze(profile)
+        )
+    
+    print(f"{'corpus':<10} {'segment Mchar/s':>16} {'score Mchar/s':>14}")
+    for name in CORPORA:
+        corpus = make_corpus(name, args.chunks)
+        segment_rate = measure(TextProfile.from_text, corpus, args.repeat)
+        score_rate = measure(score, corpus, args.repeat)
+        print(f"{name:<10} {segment_rate / 1e6:>16.2f} {score_rate / 1e6:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
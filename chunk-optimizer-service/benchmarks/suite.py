@@ -0,0 +1,201 @@
+"""Benchmark definitions and the timing harness"""
+import contextlib
+import statistics
+import tempfile
+import time
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+from algorithms.text_profile import TextProfile
+from benchmarks.corpus import DOMAINS, make_corpus
+from config.settings import settings
+
+# Corpora the analyzers are timed on, beside the per-domain corpora
+ANALYZER_CORPORA = ("short", "long", "repetitive", "mixed", "chinese")
+
+
+class Benchmark(NamedTuple):
+    """One timed operation: ``run`` processes ``items`` chunks per call"""
+    name: str
+    run: Callable[[], object]
+    items: int
+    # Called before every repetition, e.g. to drop caches for cold timings
+    setup: Optional[Callable[[], object]] = None
+
+
+def time_benchmark(benchmark: Benchmark, repeat: int) -> Dict[str, float]:
+    """Per-chunk timings in microseconds over ``repeat`` runs after one warm-up"""
+    samples = []
+    for run in range(repeat + 1):
+        if benchmark.setup is not None:
+            benchmark.setup()
+        start = time.perf_counter()
+        benchmark.run()
+        elapsed = time.perf_counter() - start
+        if run:
+            samples.append(elapsed * 1e6 / benchmark.items)
+    
+    return {
+        "median_us": statistics.median(samples),
+        "min_us": min(samples),
+        "mean_us": statistics.fmean(samples),
+        "items": benchmark.items,
+        "repeat": repeat
+    }
+
+
+def _loop(fn: Callable, inputs: Sequence) -> Callable[[], None]:
+    def run():
+        for value in inputs:
+            fn(value)
+    return run
+
+
+def profile_benchmarks(size: int, seed: int, stack: contextlib.ExitStack) -> Iterator[Benchmark]:
+    """Tokenization into a TextProfile"""
+    for kind in ANALYZER_CORPORA:
+        corpus = make_corpus(kind, size, seed)
+        yield Benchmark(f"profile/{kind}", _loop(TextProfile.from_text, corpus), size)
+
+
+def analyzer_benchmarks(size: int, seed: int, stack: contextlib.ExitStack) -> Iterator[Benchmark]:
+    """Each analyzer on pre-tokenized chunks"""
+    from core.pipeline import get_domain_pipeline
+    
+    for domain, kinds in (("default", ANALYZER_CORPORA), *((domain, (domain,)) for domain in DOMAINS)):
+        pipeline = get_domain_pipeline(domain)
+        analyzers = {
+            "quality": pipeline.quality_analyzer,
+            "redundancy": pipeline.redundancy_detector,
+            "size": pipeline.size_analyzer,
+            "similarity": pipeline.similarity_calculator
+        }
+        for kind in kinds:
+            profiles = [TextProfile.from_text(chunk) for chunk in make_corpus(kind, size, seed)]
+            for name, analyzer in analyzers.items():
+                yield Benchmark(f"analyzer.{name}/{domain}/{kind}", _loop(analyzer.analyze, profiles), size)
+
+
+def metrics_benchmarks(size: int, seed: int, stack: contextlib.ExitStack) -> Iterator[Benchmark]:
+    """Optimizer._calculate_metrics with a cold and a warm metrics cache"""
+    from core.optimizer import Optimizer
+    from core.pipeline import get_domain_pipeline
+    
+    optimizer = Optimizer()
+    stack.callback(optimizer.shutdown)
+    
+    for domain in ("default", *DOMAINS):
+        pipeline = get_domain_pipeline(domain)
+        corpus = make_corpus(domain if domain in DOMAINS else "mixed", size, seed)
+        chunks = [(f"chunk-{idx}", content) for idx, content in enumerate(corpus)]
+        
+        def run(chunks=chunks, pipeline=pipeline):
+            for chunk_id, content in chunks:
+                optimizer._calculate_metrics(chunk_id, content, pipeline)
+        
+        yield Benchmark(f"metrics.cold/{domain}", run, size, setup=optimizer.metrics_cache.clear)
+        yield Benchmark(f"metrics.warm/{domain}", run, size)
+
+
+def endpoint_benchmarks(size: int, seed: int, stack: contextlib.ExitStack) -> Iterator[Benchmark]:
+    """REST endpoints end to end through the ASGI app
+    
+    Document and batch analysis runs in-process (``analysis_workers = 0``):
+    worker processes keep metrics caches the benchmark cannot clear, which
+    would make every cold repetition after the first warm.
+    """
+    # Keep the benchmark's similarity index out of the service's data directory
+    settings.similarity_index_dir = stack.enter_context(tempfile.TemporaryDirectory())
+    settings.log_level = "WARNING"
+    workers = settings.analysis_workers
+    settings.analysis_workers = 0
+    stack.callback(setattr, settings, "analysis_workers", workers)
+    
+    from fastapi.testclient import TestClient
+    from api.rest.main import app, optimizer
+    from core import optimizer as optimizer_module
+    
+    client = stack.enter_context(TestClient(app))
+    
+    def clear_caches():
+        optimizer.metrics_cache.clear()
+        optimizer.result_cache.local.clear()
+        # The in-process worker analyzing document and batch shards
+        if optimizer_module._worker_optimizer is not None:
+            optimizer_module._worker_optimizer.metrics_cache.clear()
+    
+    def post(path: str, body: dict):
+        response = client.post(path, json=body)
+        response.raise_for_status()
+    
+    for domain in ("default", *DOMAINS):
+        corpus = make_corpus(domain if domain in DOMAINS else "mixed", size, seed)
+        chunks = [{"chunk_id": f"chunk-{idx}", "content": content} for idx, content in enumerate(corpus)]
+        requests = {
+            "chunk": [("/api/v1/chunks/analyze", {**chunk, "domain": domain}) for chunk in chunks],
+            "document": [(
+                "/api/v1/documents/analyze",
+                {"document_id": f"doc-{domain}", "chunks": chunks, "domain": domain}
+            )],
+            "batch": [(
+                "/api/v1/batch/analyze",
+                {"batch_id": f"batch-{domain}", "items": chunks, "domain": domain}
+            )]
+        }
+        for endpoint, calls in requests.items():
+            run = _loop(lambda call: post(*call), calls)
+            yield Benchmark(f"endpoint.{endpoint}.cold/{domain}", run, size, setup=clear_caches)
+            yield Benchmark(f"endpoint.{endpoint}.warm/{domain}", run, size)
+
+
+GROUPS: Dict[str, Callable[[int, int, contextlib.ExitStack], Iterator[Benchmark]]] = {
+    "profile": profile_benchmarks,
+    "analyzer": analyzer_benchmarks,
+    "metrics": metrics_benchmarks,
+    "endpoint": endpoint_benchmarks
+}
+
+
+def run_suite(
+    size: int,
+    repeat: int,
+    seed: int = 42,
+    groups: Sequence[str] = tuple(GROUPS),
+    match: Optional[str] = None,
+    progress: Optional[Callable[[str, Dict[str, float]], None]] = None
+) -> Dict[str, Dict[str, float]]:
+    """Time every benchmark in ``groups`` whose name contains ``match``"""
+    results = {}
+    with contextlib.ExitStack() as stack:
+        for group in groups:
+            for benchmark in GROUPS[group](size, seed, stack):
+                if match and match not in benchmark.name:
+                    continue
+                results[benchmark.name] = time_benchmark(benchmark, repeat)
+                if progress is not None:
+                    progress(benchmark.name, results[benchmark.name])
+    return results
+
+
+def compare_results(
+    baseline: Dict[str, Dict[str, float]],
+    current: Dict[str, Dict[str, float]],
+    threshold: float
+) -> List[Dict[str, object]]:
+    """Median change of every benchmark present in both runs
+    
+    A benchmark regresses when its median per-chunk time grew by more than
+    ``threshold`` (a fraction, so 0.1 is 10%).
+    """
+    rows = []
+    for name in sorted(set(baseline) & set(current)):
+        before = baseline[name]["median_us"]
+        after = current[name]["median_us"]
+        change = (after - before) / before if before else 0.0
+        rows.append({
+            "name": name,
+            "baseline_us": before,
+            "current_us": after,
+            "change": change,
+            "regression": change > threshold
+        })
+    return rows
@@ -1 +1,5 @@
 """Algorithms module"""
+
+# Bump whenever a change to the algorithms alters scores, so shared
+# caches never serve results computed by an older version
+ALGORITHM_VERSION = "3"
@@ -0,0 +1,104 @@
+"""Compiled multi-pattern lexicons loadable per language and domain"""
+import hashlib
+import os
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Built-in lexicons: lexicons/<language>/<name>.txt, with domain additions in
+# lexicons/domains/<domain>/<language>/<name>.txt
+LEXICON_DIR = os.path.join(os.path.dirname(__file__), "lexicons")
+
+DEFAULT_LANGUAGES = ("en", "zh")
+
+
+class Lexicon:
+    """A set of terms compiled once for exact lookup and substring search
+    
+    The terms are inserted into a character trie that is compiled to one
+    regular expression, so "any hit?" is a single pass of the regex engine over
+    the text however many terms the lexicon holds.
+    """
+    
+    def __init__(self, terms: Iterable[str]):
+        self.terms = frozenset(term for term in terms if term)
+        self.fingerprint = hashlib.blake2b(
+            "\n".join(sorted(self.terms)).encode("utf-8"),
+            digest_size=8
+        ).digest()
+        
+        self._goto: List[Dict[str, int]] = [{}]
+        self._terminal = set()
+        for term in self.terms:
+            self._insert(term)
+        self._pattern = re.compile(self._trie_pattern(0)) if self.terms else None
+    
+    def _insert(self, term: str):
+        state = 0
+        for ch in term:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+            state = next_state
+        self._terminal.add(state)
+    
+    def _trie_pattern(self, state: int) -> str:
+        """Regular expression matching the shortest term below a trie state"""
+        if state in self._terminal:
+            return ""
+        branches = [
+            re.escape(ch) + self._trie_pattern(next_state)
+            for ch, next_state in sorted(self._goto[state].items())
+        ]
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    
+    def __contains__(self, term: str) -> bool:
+        return term in self.terms
+    
+    def __len__(self) -> int:
+        return len(self.terms)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.terms)
+    
+    def search(self, text: str) -> Optional[str]:
+        """Return a term occurring in text, or None"""
+        if self._pattern is None:
+            return None
+        match = self._pattern.search(text)
+        return match.group() if match else None
+
+
+def _read_terms(path: str) -> List[str]:
+    """One term per line; blank lines and # comments are ignored"""
+    with open(path, encoding="utf-8") as f:
+        return [
+            line.strip().lower()
+            for line in f
+            if line.strip() and not line.lstrip().startswith("#")
+        ]
+
+
+@lru_cache(maxsize=256)
+def load_lexicon(
+    name: str,
+    languages: Tuple[str, ...] = DEFAULT_LANGUAGES,
+    domain: Optional[str] = None
+) -> Lexicon:
+    """Load a lexicon for the given languages, extended with the domain's own terms"""
+    directories = [os.path.join(LEXICON_DIR, language) for language in languages]
+    if domain:
+        directories += [
+            os.path.join(LEXICON_DIR, "domains", domain, language)
+            for language in languages
+        ]
+    
+    terms: List[str] = []
+    for directory in directories:
+        path = os.path.join(directory, f"{name}.txt")
+        if os.path.exists(path):
+            terms.extend(_read_terms(path))
+    
+    return Lexicon(terms)
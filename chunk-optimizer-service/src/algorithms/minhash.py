@@ -0,0 +1,90 @@
+"""MinHash signatures and LSH banding for near-duplicate detection"""
+import hashlib
+import struct
+from typing import Iterable, List, Tuple
+
+
+class MinHasher:
+    """One-permutation MinHash with rotation densification
+    
+    Every term is hashed once and assigned to one of ``num_perm`` bins, so a
+    signature costs O(terms + num_perm) instead of O(terms * num_perm).
+    """
+    
+    def __init__(self, num_perm: int = 128, bands: int = 16):
+        if num_perm & (num_perm - 1) or num_perm > 256:
+            raise ValueError("num_perm must be a power of two no larger than 256")
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        
+        self._bin_bits = num_perm.bit_length() - 1
+        self._bin_mask = num_perm - 1
+        self._value_bits = 64 - self._bin_bits
+        self._empty = 1 << 64
+        self._band_struct = struct.Struct(f"<H{self.rows}Q")
+    
+    @staticmethod
+    def _hash(term: str) -> int:
+        """Stable 64-bit hash of a term"""
+        return int.from_bytes(
+            hashlib.blake2b(term.encode("utf-8"), digest_size=8).digest(),
+            "little"
+        )
+    
+    def signature(self, terms: Iterable[str]) -> Tuple[int, ...]:
+        """Compute the MinHash signature of a set of terms, empty for no terms"""
+        bins = [self._empty] * self.num_perm
+        
+        for term in set(terms):
+            h = self._hash(term)
+            idx = h & self._bin_mask
+            value = h >> self._bin_bits
+            if value < bins[idx]:
+                bins[idx] = value
+        
+        filled = [i for i, value in enumerate(bins) if value != self._empty]
+        if not filled:
+            return ()
+        
+        # Densify: an empty bin borrows the next filled bin to its right,
+        # tagged with the distance so borrowed values only collide with
+        # values borrowed over the same distance
+        if len(filled) < self.num_perm:
+            signature = list(bins)
+            for i in range(self.num_perm):
+                if bins[i] != self._empty:
+                    continue
+                distance = 1
+                while bins[(i + distance) & self._bin_mask] == self._empty:
+                    distance += 1
+                borrowed = bins[(i + distance) & self._bin_mask]
+                signature[i] = (distance << self._value_bits) | borrowed
+            bins = signature
+        
+        return tuple(bins)
+    
+    def band_keys(self, signature: Tuple[int, ...]) -> List[int]:
+        """Hash each LSH band of a signature into a signed 64-bit bucket key"""
+        keys = []
+        for band in range(self.bands):
+            start = band * self.rows
+            packed = self._band_struct.pack(band, *signature[start:start + self.rows])
+            keys.append(int.from_bytes(
+                hashlib.blake2b(packed, digest_size=8).digest(),
+                "little",
+                signed=True
+            ))
+        return keys
+    
+    @staticmethod
+    def estimate_similarity(signature1: Tuple[int, ...], signature2: Tuple[int, ...]) -> float:
+        """Estimate Jaccard similarity from two signatures"""
+        if not signature1 or len(signature1) != len(signature2):
+            return 0.0
+        
+        matches = sum(1 for a, b in zip(signature1, signature2) if a == b)
+        return matches / len(signature1)
@@ -1,7 +1,8 @@
 """Quality analyzer for chunks"""
-import re
-from typing import List, Optional
+from typing import List, Optional, Union
 from config.domain_config import DomainConfig
+from algorithms.lexicon import load_lexicon
+from algorithms.text_profile import TextProfile
 
 
 class QualityAnalyzer:
@@ -15,34 +16,26 @@ class QualityAnalyzer:
         self.max_length = config.max_length
         self.optimal_length = config.optimal_length
         
-        # Pre-compile regex patterns for performance
-        self.sentence_pattern = re.compile(r'[.!?]+')
-        self.word_pattern = re.compile(r'\b\w+\b')
-        self.transition_words = [
-            'however', 'therefore', 'consequently', 'furthermore',
-            'moreover', 'in addition', 'meanwhile', 'otherwise',
-            'thus', 'hence', 'accordingly', 'nevertheless',
-            '但是', '因此', '所以', '此外', '而且', '同时', '否则',
-            '于是', '从而', '然而', '不过'
-        ]
+        self.transition_words = load_lexicon("transition_words", config.languages, config.lexicon)
     
-    def analyze(self, content: str) -> float:
+    def analyze(self, content: Union[str, TextProfile]) -> float:
         """Analyze chunk quality and return score (0-1)"""
-        if not content or not content.strip():
+        profile = TextProfile.coerce(content)
+        if profile.is_blank:
             return 0.0
         
         scores = []
         
-        scores.append(self._analyze_length(content))
-        scores.append(self._analyze_sentence_structure(content))
-        scores.append(self._analyze_vocabulary(content))
-        scores.append(self._analyze_coherence(content))
+        scores.append(self._analyze_length(profile))
+        scores.append(self._analyze_sentence_structure(profile))
+        scores.append(self._analyze_vocabulary(profile))
+        scores.append(self._analyze_coherence(profile))
         
         return sum(scores) / len(scores)
     
-    def _analyze_length(self, content: str) -> float:
+    def _analyze_length(self, profile: TextProfile) -> float:
         """Analyze content length"""
-        length = len(content)
+        length = profile.length
         
         if length < self.min_length:
             return length / self.min_length
@@ -53,15 +46,14 @@ class QualityAnalyzer:
         else:
             return 0.8
     
-    def _analyze_sentence_structure(self, content: str) -> float:
+    def _analyze_sentence_structure(self, profile: TextProfile) -> float:
         """Analyze sentence structure"""
-        sentences = self.sentence_pattern.split(content)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        sentences = profile.sentences
         
         if not sentences:
             return 0.0
         
-        avg_sentence_length = sum(len(s.split()) for s in sentences) / len(sentences)
+        avg_sentence_length = profile.sentence_word_count / len(sentences)
         
         if 10 <= avg_sentence_length <= 25:
             return 1.0
@@ -70,15 +62,14 @@ class QualityAnalyzer:
         else:
             return 0.5
     
-    def _analyze_vocabulary(self, content: str) -> float:
+    def _analyze_vocabulary(self, profile: TextProfile) -> float:
         """Analyze vocabulary diversity"""
-        words = self.word_pattern.findall(content.lower())
+        words = profile.words
         
         if not words:
             return 0.0
         
-        unique_words = set(words)
-        diversity = len(unique_words) / len(words)
+        diversity = len(profile.word_counts) / len(words)
         
         if diversity >= 0.6:
             return 1.0
@@ -87,22 +78,24 @@ class QualityAnalyzer:
         else:
             return 0.5
     
-    def _analyze_coherence(self, content: str) -> float:
+    def _analyze_coherence(self, profile: TextProfile) -> float:
         """Analyze text coherence"""
-        sentences = self.sentence_pattern.split(content)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        sentences = profile.lowered_sentences
         
         if len(sentences) < 2:
             return 0.8
         
         coherence_score = 0.8
         
-        has_transitions = any(
-            any(word in sentence.lower() for word in self.transition_words)
-            for sentence in sentences
-        )
-        
-        if has_transitions:
+        if self.has_transitions(profile):
             coherence_score += 0.2
         
         return min(1.0, coherence_score)
+    
+    def has_transitions(self, profile: TextProfile) -> bool:
+        """Whether any sentence contains a transition word
+        
+        Transition words never contain sentence terminators, so one scan of the
+        whole lowered text finds exactly the hits a per-sentence scan would.
+        """
+        return self.transition_words.search(profile.lowered) is not None
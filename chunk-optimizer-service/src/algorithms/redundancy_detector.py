@@ -1,7 +1,9 @@
 """Redundancy detector for chunks"""
-import re
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Union
 from collections import Counter
+from algorithms.segmentation import CJKSegmenter
+from algorithms.suffix_array import longest_repeats
+from algorithms.text_profile import TextProfile
 
 
 class RedundancyDetector:
@@ -11,56 +13,99 @@ class RedundancyDetector:
         self.min_phrase_length = 3
         self.max_phrase_length = 8
         self.repetition_threshold = 2
-        
-        # Pre-compile regex pattern for performance
-        self.word_pattern = re.compile(r'\b\w+\b')
-        self.sentence_pattern = re.compile(r'[.!?]+')
     
-    def analyze(self, content: str) -> float:
+    def analyze(self, content: Union[str, TextProfile]) -> float:
         """Analyze redundancy and return score (0-1)"""
-        if not content or not content.strip():
+        profile = TextProfile.coerce(content)
+        if profile.is_blank:
             return 0.0
         
         scores = []
         
-        scores.append(self._detect_phrase_repetition(content))
-        scores.append(self._detect_sentence_repetition(content))
-        scores.append(self._detect_word_repetition(content))
+        scores.append(self._detect_phrase_repetition(profile))
+        scores.append(self._detect_sentence_repetition(profile))
+        scores.append(self._detect_word_repetition(profile))
         
         return sum(scores) / len(scores)
     
-    def _detect_phrase_repetition(self, content: str) -> float:
-        """Detect repeated phrases with optimized algorithm"""
-        words = self.word_pattern.findall(content.lower())
+    def find_repeated_spans(self, content: Union[str, TextProfile], limit: int = 3) -> List[Tuple[int, int, str]]:
+        """Return the longest repeated word spans as (offset, length, passage)
+        
+        Offsets and lengths count words, or characters for CJK text, whose
+        tokens are overlapping bigrams. The passage is the original text of the
+        first occurrence. One entry is reported per occurrence, so a passage
+        appearing twice yields two spans with the same text.
+        """
+        profile = TextProfile.coerce(content)
+        words = profile.words
+        if len(words) < self.min_phrase_length * 2:
+            return []
+        
+        word_spans = profile.word_spans
+        # Lowercasing can change the length of a few characters; offsets index the lowered text
+        text = profile.text if len(profile.text) == len(profile.lowered) else profile.lowered
+        in_characters = profile.script == CJKSegmenter.script
+        
+        suffixes, lcp = profile.word_suffixes
+        spans = []
+        for repeat in longest_repeats(suffixes, lcp, self.min_phrase_length, limit):
+            first = repeat.positions[0]
+            start, end = word_spans[first][0], word_spans[first + repeat.length - 1][1]
+            passage = text[start:end]
+            if in_characters:
+                spans.extend((word_spans[position][0], end - start, passage) for position in repeat.positions)
+            else:
+                spans.extend((position, repeat.length, passage) for position in repeat.positions)
+        return spans
+    
+    def phrase_repetition_counts(self, profile: TextProfile) -> Tuple[int, int]:
+        """Count (repeated occurrences, distinct phrases) over phrases of 3 to 8 words
+        
+        Occurrences of an n-gram are adjacent in suffix order, so for each length
+        every maximal run of LCP values >= length is one repeated n-gram seen
+        run + 1 times, and each LCP value >= length removes one distinct n-gram.
+        """
+        words = profile.words
         
         if len(words) < self.min_phrase_length * 2:
-            return 0.0
+            return 0, 0
         
-        # Optimized: Use sliding window to avoid O(n^3) complexity
-        phrase_counts = {}
+        _, lcp = profile.word_suffixes
         window_size = min(self.max_phrase_length, len(words))
         
-        for i in range(len(words)):
-            max_j = min(i + window_size + 1, len(words) + 1)
-            for j in range(i + self.min_phrase_length, max_j):
-                phrase = ' '.join(words[i:j])
-                phrase_counts[phrase] = phrase_counts.get(phrase, 0) + 1
-        
-        # Count repeated phrases
-        repeated_phrases = [p for p, c in phrase_counts.items() if c >= self.repetition_threshold]
+        distinct_phrases = 0
+        repeated_phrases = 0
+        for length in range(self.min_phrase_length, window_size + 1):
+            shared = 0
+            run = 0
+            for value in lcp:
+                if value >= length:
+                    shared += 1
+                    run += 1
+                    continue
+                if run + 1 >= self.repetition_threshold:
+                    repeated_phrases += run
+                run = 0
+            if run + 1 >= self.repetition_threshold:
+                repeated_phrases += run
+            distinct_phrases += len(words) - length + 1 - shared
+        
+        return repeated_phrases, distinct_phrases
+    
+    def _detect_phrase_repetition(self, profile: TextProfile) -> float:
+        """Detect repeated phrases using a suffix array over word ids"""
+        redundancy_score, distinct_phrases = self.phrase_repetition_counts(profile)
         
-        if not repeated_phrases:
+        if not redundancy_score:
             return 0.0
         
-        redundancy_score = sum(c - 1 for c in phrase_counts.values() if c >= self.repetition_threshold)
-        max_possible = len(phrase_counts) * 0.5
+        max_possible = distinct_phrases * 0.5
         
         return min(1.0, redundancy_score / max_possible) if max_possible > 0 else 0.0
     
-    def _detect_sentence_repetition(self, content: str) -> float:
+    def _detect_sentence_repetition(self, profile: TextProfile) -> float:
         """Detect repeated sentences"""
-        sentences = self.sentence_pattern.split(content)
-        sentences = [s.strip().lower() for s in sentences if s.strip()]
+        sentences = profile.lowered_sentences
         
         if len(sentences) < 2:
             return 0.0
@@ -76,16 +121,15 @@ class RedundancyDetector:
         
         return min(1.0, redundancy_score / max_possible)
     
-    def _detect_word_repetition(self, content: str) -> float:
+    def _detect_word_repetition(self, profile: TextProfile) -> float:
         """Detect excessive word repetition"""
-        words = self.word_pattern.findall(content.lower())
+        words = profile.words
         
         if not words:
             return 0.0
         
-        word_counts = Counter(words)
         total_words = len(words)
-        unique_words = len(word_counts)
+        unique_words = len(profile.word_counts)
         
         if total_words < 10:
             return 0.0
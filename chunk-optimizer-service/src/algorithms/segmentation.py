@@ -0,0 +1,101 @@
+"""Script-aware word and sentence segmentation"""
+import re
+from typing import Dict, List, Tuple
+
+
+# Latin fast path: regex word tokens and ASCII sentence terminators
+WORD_PATTERN = re.compile(r'\b\w+\b')
+SENTENCE_PATTERN = re.compile(r'[.!?]+')
+
+# Han ideographs and Japanese kana, which are written without spaces
+CJK_CHARS = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff"
+CJK_PATTERN = re.compile(f"[{CJK_CHARS}]")
+CJK_TOKEN_PATTERN = re.compile(rf"([{CJK_CHARS}]+)|([^\W{CJK_CHARS}]+)")
+CJK_SENTENCE_PATTERN = re.compile(r'[.!?。！？]+')
+
+
+class Segmenter:
+    """Split text into word tokens and sentences with the Latin regex fast path"""
+    
+    script = "latin"
+    sentence_pattern = SENTENCE_PATTERN
+    
+    def words(self, lowered: str) -> Tuple[str, ...]:
+        """Word tokens of lowercased text"""
+        return tuple(WORD_PATTERN.findall(lowered))
+    
+    def word_spans(self, lowered: str) -> Tuple[Tuple[int, int], ...]:
+        """Character (start, end) of each token ``words`` returns, in the same order"""
+        return tuple(match.span() for match in WORD_PATTERN.finditer(lowered))
+    
+    def sentences(self, text: str) -> Tuple[str, ...]:
+        """Stripped, non-empty sentences"""
+        return tuple(
+            s for s in (part.strip() for part in self.sentence_pattern.split(text)) if s
+        )
+    
+    def sentence_word_count(self, sentences: Tuple[str, ...]) -> int:
+        """Total number of words across sentences"""
+        return sum(len(s.split()) for s in sentences)
+
+
+class CJKSegmenter(Segmenter):
+    """Segment CJK runs into overlapping character bigrams
+    
+    Latin words inside mixed text are kept whole. A single CJK character
+    between non-CJK text is its own token.
+    """
+    
+    script = "cjk"
+    sentence_pattern = CJK_SENTENCE_PATTERN
+    
+    def words(self, lowered: str) -> Tuple[str, ...]:
+        tokens: List[str] = []
+        for run, word in CJK_TOKEN_PATTERN.findall(lowered):
+            if word:
+                tokens.append(word)
+            elif len(run) == 1:
+                tokens.append(run)
+            else:
+                tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        return tuple(tokens)
+    
+    def word_spans(self, lowered: str) -> Tuple[Tuple[int, int], ...]:
+        spans: List[Tuple[int, int]] = []
+        for match in CJK_TOKEN_PATTERN.finditer(lowered):
+            start, end = match.span()
+            if match.group(2) or end - start == 1:
+                spans.append((start, end))
+            else:
+                spans.extend((i, i + 2) for i in range(start, end - 1))
+        return tuple(spans)
+    
+    def sentence_word_count(self, sentences: Tuple[str, ...]) -> int:
+        # CJK sentences have no spaces, so count tokens instead
+        return sum(len(self.words(s)) for s in sentences)
+
+
+_segmenters: Dict[str, Segmenter] = {
+    Segmenter.script: Segmenter(),
+    CJKSegmenter.script: CJKSegmenter()
+}
+
+
+def register_segmenter(segmenter: Segmenter):
+    """Register or replace the segmenter used for ``segmenter.script``"""
+    _segmenters[segmenter.script] = segmenter
+
+
+def detect_script(text: str) -> str:
+    """Return "cjk" when text contains any CJK character, "latin" otherwise"""
+    return CJKSegmenter.script if CJK_PATTERN.search(text) else Segmenter.script
+
+
+def get_segmenter(text: str) -> Segmenter:
+    """Segmenter for the script detected in text"""
+    return _segmenters[detect_script(text)]
+
+
+def get_script_segmenter(script: str) -> Segmenter:
+    """Segmenter registered for a script name"""
+    return _segmenters[script]
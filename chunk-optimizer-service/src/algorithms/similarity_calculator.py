@@ -1,43 +1,40 @@
 """Similarity calculator for chunks"""
-import re
-from typing import List, Set, Optional
+from typing import List, Set, Optional, Tuple, Union
 from collections import Counter
+from config.domain_config import DomainConfig
+from algorithms.lexicon import load_lexicon
+from algorithms.text_profile import TextProfile
+from algorithms.minhash import MinHasher
 
 
 class SimilarityCalculator:
     """Calculate similarity between chunks"""
     
-    def __init__(self, config: Optional = None):
-        self.stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be',
-            'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
-            'would', 'should', 'could', 'may', 'might', 'must', 'can', 'this',
-            'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they',
-            '的', '了', '在', '是', '我', '有', '和', '就', '不', '人', '都', '一',
-            '一个', '上', '也', '很', '到', '说', '要', '去', '你', '会', '着', '没有',
-            '看', '好', '自己', '这'
-        }
+    def __init__(self, config: Optional[DomainConfig] = None, minhasher: Optional[MinHasher] = None):
+        if config is None:
+            config = DomainConfig()
         
-        # Pre-compile regex pattern for performance
-        self.word_pattern = re.compile(r'\b\w+\b')
+        self.stop_words = load_lexicon("stop_words", config.languages, config.lexicon)
+        
+        self.minhasher = minhasher or MinHasher()
     
-    def analyze(self, content: str) -> float:
+    def analyze(self, content: Union[str, TextProfile]) -> float:
         """Analyze similarity and return score (0-1)"""
-        if not content or not content.strip():
+        profile = TextProfile.coerce(content)
+        if profile.is_blank:
             return 0.0
         
-        words = self._extract_words(content)
+        words = self._extract_words(profile)
         
         if len(words) < 5:
             return 0.0
         
         return self._calculate_internal_similarity(words)
     
-    def _extract_words(self, content: str) -> List[str]:
+    def _extract_words(self, profile: TextProfile) -> List[str]:
         """Extract meaningful words from content"""
-        words = self.word_pattern.findall(content.lower())
-        return [w for w in words if w not in self.stop_words and len(w) > 1]
+        stop_words = self.stop_words.terms
+        return [w for w in profile.words if w not in stop_words and len(w) > 1]
     
     def _calculate_internal_similarity(self, words: List[str]) -> float:
         """Calculate internal similarity within content"""
@@ -58,10 +55,18 @@ class SimilarityCalculator:
         
         return min(1.0, similarity_score)
     
-    def calculate_similarity(self, content1: str, content2: str) -> float:
+    def signature(self, content: Union[str, TextProfile]) -> Tuple[int, ...]:
+        """Compute the MinHash signature of a chunk's meaningful words"""
+        return self.minhasher.signature(self._extract_words(TextProfile.coerce(content)))
+    
+    def calculate_similarity(
+        self,
+        content1: Union[str, TextProfile],
+        content2: Union[str, TextProfile]
+    ) -> float:
         """Calculate similarity between two chunks"""
-        words1 = set(self._extract_words(content1))
-        words2 = set(self._extract_words(content2))
+        words1 = set(self._extract_words(TextProfile.coerce(content1)))
+        words2 = set(self._extract_words(TextProfile.coerce(content2)))
         
         if not words1 or not words2:
             return 0.0
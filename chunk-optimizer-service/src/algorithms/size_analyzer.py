@@ -1,6 +1,7 @@
 """Size analyzer for chunks"""
-from typing import Optional
+from typing import Optional, Union
 from config.domain_config import DomainConfig
+from algorithms.text_profile import TextProfile
 
 
 class SizeAnalyzer:
@@ -15,12 +16,14 @@ class SizeAnalyzer:
         self.optimal_min = config.optimal_length[0]
         self.optimal_max = config.optimal_length[1]
     
-    def analyze(self, content: str) -> float:
+    def analyze(self, content: Union[str, TextProfile]) -> float:
         """Analyze chunk size and return score (0-1)"""
-        if not content or not content.strip():
+        # Size only needs the raw text, so plain strings are not tokenized
+        text = content.text if isinstance(content, TextProfile) else content
+        if not text or not text.strip():
             return 0.0
         
-        length = len(content)
+        length = len(text)
         
         if length < self.min_length:
             return length / self.min_length
@@ -0,0 +1,95 @@
+"""Suffix and LCP arrays over integer token sequences"""
+from typing import List, NamedTuple, Sequence, Tuple
+
+
+class RepeatedSpan(NamedTuple):
+    """A token span occurring more than once"""
+    length: int
+    positions: Tuple[int, ...]
+
+
+def build_suffix_array(tokens: Sequence[int]) -> List[int]:
+    """Sort suffix start positions by prefix doubling
+    
+    Each round sorts by (rank, rank of the suffix ``k`` tokens later) and stops
+    as soon as all ranks are distinct, which for natural text happens after a
+    few rounds.
+    """
+    n = len(tokens)
+    if n == 0:
+        return []
+    
+    suffixes = list(range(n))
+    rank = list(tokens)
+    k = 1
+    
+    while True:
+        keys = [(rank[i], rank[i + k] if i + k < n else -1) for i in range(n)]
+        suffixes.sort(key=keys.__getitem__)
+        
+        new_rank = [0] * n
+        for idx in range(1, n):
+            previous, current = suffixes[idx - 1], suffixes[idx]
+            new_rank[current] = new_rank[previous] + (keys[current] != keys[previous])
+        rank = new_rank
+        
+        if rank[suffixes[-1]] == n - 1 or k >= n:
+            return suffixes
+        k <<= 1
+
+
+def build_lcp_array(tokens: Sequence[int], suffixes: Sequence[int]) -> List[int]:
+    """Kasai's algorithm: ``lcp[i]`` is the common prefix of suffixes ``i - 1`` and ``i``"""
+    n = len(tokens)
+    rank = [0] * n
+    for idx, start in enumerate(suffixes):
+        rank[start] = idx
+    
+    lcp = [0] * n
+    h = 0
+    for i in range(n):
+        if rank[i] == 0:
+            h = 0
+            continue
+        j = suffixes[rank[i] - 1]
+        while i + h < n and j + h < n and tokens[i + h] == tokens[j + h]:
+            h += 1
+        lcp[rank[i]] = h
+        if h:
+            h -= 1
+    
+    return lcp
+
+
+def longest_repeats(
+    suffixes: Sequence[int],
+    lcp: Sequence[int],
+    min_length: int = 1,
+    limit: int = 3
+) -> List[RepeatedSpan]:
+    """Return the longest repeated spans, skipping spans nested in ones already found"""
+    found: List[RepeatedSpan] = []
+    covered: List[Tuple[int, int]] = []
+    
+    for idx in sorted(range(1, len(lcp)), key=lcp.__getitem__, reverse=True):
+        length = lcp[idx]
+        if length < min_length or len(found) >= limit:
+            break
+        
+        start = suffixes[idx]
+        if any(lo <= start and start + length <= hi for lo, hi in covered):
+            continue
+        
+        # Collect every suffix sharing this prefix: the run of lcp >= length around idx
+        first = idx
+        while first > 1 and lcp[first - 1] >= length:
+            first -= 1
+        last = idx
+        while last + 1 < len(lcp) and lcp[last + 1] >= length:
+            last += 1
+        
+        positions = tuple(sorted(suffixes[first - 1:last + 1]))
+        found.append(RepeatedSpan(length, positions))
+        covered.extend((pos, pos + length) for pos in positions)
+    
+    return found
@@ -0,0 +1,73 @@
+"""Shared text profile for chunk analysis"""
+from collections import Counter
+from dataclasses import dataclass
+from functools import cached_property
+from types import MappingProxyType
+from typing import List, Mapping, Tuple, Union
+
+from algorithms.segmentation import get_script_segmenter, get_segmenter
+from algorithms.suffix_array import build_lcp_array, build_suffix_array
+
+
+@dataclass(frozen=True)
+class TextProfile:
+    """Immutable tokenization result of a chunk, built once and shared by all analyzers"""
+    
+    text: str
+    lowered: str
+    words: Tuple[str, ...]
+    word_counts: Mapping[str, int]
+    sentences: Tuple[str, ...]
+    lowered_sentences: Tuple[str, ...]
+    sentence_word_count: int
+    script: str
+    
+    @classmethod
+    def from_text(cls, content: str) -> "TextProfile":
+        """Tokenize content with the segmenter for its script"""
+        content = content or ""
+        segmenter = get_segmenter(content)
+        lowered = content.lower()
+        words = segmenter.words(lowered)
+        sentences = segmenter.sentences(content)
+        
+        return cls(
+            text=content,
+            lowered=lowered,
+            words=words,
+            word_counts=MappingProxyType(Counter(words)),
+            sentences=sentences,
+            lowered_sentences=tuple(s.lower() for s in sentences),
+            sentence_word_count=segmenter.sentence_word_count(sentences),
+            script=segmenter.script
+        )
+    
+    @classmethod
+    def coerce(cls, content: Union[str, "TextProfile"]) -> "TextProfile":
+        """Return content as a profile, tokenizing raw strings"""
+        if isinstance(content, TextProfile):
+            return content
+        return cls.from_text(content)
+    
+    @property
+    def is_blank(self) -> bool:
+        """Whether the chunk has no non-whitespace content"""
+        return not self.text or not self.text.strip()
+    
+    @property
+    def length(self) -> int:
+        """Content length in characters"""
+        return len(self.text)
+    
+    @cached_property
+    def word_spans(self) -> Tuple[Tuple[int, int], ...]:
+        """Character (start, end) of each word in the lowercased text, built on first use"""
+        return get_script_segmenter(self.script).word_spans(self.lowered)
+    
+    @cached_property
+    def word_suffixes(self) -> Tuple[List[int], List[int]]:
+        """Suffix and LCP arrays over the words mapped to integer ids, built on first use"""
+        vocabulary = {}
+        tokens = [vocabulary.setdefault(word, len(vocabulary)) for word in self.words]
+        suffixes = build_suffix_array(tokens)
+        return suffixes, build_lcp_array(tokens, suffixes)
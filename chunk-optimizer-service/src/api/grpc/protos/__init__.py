@@ -0,0 +1,6 @@
+"""Protocol buffer definitions for the gRPC API
+
+Regenerate the *_pb2 modules from chunk-optimizer-service/src with:
+    
+    python -m grpc_tools.protoc -I . --python_out=. --grpc_python_out=. api/grpc/protos/chunk_optimizer.proto
+"""
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: api/grpc/protos/chunk_optimizer.proto
+# Protobuf Python Version: 4.25.0
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n%api/grpc/protos/chunk_optimizer.proto\x12\x12\x63hunk_optimizer.v1\x1a\x1fgoogle/protobuf/timestamp.proto\"\x8b\x02\n\x0f\x41nalysisOptions\x12\x1a\n\rcheck_quality\x18\x01 \x01(\x08H\x00\x88\x01\x01\x12\x1d\n\x10\x63heck_redundancy\x18\x02 \x01(\x08H\x01\x88\x01\x01\x12\x17\n\ncheck_size\x18\x03 \x01(\x08H\x02\x88\x01\x01\x12\x1d\n\x10\x63heck_similarity\x18\x04 \x01(\x08H\x03\x88\x01\x01\x12!\n\x14similarity_threshold\x18\x05 \x01(\x01H\x04\x88\x01\x01\x42\x10\n\x0e_check_qualityB\x13\n\x11_check_redundancyB\r\n\x0b_check_sizeB\x13\n\x11_check_similarityB\x17\n\x15_similarity_threshold\"\xf8\x01\n\x13\x41nalyzeChunkRequest\x12\x10\n\x08\x63hunk_id\x18\x01 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\t\x12G\n\x08metadata\x18\x03 \x03(\x0b\x32\x35.chunk_optimizer.v1.AnalyzeChunkRequest.MetadataEntry\x12\x0e\n\x06\x64omain\x18\x04 \x01(\t\x12\x34\n\x07options\x18\x05 \x01(\x0b\x32#.chunk_optimizer.v1.AnalysisOptions\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xa1\x02\n\x07Metrics\x12\x10\n\x08\x63hunk_id\x18\x01 \x01(\t\x12\x1a\n\rquality_score\x18\x02 \x01(\x01H\x00\x88\x01\x01\x12\x1d\n\x10redundancy_score\x18\x03 \x01(\x01H\x01\x88\x01\x01\x12\x17\n\nsize_score\x18\x04 \x01(\x01H\x02\x88\x01\x01\x12\x1d\n\x10similarity_score\x18\x05 \x01(\x01H\x03\x88\x01\x01\x12\x1a\n\roverall_score\x18\x06 \x01(\x01H\x04\x88\x01\x01\x12\x18\n\x10\x63omputed_metrics\x18\x07 \x03(\tB\x10\n\x0e_quality_scoreB\x13\n\x11_redundancy_scoreB\r\n\x0b_size_scoreB\x13\n\x11_similarity_scoreB\x10\n\x0e_overall_score\"\xe2\x01\n\x0cOptimization\x12\n\n\x02id\x18\x01 \x01(\t\x12\x10\n\x08\x63hunk_id\x18\x02 \x01(\t\x12\x0c\n\x04type\x18\x03 \x01(\t\x12\x10\n\x08priority\x18\x04 \x01(\t\x12\r\n\x05title\x18\x05 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x06 \x01(\t\x12\x18\n\x10suggested_action\x18\x07 \x01(\t\x12\x16\n\x0erelated_chunks\x18\x08 \x03(\t\x12.\n\ncreated_at\x18\t \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x0e\n\x06status\x18\n \x01(\t\"\x86\x01\n\x0b\x43hunkResult\x12\x10\n\x08\x63hunk_id\x18\x01 \x01(\t\x12,\n\x07metrics\x18\x02 \x01(\x0b\x32\x1b.chunk_optimizer.v1.Metrics\x12\x37\n\roptimizations\x18\x03 \x03(\x0b\x32 .chunk_optimizer.v1.Optimization2\xc9\x01\n\x0e\x43hunkOptimizer\x12X\n\x0c\x41nalyzeChunk\x12\'.chunk_optimizer.v1.AnalyzeChunkRequest\x1a\x1f.chunk_optimizer.v1.ChunkResult\x12]\n\rAnalyzeStream\x12\'.chunk_optimizer.v1.AnalyzeChunkRequest\x1a\x1f.chunk_optimizer.v1.ChunkResult(\x01\x30\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'api.grpc.protos.chunk_optimizer_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+  DESCRIPTOR._options = None
+  _globals['_ANALYZECHUNKREQUEST_METADATAENTRY']._options = None
+  _globals['_ANALYZECHUNKREQUEST_METADATAENTRY']._serialized_options = b'8\001'
+  _globals['_ANALYSISOPTIONS']._serialized_start=95
+  _globals['_ANALYSISOPTIONS']._serialized_end=362
+  _globals['_ANALYZECHUNKREQUEST']._serialized_start=365
+  _globals['_ANALYZECHUNKREQUEST']._serialized_end=613
+  _globals['_ANALYZECHUNKREQUEST_METADATAENTRY']._serialized_start=566
+  _globals['_ANALYZECHUNKREQUEST_METADATAENTRY']._serialized_end=613
+  _globals['_METRICS']._serialized_start=616
+  _globals['_METRICS']._serialized_end=905
+  _globals['_OPTIMIZATION']._serialized_start=908
+  _globals['_OPTIMIZATION']._serialized_end=1134
+  _globals['_CHUNKRESULT']._serialized_start=1137
+  _globals['_CHUNKRESULT']._serialized_end=1271
+  _globals['_CHUNKOPTIMIZER']._serialized_start=1274
+  _globals['_CHUNKOPTIMIZER']._serialized_end=1475
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,105 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+
+from api.grpc.protos import chunk_optimizer_pb2 as api_dot_grpc_dot_protos_dot_chunk__optimizer__pb2
+
+
+class ChunkOptimizerStub(object):
+    """Chunk optimization service; mirrors the REST API in api/rest/main.py
+    """
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.AnalyzeChunk = channel.unary_unary(
+                '/chunk_optimizer.v1.ChunkOptimizer/AnalyzeChunk',
+                request_serializer=api_dot_grpc_dot_protos_dot_chunk__optimizer__pb2.AnalyzeChunkRequest.SerializeToString,
+                response_deserializer=api_dot_grpc_dot_protos_dot_chunk__optimizer__pb2.ChunkResult.FromString,
+                )
+        self.AnalyzeStream = channel.stream_stream(
+                '/chunk_optimizer.v1.ChunkOptimizer/AnalyzeStream',
+                request_serializer=api_dot_grpc_dot_protos_dot_chunk__optimizer__pb2.AnalyzeChunkRequest.SerializeToString,
+                response_deserializer=api_dot_grpc_dot_protos_dot_chunk__optimizer__pb2.ChunkResult.FromString,
+                )
+
+
+class ChunkOptimizerServicer(object):
+    """Chunk optimization service; mirrors the REST API in api/rest/main.py
+    """
+
+    def AnalyzeChunk(self, request, context):
+        """Analyze a single chunk
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def AnalyzeStream(self, request_iterator, context):
+        """Analyze a stream of chunks, returning each result as soon as it is computed.
+        Results may arrive out of request order; match them by chunk_id.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_ChunkOptimizerServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'AnalyzeChunk': grpc.unary_unary_rpc_method_handler(
+                    servicer.AnalyzeChunk,
+                    request_deserializer=api_dot_grpc_dot_protos_dot_chunk__optimizer__pb2.AnalyzeChunkRequest.FromString,
+                    response_serializer=api_dot_grpc_dot_protos_dot_chunk__optimizer__pb2.ChunkResult.SerializeToString,
+            ),
+            'AnalyzeStream': grpc.stream_stream_rpc_method_handler(
+                    servicer.AnalyzeStream,
+                    request_deserializer=api_dot_grpc_dot_protos_dot_chunk__optimizer__pb2.AnalyzeChunkRequest.FromString,
+                    response_serializer=api_dot_grpc_dot_protos_dot_chunk__optimizer__pb2.ChunkResult.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'chunk_optimizer.v1.ChunkOptimizer', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+
+
+ # This class is part of an EXPERIMENTAL API.
+class ChunkOptimizer(object):
+    """Chunk optimization service; mirrors the REST API in api/rest/main.py
+    """
+
+    @staticmethod
+    def AnalyzeChunk(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/chunk_optimizer.v1.ChunkOptimizer/AnalyzeChunk',
+            api_dot_grpc_dot_protos_dot_chunk__optimizer__pb2.AnalyzeChunkRequest.SerializeToString,
+            api_dot_grpc_dot_protos_dot_chunk__optimizer__pb2.ChunkResult.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def AnalyzeStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(request_iterator, target, '/chunk_optimizer.v1.ChunkOptimizer/AnalyzeStream',
+            api_dot_grpc_dot_protos_dot_chunk__optimizer__pb2.AnalyzeChunkRequest.SerializeToString,
+            api_dot_grpc_dot_protos_dot_chunk__optimizer__pb2.ChunkResult.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
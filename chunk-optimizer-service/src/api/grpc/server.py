@@ -0,0 +1,205 @@
+"""gRPC front end for the optimization engine"""
+import asyncio
+import sys
+from collections import defaultdict
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+import grpc
+from loguru import logger
+
+from api.grpc.protos import chunk_optimizer_pb2 as pb2
+from api.grpc.protos import chunk_optimizer_pb2_grpc as pb2_grpc
+from api.rest.schemas import AnalysisOptions
+from config.domain_registry import get_domain_registry
+from config.settings import settings
+from core.optimizer import Optimizer
+from core.records import MetricsRecord, OptimizationRecord
+
+
+def options_from_proto(options: pb2.AnalysisOptions) -> AnalysisOptions:
+    """Build AnalysisOptions, keeping defaults for unset fields"""
+    values = {
+        field.name: value
+        for field, value in options.ListFields()
+    }
+    return AnalysisOptions(**values)
+
+
+def result_to_proto(metrics: MetricsRecord, optimizations: List[OptimizationRecord]) -> pb2.ChunkResult:
+    """Convert an analysis result to its protobuf message"""
+    result = pb2.ChunkResult(
+        chunk_id=metrics.chunk_id,
+        metrics=pb2.Metrics(
+            chunk_id=metrics.chunk_id,
+            computed_metrics=metrics.computed_metrics,
+            # Scores that were not computed stay unset
+            **{
+                field: value
+                for field, value in (
+                    ("quality_score", metrics.quality_score),
+                    ("redundancy_score", metrics.redundancy_score),
+                    ("size_score", metrics.size_score),
+                    ("similarity_score", metrics.similarity_score),
+                    ("overall_score", metrics.overall_score)
+                )
+                if value is not None
+            }
+        )
+    )
+    
+    for opt in optimizations:
+        message = result.optimizations.add(
+            id=opt.id,
+            chunk_id=opt.chunk_id,
+            type=opt.type,
+            priority=opt.priority,
+            title=opt.title,
+            description=opt.description,
+            suggested_action=opt.suggested_action,
+            related_chunks=opt.related_chunks or [],
+            status=opt.status
+        )
+        message.created_at.FromDatetime(opt.created_at)
+    
+    return result
+
+
+class ChunkOptimizerServicer(pb2_grpc.ChunkOptimizerServicer):
+    """Serve AnalyzeChunk and AnalyzeStream from a shared Optimizer"""
+    
+    def __init__(
+        self,
+        optimizer: Optimizer,
+        batch_size: int = 64,
+        max_in_flight: int = 1024
+    ):
+        self.optimizer = optimizer
+        self.batch_size = batch_size
+        self.max_in_flight = max_in_flight
+    
+    async def AnalyzeChunk(self, request: pb2.AnalyzeChunkRequest, context) -> pb2.ChunkResult:
+        """Analyze a single chunk"""
+        try:
+            options = options_from_proto(request.options)
+            results = await self.optimizer.analyze_many(
+                [(request.chunk_id, request.content)],
+                request.domain or "default",
+                options
+            )
+            metrics, optimizations = results[0]
+        except Exception as e:
+            logger.error(f"Error analyzing chunk: {e}")
+            await context.abort(grpc.StatusCode.INTERNAL, str(e))
+        
+        return result_to_proto(metrics, optimizations)
+    
+    async def AnalyzeStream(
+        self,
+        request_iterator: AsyncIterator[pb2.AnalyzeChunkRequest],
+        context
+    ) -> AsyncIterator[pb2.ChunkResult]:
+        """Analyze chunks as they arrive and stream results back as they finish
+        
+        Incoming chunks are grouped into micro-batches of up to ``batch_size``.
+        Once ``max_in_flight`` chunks are queued, being analyzed or waiting to
+        be sent the server stops reading, so HTTP/2 flow control pushes back
+        on a client that sends too fast or reads results too slowly.
+        """
+        slots = asyncio.Semaphore(self.max_in_flight)
+        requests: asyncio.Queue = asyncio.Queue()
+        results: asyncio.Queue = asyncio.Queue()
+        
+        async def read():
+            try:
+                async for request in request_iterator:
+                    await slots.acquire()
+                    await requests.put(request)
+            finally:
+                # Also on a failed or cancelled client stream, so dispatch finishes
+                requests.put_nowait(None)
+        
+        async def analyze(batch: List[pb2.AnalyzeChunkRequest]):
+            groups: Dict[Tuple[str, bytes], List[pb2.AnalyzeChunkRequest]] = defaultdict(list)
+            for request in batch:
+                groups[(request.domain or "default", request.options.SerializeToString())].append(request)
+            
+            try:
+                for (domain, _), group in groups.items():
+                    analyzed = await self.optimizer.analyze_many(
+                        [(request.chunk_id, request.content) for request in group],
+                        domain,
+                        options_from_proto(group[0].options)
+                    )
+                    for metrics, optimizations in analyzed:
+                        await results.put(result_to_proto(metrics, optimizations))
+            except Exception as e:
+                await results.put(e)
+        
+        async def dispatch():
+            tasks = set()
+            finished = False
+            while not finished:
+                batch = [await requests.get()]
+                while len(batch) < self.batch_size and not requests.empty():
+                    batch.append(requests.get_nowait())
+                if batch[-1] is None:
+                    finished = True
+                    batch.pop()
+                if batch:
+                    task = asyncio.create_task(analyze(batch))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+            await asyncio.gather(*tasks)
+            await results.put(None)
+        
+        reader = asyncio.create_task(read())
+        dispatcher = asyncio.create_task(dispatch())
+        
+        try:
+            while True:
+                result = await results.get()
+                if result is None:
+                    break
+                if isinstance(result, Exception):
+                    logger.error(f"Error analyzing chunk stream: {result}")
+                    await context.abort(grpc.StatusCode.INTERNAL, str(result))
+                yield result
+                # The chunk leaves the server only once the client took its result
+                slots.release()
+            await reader
+        finally:
+            reader.cancel()
+            dispatcher.cancel()
+
+
+async def serve(optimizer: Optional[Optimizer] = None, port: Optional[int] = None):
+    """Run the gRPC server until terminated"""
+    optimizer = optimizer or Optimizer()
+    server = grpc.aio.server()
+    pb2_grpc.add_ChunkOptimizerServicer_to_server(
+        ChunkOptimizerServicer(
+            optimizer,
+            batch_size=settings.grpc_stream_batch_size,
+            max_in_flight=settings.grpc_stream_max_in_flight
+        ),
+        server
+    )
+    server.add_insecure_port(f"{settings.api_host}:{port or settings.grpc_port}")
+    
+    logger.info(f"Starting Chunk Optimizer gRPC server on port {port or settings.grpc_port}")
+    if settings.domain_config_dir:
+        get_domain_registry().start_watching()
+    await server.start()
+    try:
+        await server.wait_for_termination()
+    finally:
+        await server.stop(grace=5)
+        await optimizer.aclose()
+        if settings.domain_config_dir:
+            get_domain_registry().stop_watching()
+
+
+if __name__ == "__main__":
+    logger.remove()
+    logger.add(sys.stdout, level=settings.log_level)
+    asyncio.run(serve())
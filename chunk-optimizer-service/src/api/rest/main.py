@@ -1,20 +1,44 @@
 """FastAPI application"""
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
 from contextlib import asynccontextmanager
 from loguru import logger
+from typing import Any, List, Optional
+import hmac
+import json
 import sys
 
-from ..schemas import (
+from api.rest.middleware.telemetry import RequestMetricsMiddleware
+from api.rest.responses import (
+    ArrowResponse,
+    FastJSONResponse,
+    MessagePackResponse,
+    available_media_types,
+    negotiate
+)
+from api.rest.routing import NegotiatedRoute
+from api.rest.schemas import (
     AnalyzeChunkRequest,
+    AnalyzeChunksRequest,
     AnalyzeDocumentRequest,
     AnalyzeBatchRequest,
     OptimizationResponse,
     OptimizationListResponse,
-    BatchOptimizationResponse
+    BatchOptimizationResponse,
+    StreamSummary,
+    StreamError,
+    BatchJob,
+    BatchJobResultsPage
 )
-from ...config.settings import settings
-from ...core.optimizer import Optimizer
+from config.domain_registry import get_domain_registry
+from config.settings import settings
+from core.optimizer import Optimizer
+from core.jobs import BatchJobManager
+from core.profiling import PROFILE_DUMPS, PROFILE_MODES, RequestProfile, format_dump, profiling
+from core.records import chunk_result
+from utils.serialization import ARROW_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, dumps, packb, results_to_arrow
+from utils.telemetry import CONTENT_TYPE, REGISTRY
 
 
 logger.remove()
@@ -25,8 +49,15 @@ logger.add(sys.stdout, level=settings.log_level)
 async def lifespan(app: FastAPI):
     """Application lifespan"""
     logger.info("Starting Chunk Optimizer Service")
+    # Only an external domain directory can change while the service runs
+    if settings.domain_config_dir:
+        get_domain_registry().start_watching()
     yield
     logger.info("Shutting down Chunk Optimizer Service")
+    if settings.domain_config_dir:
+        get_domain_registry().stop_watching()
+    await job_manager.aclose()
+    await optimizer.aclose()
 
 
 app = FastAPI(
@@ -35,6 +66,8 @@ app = FastAPI(
     version="0.1.0",
     lifespan=lifespan
 )
+# Every route below accepts and can return MessagePack
+app.router.route_class = NegotiatedRoute
 
 app.add_middleware(
     CORSMiddleware,
@@ -44,8 +77,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.metrics_enabled:
+    app.add_middleware(RequestMetricsMiddleware)
+
 
 optimizer = Optimizer()
+job_manager = BatchJobManager(optimizer)
 
 
 @app.get("/health")
@@ -60,66 +97,317 @@ async def readiness_check():
     return {"status": "ready"}
 
 
+def require_admin(token: Optional[str]):
+    """Reject requests without the configured admin token"""
+    expected = settings.profiling_token
+    if not expected or token is None or not hmac.compare_digest(token.encode(), expected.encode()):
+        raise HTTPException(status_code=403, detail="A valid X-Admin-Token is required")
+
+
+def request_profile(mode: Optional[str], admin_token: Optional[str]) -> Optional[RequestProfile]:
+    """Profile for a request that opted in with X-Profile"""
+    if mode is None:
+        return None
+    require_admin(admin_token)
+    if mode not in PROFILE_MODES:
+        raise HTTPException(status_code=400, detail=f"X-Profile must be one of: {', '.join(PROFILE_MODES)}")
+    return RequestProfile(mode)
+
+
+def analysis_response(result: Any, profile: Optional[RequestProfile], media_type: str) -> Response:
+    """Encode a result record as-is in the negotiated format, with the profile report of profiled requests
+    
+    The record already matches the route's response model, so FastAPI's
+    validation of the returned value is skipped. Arrow responses carry
+    per-chunk results and put the profile report in the schema metadata.
+    """
+    if media_type == ARROW_MEDIA_TYPE:
+        metadata = {"profile": json.dumps(profile.report())} if profile is not None else None
+        return ArrowResponse(results_to_arrow(result, metadata))
+    
+    if profile is not None:
+        result = {**result._asdict(), "profile": profile.report()}
+    if media_type == MSGPACK_MEDIA_TYPE:
+        return MessagePackResponse(result)
+    return FastJSONResponse(result)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics"""
+    return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
 @app.post(
     "/api/v1/chunks/analyze",
     response_model=OptimizationResponse,
     summary="Analyze single chunk",
     description="Analyze a single chunk and return optimization suggestions"
 )
-async def analyze_chunk(request: AnalyzeChunkRequest):
+async def analyze_chunk(
+    request: AnalyzeChunkRequest,
+    accept: Optional[str] = Header(default=None),
+    x_profile: Optional[str] = Header(default=None),
+    x_admin_token: Optional[str] = Header(default=None)
+):
     """Analyze single chunk"""
+    media_type = negotiate(accept, available_media_types())
+    profile = request_profile(x_profile, x_admin_token)
     try:
-        result = await optimizer.analyze_chunk(
-            chunk_id=request.chunk_id,
-            content=request.content,
-            metadata=request.metadata
-        )
-        return result
+        with profiling(profile):
+            result = await optimizer.analyze_chunk(
+                chunk_id=request.chunk_id,
+                content=request.content,
+                metadata=request.metadata,
+                domain=request.domain or "default"
+            )
+        return analysis_response(result, profile, media_type)
     except Exception as e:
         logger.error(f"Error analyzing chunk: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post(
+    "/api/v1/chunks/analyze/batch",
+    response_model=List[OptimizationResponse],
+    summary="Analyze independent chunks",
+    description=(
+        "Analyze several independent chunks in one request, answering each in order "
+        "exactly as the single chunk endpoint would"
+    )
+)
+async def analyze_chunks(
+    request: AnalyzeChunksRequest,
+    accept: Optional[str] = Header(default=None)
+):
+    """Analyze independent chunks"""
+    media_type = negotiate(accept, available_media_types())
+    try:
+        result = await optimizer.analyze_chunks(
+            chunks=request.chunks,
+            domain=request.domain or "default"
+        )
+        return analysis_response(result, None, media_type)
+    except Exception as e:
+        logger.error(f"Error analyzing chunks: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.post(
     "/api/v1/documents/analyze",
     response_model=OptimizationListResponse,
     summary="Analyze document chunks",
-    description="Analyze all chunks in a document"
+    description=(
+        "Analyze all chunks in a document. With Accept: application/vnd.apache.arrow.stream "
+        "the response is an Arrow IPC stream with one row of metrics and optimizations per chunk"
+    )
 )
-async def analyze_document(request: AnalyzeDocumentRequest):
+async def analyze_document(
+    request: AnalyzeDocumentRequest,
+    accept: Optional[str] = Header(default=None),
+    x_profile: Optional[str] = Header(default=None),
+    x_admin_token: Optional[str] = Header(default=None)
+):
     """Analyze document chunks"""
+    media_type = negotiate(accept, available_media_types(arrow=True))
+    profile = request_profile(x_profile, x_admin_token)
     try:
-        result = await optimizer.analyze_document(
-            document_id=request.document_id,
-            chunks=request.chunks,
-            options=request.options
-        )
-        return result
+        with profiling(profile):
+            if media_type == ARROW_MEDIA_TYPE:
+                result = await optimizer.analyze_many(
+                    [(chunk.chunk_id, chunk.content) for chunk in request.chunks],
+                    request.domain or "default",
+                    request.options
+                )
+            else:
+                result = await optimizer.analyze_document(
+                    document_id=request.document_id,
+                    chunks=request.chunks,
+                    options=request.options,
+                    domain=request.domain or "default"
+                )
+        return analysis_response(result, profile, media_type)
     except Exception as e:
         logger.error(f"Error analyzing document: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post(
+    "/api/v1/documents/analyze/stream",
+    response_class=StreamingResponse,
+    summary="Stream document chunk analysis",
+    description=(
+        "Analyze all chunks in a document, emitting one NDJSON line per chunk followed by a summary line. "
+        "With Accept: application/msgpack each line is a MessagePack message instead"
+    )
+)
+async def analyze_document_stream(
+    request: AnalyzeDocumentRequest,
+    accept: Optional[str] = Header(default=None)
+):
+    """Stream document chunk analysis as NDJSON or a sequence of MessagePack messages"""
+    media_type = negotiate(accept, ["application/x-ndjson", *available_media_types()[1:]])
+    if media_type == MSGPACK_MEDIA_TYPE:
+        encode = packb
+    else:
+        def encode(message: Any) -> bytes:
+            return dumps(message) + b"\n"
+    
+    async def generate():
+        total = 0
+        high_priority_count = 0
+        
+        try:
+            async for metrics, optimizations in optimizer.analyze_document_stream(
+                document_id=request.document_id,
+                chunks=request.chunks,
+                options=request.options,
+                domain=request.domain or "default"
+            ):
+                total += len(optimizations)
+                high_priority_count += sum(1 for opt in optimizations if opt.priority == "HIGH")
+                yield encode(chunk_result(metrics, optimizations))
+        except Exception as e:
+            # Headers are already sent, so report the failure in-band
+            logger.error(f"Error streaming document analysis: {e}")
+            yield encode(StreamError(detail=str(e)).model_dump())
+            return
+        
+        yield encode(StreamSummary(total=total, high_priority=high_priority_count).model_dump())
+    
+    return StreamingResponse(generate(), media_type=media_type)
+
+
 @app.post(
     "/api/v1/batch/analyze",
     response_model=BatchOptimizationResponse,
     summary="Batch analyze chunks",
-    description="Batch analyze multiple chunks"
+    description=(
+        "Batch analyze multiple chunks. With Accept: application/vnd.apache.arrow.stream "
+        "the response is an Arrow IPC stream with one row of metrics and optimizations per item"
+    )
 )
-async def analyze_batch(request: AnalyzeBatchRequest):
+async def analyze_batch(
+    request: AnalyzeBatchRequest,
+    accept: Optional[str] = Header(default=None),
+    x_profile: Optional[str] = Header(default=None),
+    x_admin_token: Optional[str] = Header(default=None)
+):
     """Batch analyze chunks"""
+    media_type = negotiate(accept, available_media_types(arrow=True))
+    profile = request_profile(x_profile, x_admin_token)
+    try:
+        with profiling(profile):
+            if media_type == ARROW_MEDIA_TYPE:
+                result = await optimizer.analyze_many(
+                    [(item.chunk_id, item.content) for item in request.items],
+                    request.domain or "default",
+                    request.options
+                )
+            else:
+                result = await optimizer.analyze_batch(
+                    batch_id=request.batch_id,
+                    items=request.items,
+                    options=request.options,
+                    domain=request.domain or "default"
+                )
+        return analysis_response(result, profile, media_type)
+    except Exception as e:
+        logger.error(f"Error analyzing batch: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get(
+    "/debug/profiles/{profile_id}",
+    summary="Get request profile dump",
+    description="cProfile dump captured by a request sent with X-Profile: cprofile"
+)
+async def get_profile_dump(
+    profile_id: str,
+    format: str = Query(default="text", pattern="^(text|pstats)$"),
+    sort: str = Query(default="cumulative", pattern="^(cumulative|tottime|ncalls)$"),
+    x_admin_token: Optional[str] = Header(default=None)
+):
+    """Get a captured cProfile dump as a pstats listing or a binary pstats file"""
+    require_admin(x_admin_token)
+    dump = PROFILE_DUMPS.get(profile_id)
+    if dump is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    
+    if format == "pstats":
+        return Response(
+            dump,
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": f'attachment; filename="{profile_id}.prof"'}
+        )
+    return PlainTextResponse(format_dump(dump, sort))
+
+
+@app.post(
+    "/api/v1/batch/jobs",
+    response_model=BatchJob,
+    status_code=202,
+    summary="Submit batch analysis job",
+    description="Submit a batch for background analysis and return the job immediately"
+)
+async def submit_batch_job(request: AnalyzeBatchRequest):
+    """Submit batch analysis job"""
     try:
-        result = await optimizer.analyze_batch(
+        return await job_manager.submit(
             batch_id=request.batch_id,
             items=request.items,
-            options=request.options
+            options=request.options,
+            domain=request.domain or "default"
         )
-        return result
     except Exception as e:
-        logger.error(f"Error analyzing batch: {e}")
+        logger.error(f"Error submitting batch job: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get(
+    "/api/v1/batch/jobs/{job_id}",
+    response_model=BatchJob,
+    summary="Get batch job progress",
+    description="Return the status and processed/total progress of a batch job"
+)
+async def get_batch_job(job_id: str):
+    """Get batch job progress"""
+    job = await job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return job
+
+
+@app.get(
+    "/api/v1/batch/jobs/{job_id}/results",
+    response_model=BatchJobResultsPage,
+    summary="Get batch job results",
+    description="Return a page of item results of a batch job in item order"
+)
+async def get_batch_job_results(
+    job_id: str,
+    offset: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=1000)
+):
+    """Get a page of batch job results"""
+    page = await job_manager.get_results(job_id, offset=offset, limit=limit)
+    if page is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return page
+
+
+@app.delete(
+    "/api/v1/batch/jobs/{job_id}",
+    summary="Delete batch job",
+    description="Delete a batch job and its stored results"
+)
+async def delete_batch_job(job_id: str):
+    """Delete batch job"""
+    if not await job_manager.delete(job_id):
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return {"status": "deleted"}
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
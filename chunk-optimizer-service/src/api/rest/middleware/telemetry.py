@@ -0,0 +1,66 @@
+"""Request count, latency and in-flight metrics per route"""
+import time
+from typing import Dict, Optional
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from utils.telemetry import REQUEST_SECONDS, REQUESTS, REQUESTS_IN_FLIGHT
+
+# Route label for requests that match no route, so unknown paths cannot grow the label set
+UNMATCHED_ROUTE = "unmatched"
+
+
+class RequestMetricsMiddleware:
+    """Pure ASGI middleware labelling metrics with the route's path template"""
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        # Paths of routes without path parameters map straight to their template
+        self._static_routes: Optional[Dict[str, str]] = None
+    
+    def _route(self, scope: Scope) -> str:
+        router = scope["app"].router
+        if self._static_routes is None:
+            self._static_routes = {
+                route.path: route.path
+                for route in router.routes
+                if getattr(route, "path", None) and not getattr(route, "param_convertors", None)
+            }
+        
+        path = scope["path"]
+        route = self._static_routes.get(path)
+        if route is not None:
+            return route
+        
+        for candidate in router.routes:
+            match, _ = candidate.matches(scope)
+            if match == Match.FULL:
+                return getattr(candidate, "path", UNMATCHED_ROUTE)
+        return UNMATCHED_ROUTE
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        method = scope["method"]
+        route = self._route(scope)
+        in_flight = REQUESTS_IN_FLIGHT.labels(method, route)
+        # Requests failing before a response starts are reported as 500
+        status = [500]
+        
+        async def send_with_status(message: Message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+        
+        in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # Streaming responses count until their last chunk is sent
+            REQUEST_SECONDS.labels(method, route).observe(time.perf_counter() - start)
+            REQUESTS.labels(method, route, str(status[0])).inc()
+            in_flight.dec()
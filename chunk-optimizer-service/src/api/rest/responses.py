@@ -0,0 +1,89 @@
+"""Response classes and content negotiation"""
+from typing import Any, Optional, Sequence
+
+from fastapi.responses import JSONResponse, Response
+
+from utils import serialization
+from utils.serialization import (
+    ARROW_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    dumps,
+    packb
+)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response encoding analysis records directly, without response model validation"""
+    
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class MessagePackResponse(Response):
+    """MessagePack response holding the same value tree as the JSON response"""
+    
+    media_type = MSGPACK_MEDIA_TYPE
+    
+    def render(self, content: Any) -> bytes:
+        return packb(content)
+
+
+class ArrowResponse(Response):
+    """Arrow IPC stream response; the content is already encoded"""
+    
+    media_type = ARROW_MEDIA_TYPE
+
+
+def available_media_types(arrow: bool = False) -> Sequence[str]:
+    """Media types a route can produce, JSON first as the default"""
+    media_types = [JSON_MEDIA_TYPE]
+    if serialization.msgpack is not None:
+        media_types.append(MSGPACK_MEDIA_TYPE)
+    if arrow and serialization.pa is not None:
+        media_types.append(ARROW_MEDIA_TYPE)
+    return media_types
+
+
+def negotiate(accept: Optional[str], offered: Sequence[str]) -> str:
+    """Pick the offered media type the Accept header prefers
+    
+    Each offered type takes the quality of the most specific range matching
+    it; ties go to the earlier offered type, and JSON is used when nothing
+    offered is acceptable, as before content negotiation existed.
+    """
+    if not accept:
+        return offered[0]
+    
+    # media type -> (specificity, quality) of the most specific matching range
+    matches = {}
+    for media_range in accept.split(","):
+        media_type, *params = media_range.strip().lower().split(";")
+        media_type = media_type.strip()
+        quality = 1.0
+        for param in params:
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        
+        for candidate in offered:
+            if media_type == candidate:
+                specificity = 2
+            elif media_type == candidate.split("/")[0] + "/*":
+                specificity = 1
+            elif media_type == "*/*":
+                specificity = 0
+            else:
+                continue
+            if specificity >= matches.get(candidate, (-1, 0.0))[0]:
+                matches[candidate] = (specificity, quality)
+    
+    best, best_quality = offered[0], 0.0
+    for candidate in offered:
+        quality = matches.get(candidate, (0, 0.0))[1]
+        if quality > best_quality:
+            best, best_quality = candidate, quality
+    return best
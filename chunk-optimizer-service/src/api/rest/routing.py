@@ -0,0 +1,69 @@
+"""Route class adding MessagePack request and response bodies to every endpoint"""
+from typing import Any, Callable, Coroutine
+
+from fastapi import HTTPException, Request, Response
+from fastapi.routing import APIRoute
+
+from algorithms import ALGORITHM_VERSION
+from api.rest.responses import MessagePackResponse, available_media_types, negotiate
+from utils import serialization
+from utils.serialization import JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, MSGPACK_MEDIA_TYPES, unpackb
+
+Handler = Callable[[Request], Coroutine[Any, Any, Response]]
+
+
+class MessagePackRequest(Request):
+    """Request with a MessagePack body, handed to FastAPI as an already decoded JSON body"""
+    
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = unpackb(await self.body())
+        return self._json
+
+
+def _as_json_request(request: Request) -> MessagePackRequest:
+    # FastAPI only parses bodies declared as JSON, so relabel the decoded body
+    headers = [
+        (name, value) for name, value in request.scope["headers"]
+        if name != b"content-type"
+    ]
+    headers.append((b"content-type", JSON_MEDIA_TYPE.encode("latin-1")))
+    return MessagePackRequest({**request.scope, "headers": headers}, request.receive)
+
+
+class NegotiatedRoute(APIRoute):
+    """Accept MessagePack request bodies and honour ``Accept: application/msgpack``
+    
+    Endpoints returning a model or a dict are rendered with the response class
+    the client accepts; endpoints returning a ``Response`` negotiate themselves.
+    Every response carries the algorithm version, so clients can tell when
+    cached results are stale.
+    """
+    
+    def get_route_handler(self) -> Handler:
+        json_handler = super().get_route_handler()
+        
+        # A second handler of the same endpoint rendering with MessagePack
+        response_class = self.response_class
+        self.response_class = MessagePackResponse
+        try:
+            msgpack_handler = super().get_route_handler()
+        finally:
+            self.response_class = response_class
+        
+        async def negotiated_handler(request: Request) -> Response:
+            content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+            if content_type in MSGPACK_MEDIA_TYPES:
+                if serialization.msgpack is None:
+                    raise HTTPException(status_code=415, detail="MessagePack request bodies are not supported")
+                request = _as_json_request(request)
+            
+            accepted = negotiate(request.headers.get("accept"), available_media_types())
+            if accepted == MSGPACK_MEDIA_TYPE:
+                response = await msgpack_handler(request)
+            else:
+                response = await json_handler(request)
+            response.headers["X-Algorithm-Version"] = ALGORITHM_VERSION
+            return response
+        
+        return negotiated_handler
@@ -13,11 +13,15 @@ class AnalyzeChunkRequest(BaseModel):
 
 class Metrics(BaseModel):
     chunk_id: str
-    quality_score: float = Field(ge=0, le=1, description="Quality score (0-1)")
-    redundancy_score: float = Field(ge=0, le=1, description="Redundancy score (0-1)")
-    size_score: float = Field(ge=0, le=1, description="Size score (0-1)")
-    similarity_score: float = Field(ge=0, le=1, description="Similarity score (0-1)")
-    overall_score: float = Field(ge=0, le=1, description="Overall score (0-1)")
+    quality_score: Optional[float] = Field(default=None, ge=0, le=1, description="Quality score (0-1), null when not computed")
+    redundancy_score: Optional[float] = Field(default=None, ge=0, le=1, description="Redundancy score (0-1), null when not computed")
+    size_score: Optional[float] = Field(default=None, ge=0, le=1, description="Size score (0-1), null when not computed")
+    similarity_score: Optional[float] = Field(default=None, ge=0, le=1, description="Similarity score (0-1), null when not computed")
+    overall_score: Optional[float] = Field(default=None, ge=0, le=1, description="Overall score (0-1) over the computed metrics, reweighted when some were skipped")
+    computed_metrics: List[str] = Field(
+        default_factory=lambda: ["quality", "redundancy", "size", "similarity"],
+        description="Metrics that were computed, as selected by the check_* options"
+    )
 
 
 class Optimization(BaseModel):
@@ -44,6 +48,11 @@ class Chunk(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(default_factory=dict)
 
 
+class AnalyzeChunksRequest(BaseModel):
+    chunks: List[Chunk] = Field(..., description="Independent chunks, each analyzed as by the single chunk endpoint")
+    domain: Optional[str] = Field(default="default", description="Domain configuration: default, operations, ecommerce, medical")
+
+
 class AnalysisOptions(BaseModel):
     check_quality: bool = True
     check_redundancy: bool = True
@@ -65,6 +74,24 @@ class OptimizationListResponse(BaseModel):
     high_priority: int
 
 
+class ChunkResult(BaseModel):
+    type: str = Field(default="result", description="NDJSON line type")
+    chunk_id: str
+    metrics: Metrics
+    optimizations: List[Optimization]
+
+
+class StreamSummary(BaseModel):
+    type: str = Field(default="summary", description="NDJSON line type")
+    total: int
+    high_priority: int
+
+
+class StreamError(BaseModel):
+    type: str = Field(default="error", description="NDJSON line type")
+    detail: str
+
+
 class BatchItem(BaseModel):
     chunk_id: str
     content: str
@@ -84,3 +111,23 @@ class BatchOptimizationResponse(BaseModel):
     optimization: Optional[Optimization]
     processed: int
     total: int
+
+
+class BatchJob(BaseModel):
+    job_id: str = Field(..., description="Job unique identifier")
+    batch_id: str
+    status: str = Field(default="pending", description="Status: pending, running, completed, failed")
+    processed: int = 0
+    total: int
+    error: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+
+class BatchJobResultsPage(BaseModel):
+    job_id: str
+    results: List[ChunkResult]
+    offset: int
+    limit: int
+    processed: int
+    next_offset: Optional[int] = Field(default=None, description="Offset of the next page, if more results are available")
@@ -1,6 +1,7 @@
 """Domain-specific configurations for chunk optimization"""
+import hashlib
 from pydantic import BaseModel
-from typing import Tuple
+from typing import Optional, Tuple
 from functools import lru_cache
 
 
@@ -24,6 +25,10 @@ class DomainConfig(BaseModel):
     max_length: int = 2000
     optimal_length: Tuple[int, int] = (300, 1000)
     
+    # 词典配置：语言与领域词典（algorithms/lexicons/domains/<lexicon>）
+    languages: Tuple[str, ...] = ("en", "zh")
+    lexicon: Optional[str] = None
+    
     def get_weights(self) -> dict:
         """Get weight configuration"""
         return {
@@ -47,7 +52,9 @@ class DomainConfig(BaseModel):
         return {
             "min_length": self.min_length,
             "max_length": self.max_length,
-            "optimal_length": self.optimal_length
+            "optimal_length": self.optimal_length,
+            "languages": self.languages,
+            "lexicon": self.lexicon
         }
     
     def __hash__(self):
@@ -63,75 +70,16 @@ class DomainConfig(BaseModel):
             self.similarity_threshold,
             self.min_length,
             self.max_length,
-            self.optimal_length
+            self.optimal_length,
+            self.languages,
+            self.lexicon
         ))
 
 
-@lru_cache(maxsize=10)
-def get_domain_config(domain: str) -> DomainConfig:
-    """Get domain-specific configuration with caching"""
-    domain = domain.lower()
-    
-    if domain == "operations":
-        return DomainConfig(
-            # 运维领域：更重视质量和冗余
-            quality_weight=0.5,           # 提高质量权重
-            redundancy_weight=0.3,        # 保持冗余权重
-            size_weight=0.15,             # 降低大小权重
-            similarity_weight=0.05,       # 降低相似度权重
-            
-            # 更严格的阈值
-            quality_threshold=0.7,        # 提高质量阈值
-            redundancy_threshold=0.4,    # 降低冗余阈值（更严格）
-            size_threshold=0.4,           # 降低大小阈值
-            similarity_threshold=0.9,     # 提高相似度阈值
-            
-            # 更长的内容长度
-            min_length=100,               # 提高最小长度
-            max_length=3000,             # 提高最大长度
-            optimal_length=(500, 1500)    # 调整最优长度范围
-        )
-    elif domain == "ecommerce":
-        return DomainConfig(
-            # 电商领域：平衡各项指标，更重视大小和相似度
-            quality_weight=0.3,           # 降低质量权重
-            redundancy_weight=0.25,       # 降低冗余权重
-            size_weight=0.25,             # 提高大小权重
-            similarity_weight=0.2,        # 提高相似度权重
-            
-            # 标准阈值
-            quality_threshold=0.6,        # 保持默认质量阈值
-            redundancy_threshold=0.5,     # 保持默认冗余阈值
-            size_threshold=0.6,           # 提高大小阈值
-            similarity_threshold=0.8,     # 降低相似度阈值（更严格）
-            
-            # 更短的内容长度
-            min_length=50,                # 保持最小长度
-            max_length=1500,             # 降低最大长度
-            optimal_length=(200, 800)     # 调整最优长度范围
-        )
-    elif domain == "medical":
-        return DomainConfig(
-            # 医疗领域：极其重视质量和冗余
-            quality_weight=0.6,           # 大幅提高质量权重
-            redundancy_weight=0.25,       # 提高冗余权重
-            size_weight=0.1,              # 大大降低大小权重
-            similarity_weight=0.05,       # 大大降低相似度权重
-            
-            # 非常严格的阈值
-            quality_threshold=0.8,        # 大幅提高质量阈值
-            redundancy_threshold=0.3,     # 大幅降低冗余阈值（非常严格）
-            size_threshold=0.5,           # 保持大小阈值
-            similarity_threshold=0.95,    # 大幅提高相似度阈值（非常严格）
-            
-            # 更长的内容长度
-            min_length=150,               # 提高最小长度
-            max_length=5000,             # 提高最大长度
-            optimal_length=(800, 2500)    # 调整最优长度范围
-        )
-    else:
-        # 默认配置
-        return DomainConfig()
+@lru_cache(maxsize=256)
+def config_fingerprint(config: DomainConfig) -> bytes:
+    """Stable digest of a configuration, used in cache keys"""
+    return hashlib.blake2b(config.model_dump_json().encode("utf-8"), digest_size=8).digest()
 
 
 def calculate_overall_score(
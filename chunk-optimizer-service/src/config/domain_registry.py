@@ -0,0 +1,252 @@
+"""File-based registry of domain configurations with hot reload"""
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from config.domain_config import DomainConfig
+from config.settings import settings
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - PyYAML is needed for .yaml domain files only
+    yaml = None
+
+# Domain definitions shipped with the service
+BUILTIN_DOMAIN_DIR = os.path.join(os.path.dirname(__file__), "domains")
+
+DEFAULT_DOMAIN = "default"
+
+DOMAIN_FILE_EXTENSIONS = (".yaml", ".yml", ".json")
+
+
+class DomainEntry(NamedTuple):
+    """A loaded domain: its configuration and what the compiler built from it"""
+    config: DomainConfig
+    compiled: Any
+    path: str
+    stamp: Tuple[int, int]
+
+
+def validate_domain_config(config: DomainConfig):
+    """Reject configurations that would produce meaningless scores"""
+    weights = (
+        config.quality_weight,
+        config.redundancy_weight,
+        config.size_weight,
+        config.similarity_weight
+    )
+    if any(weight < 0 for weight in weights) or abs(sum(weights) - 1.0) > 1e-6:
+        raise ValueError("weights must be non-negative and sum to 1")
+    
+    thresholds = (
+        config.quality_threshold,
+        config.redundancy_threshold,
+        config.size_threshold,
+        config.similarity_threshold
+    )
+    if any(not 0 <= threshold <= 1 for threshold in thresholds):
+        raise ValueError("thresholds must be between 0 and 1")
+    
+    optimal_min, optimal_max = config.optimal_length
+    if not 0 < config.min_length < optimal_min <= optimal_max < config.max_length:
+        raise ValueError("lengths must satisfy 0 < min_length < optimal_length <= max_length")
+
+
+def load_domain_file(path: str) -> DomainConfig:
+    """Parse and validate one YAML or JSON domain file"""
+    with open(path, encoding="utf-8") as f:
+        if path.endswith(".json"):
+            data = json.load(f)
+        elif yaml is None:
+            raise RuntimeError("PyYAML is required to load YAML domain files")
+        else:
+            data = yaml.safe_load(f)
+    
+    if not isinstance(data, dict):
+        raise ValueError("domain file must contain a mapping")
+    
+    unknown = set(data) - set(DomainConfig.model_fields)
+    if unknown:
+        raise ValueError(f"unknown fields: {', '.join(sorted(unknown))}")
+    
+    config = DomainConfig.model_validate(data)
+    validate_domain_config(config)
+    return config
+
+
+class DomainRegistry:
+    """Domain configurations loaded from directories of YAML/JSON files
+    
+    Each file ``<domain>.yaml`` (or ``.yml``/``.json``) defines one domain; files
+    in later directories override earlier ones. Every configuration is passed to
+    ``compiler`` at load time, so request-path lookups are plain dict reads.
+    
+    Reloads rebuild only files whose modification time or size changed and then
+    swap the whole mapping at once. Requests already holding an entry keep using
+    it, and a file that fails validation keeps its previous version.
+    """
+    
+    def __init__(
+        self,
+        directories: Sequence[str],
+        compiler: Optional[Callable[[DomainConfig], Any]] = None,
+        reload_interval: float = 2.0
+    ):
+        self.directories = list(directories)
+        self.reload_interval = reload_interval
+        self._compiler = compiler
+        self._entries: Dict[str, DomainEntry] = {}
+        # Stamps of files that failed to load, so they are not retried until edited
+        self._failed: Dict[str, Tuple[int, int]] = {}
+        self._fallback = DomainEntry(DomainConfig(), None, "", (0, 0))
+        self._reload_lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._watcher_pid: Optional[int] = None
+        self._stop = threading.Event()
+        
+        self.reload()
+    
+    def set_compiler(self, compiler: Callable[[DomainConfig], Any]):
+        """Install the compiler and precompile every loaded domain"""
+        with self._reload_lock:
+            self._compiler = compiler
+            self._fallback = self._fallback._replace(compiled=compiler(self._fallback.config))
+            self._entries = {
+                domain: entry._replace(compiled=compiler(entry.config))
+                for domain, entry in self._entries.items()
+            }
+    
+    def _scan(self) -> Dict[str, Tuple[str, Tuple[int, int]]]:
+        """Map each domain to its winning file and that file's (mtime, size) stamp"""
+        found = {}
+        for directory in self.directories:
+            if not os.path.isdir(directory):
+                continue
+            for filename in sorted(os.listdir(directory)):
+                domain, extension = os.path.splitext(filename)
+                if extension not in DOMAIN_FILE_EXTENSIONS:
+                    continue
+                path = os.path.join(directory, filename)
+                stat = os.stat(path)
+                found[domain.lower()] = (path, (stat.st_mtime_ns, stat.st_size))
+        return found
+    
+    def reload(self) -> bool:
+        """Load new and changed domain files; return whether anything changed"""
+        with self._reload_lock:
+            current = self._entries
+            entries = {}
+            changed = False
+            
+            for domain, (path, stamp) in self._scan().items():
+                previous = current.get(domain)
+                if previous is not None and previous.path == path and previous.stamp == stamp:
+                    entries[domain] = previous
+                    continue
+                if self._failed.get(path) == stamp:
+                    if previous is not None:
+                        entries[domain] = previous
+                    continue
+                
+                try:
+                    config = load_domain_file(path)
+                    compiled = self._compiler(config) if self._compiler else None
+                except Exception as e:
+                    logger.error(f"Invalid domain file {path}: {e}")
+                    self._failed[path] = stamp
+                    if previous is not None:
+                        entries[domain] = previous
+                    continue
+                
+                self._failed.pop(path, None)
+                entries[domain] = DomainEntry(config, compiled, path, stamp)
+                changed = True
+                logger.info(f"Loaded domain '{domain}' from {path}")
+            
+            removed = set(current) - set(entries)
+            for domain in removed:
+                logger.info(f"Removed domain '{domain}'")
+            
+            if changed or removed:
+                self._entries = entries
+            return changed or bool(removed)
+    
+    def entry(self, domain: str) -> DomainEntry:
+        """Entry for a domain, falling back to the default domain"""
+        entries = self._entries
+        entry = entries.get(domain)
+        if entry is None:
+            entry = entries.get(domain.lower()) or entries.get(DEFAULT_DOMAIN) or self._fallback
+        return entry
+    
+    def get(self, domain: str) -> DomainConfig:
+        """Configuration for a domain"""
+        return self.entry(domain).config
+    
+    def compiled(self, domain: str) -> Any:
+        """Compiled form of a domain's configuration"""
+        return self.entry(domain).compiled
+    
+    def domains(self) -> List[str]:
+        """Names of all loaded domains"""
+        return sorted(self._entries)
+    
+    def start_watching(self):
+        """Poll the directories for changes in a daemon thread"""
+        # A forked worker inherits the registry but not its thread
+        if self.reload_interval <= 0 or (
+            self._watcher is not None and self._watcher_pid == os.getpid()
+        ):
+            return
+        
+        self._stop.clear()
+        self._watcher = threading.Thread(target=self._watch, name="domain-registry", daemon=True)
+        self._watcher_pid = os.getpid()
+        self._watcher.start()
+    
+    def stop_watching(self):
+        """Stop the polling thread"""
+        self._stop.set()
+        if self._watcher is not None and self._watcher_pid == os.getpid():
+            self._watcher.join()
+        self._watcher = None
+    
+    def _watch(self):
+        while not self._stop.wait(self.reload_interval):
+            try:
+                self.reload()
+            except Exception as e:
+                logger.error(f"Domain registry reload failed: {e}")
+
+
+_registry: Optional[DomainRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_domain_registry() -> DomainRegistry:
+    """Process-wide registry over the built-in and configured domain directories
+    
+    Loading does not watch for changes; servers call ``start_watching`` at
+    startup when ``domain_config_dir`` is set, since built-in domains only
+    change with a deploy.
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                directories = [BUILTIN_DOMAIN_DIR]
+                if settings.domain_config_dir:
+                    directories.append(settings.domain_config_dir)
+                _registry = DomainRegistry(
+                    directories,
+                    reload_interval=settings.domain_config_reload_interval
+                )
+    return _registry
+
+
+def get_domain_config(domain: str) -> DomainConfig:
+    """Get domain-specific configuration from the file-based domain registry"""
+    return get_domain_registry().get(domain)
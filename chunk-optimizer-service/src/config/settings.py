@@ -12,6 +12,11 @@ class Settings(BaseSettings):
     
     api_host: str = "0.0.0.0"
     api_port: int = 8000
+    grpc_port: int = 50051
+    
+    # AnalyzeStream micro-batch size and maximum chunks queued or in analysis per stream
+    grpc_stream_batch_size: int = 64
+    grpc_stream_max_in_flight: int = 1024
     
     secret_key: str = "your-secret-key-here"
     algorithm: str = "HS256"
@@ -20,6 +25,54 @@ class Settings(BaseSettings):
     rate_limit_enabled: bool = True
     rate_limit_per_minute: int = 60
     
+    # Per-route request metrics; /metrics is served either way
+    metrics_enabled: bool = True
+    
+    # Admin token accepted in X-Admin-Token to profile requests (None disables profiling)
+    profiling_token: Optional[str] = None
+    # cProfile dumps kept in memory for /debug/profiles
+    profiling_max_dumps: int = 32
+    
+    # None uses one worker process per CPU, 0 runs analysis in a background thread
+    analysis_workers: Optional[int] = None
+    # Maximum characters of chunk content sent to a worker in one shard
+    analysis_shard_size: int = 262144
+    
+    # Content-addressed metrics cache, bounded by entry count and bytes
+    metrics_cache_max_entries: int = 100000
+    metrics_cache_max_bytes: int = 64 * 1024 * 1024
+    
+    # Local tier of the request-level result cache, budgeted separately from
+    # the metrics cache
+    result_cache_max_entries: int = 100000
+    result_cache_max_bytes: int = 64 * 1024 * 1024
+    
+    # Redis tier of the result cache shared across replicas
+    result_cache_redis_enabled: bool = False
+    result_cache_ttl: int = 7 * 24 * 3600
+    # Seconds before an unresponsive Redis is skipped in favour of the local tier
+    result_cache_redis_connect_timeout: float = 0.25
+    result_cache_redis_timeout: float = 0.25
+    
+    # Batch job store backend: memory or sqlite
+    job_store_backend: str = "memory"
+    job_store_dir: str = "data/jobs"
+    # Finished jobs the memory backend keeps before dropping the oldest
+    job_store_max_finished_jobs: int = 1000
+    
+    # Extra directory of <domain>.yaml/.json files overriding the built-in domains,
+    # polled for changes every reload interval (0 disables hot reload)
+    domain_config_dir: Optional[str] = None
+    domain_config_reload_interval: float = 2.0
+    
+    # Persistent MinHash/LSH index used to fill related_chunks. Off by default:
+    # every analysis writes to it, and a chunk only finds chunks indexed before
+    # it, so results depend on the order concurrent requests (or replicas
+    # sharing the directory) reach it. Point the directory at persistent
+    # storage when enabling.
+    similarity_index_enabled: bool = False
+    similarity_index_dir: str = "data/similarity_index"
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -0,0 +1,105 @@
+"""Executor layer for CPU-bound chunk analysis"""
+import asyncio
+import math
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Deque, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+
+def shard_by_size(
+    sizes: Sequence[int],
+    max_shard_size: int,
+    min_shards: int = 1
+) -> List[Tuple[int, int]]:
+    """Split items into contiguous, size-balanced (start, end) slices"""
+    if not sizes:
+        return []
+    
+    total = sum(sizes)
+    target = max(1, min(max_shard_size, math.ceil(total / max(1, min_shards))))
+    
+    shards = []
+    start = 0
+    current = 0
+    for idx, size in enumerate(sizes):
+        if current and current + size > target:
+            shards.append((start, idx))
+            start = idx
+            current = 0
+        current += size
+    shards.append((start, len(sizes)))
+    
+    return shards
+
+
+class AnalysisExecutor:
+    """Run shards of chunk analysis off the event loop
+    
+    ``max_workers=None`` uses one process per CPU; ``0`` uses a single
+    background thread instead of a process pool.
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None, shard_size: int = 262144):
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        
+        self.max_workers = max_workers
+        self.shard_size = shard_size
+        self._pool: Optional[Executor] = None
+    
+    def _ensure_pool(self) -> Executor:
+        if self._pool is None:
+            if self.max_workers > 0:
+                logger.info(f"Starting analysis process pool with {self.max_workers} workers")
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=1)
+        return self._pool
+    
+    async def iter_shards(
+        self,
+        fn: Callable[..., List[Any]],
+        items: Sequence[Any],
+        sizes: Sequence[int],
+        *args: Any
+    ) -> AsyncIterator[Tuple[int, int, List[Any]]]:
+        """Yield ``(start, end, results)`` per shard in order as soon as each shard finishes
+        
+        At most two shards per worker are in flight, so memory stays bounded
+        when the consumer is slower than the pool.
+        """
+        shards = shard_by_size(sizes, self.shard_size, min_shards=max(1, self.max_workers))
+        if not shards:
+            return
+        
+        pool = self._ensure_pool()
+        loop = asyncio.get_running_loop()
+        max_pending = 2 * max(1, self.max_workers)
+        pending: Deque[Tuple[int, int, asyncio.Future]] = deque()
+        
+        try:
+            for start, end in shards:
+                pending.append((
+                    start,
+                    end,
+                    loop.run_in_executor(pool, fn, list(items[start:end]), *args)
+                ))
+                if len(pending) >= max_pending:
+                    start, end, future = pending.popleft()
+                    yield start, end, await future
+            
+            while pending:
+                start, end, future = pending.popleft()
+                yield start, end, await future
+        finally:
+            for _, _, future in pending:
+                future.cancel()
+    
+    def shutdown(self):
+        """Stop the underlying pool"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
@@ -0,0 +1,141 @@
+"""Background batch analysis jobs"""
+import asyncio
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from loguru import logger
+
+from api.rest.schemas import (
+    AnalysisOptions,
+    BatchItem,
+    BatchJob,
+    BatchJobResultsPage,
+    ChunkResult
+)
+from config.settings import settings
+from core.optimizer import Optimizer
+from core.records import AnalysisResult, chunk_result, to_model
+from database.repositories.job_store import InMemoryJobStore, JobStore, SQLiteJobStore
+
+
+def create_job_store() -> JobStore:
+    """Build the job store selected in settings"""
+    if settings.job_store_backend == "sqlite":
+        return SQLiteJobStore(settings.job_store_dir, BatchJob, ChunkResult)
+    if settings.job_store_backend != "memory":
+        raise ValueError(f"Unknown job store backend: {settings.job_store_backend}")
+    return InMemoryJobStore(settings.job_store_max_finished_jobs)
+
+
+class BatchJobManager:
+    """Submit batch jobs and process them in the background on the optimizer's executor
+    
+    Store calls and result validation run in worker threads so a large job
+    never blocks the event loop.
+    """
+    
+    def __init__(self, optimizer: Optimizer, store: Optional[JobStore] = None):
+        self.optimizer = optimizer
+        self.store = store or create_job_store()
+        self._tasks: Dict[str, asyncio.Task] = {}
+    
+    async def submit(
+        self,
+        batch_id: str,
+        items: List[BatchItem],
+        options: Optional[AnalysisOptions] = None,
+        domain: str = "default"
+    ) -> BatchJob:
+        """Register a job and start processing it without waiting for results"""
+        job = BatchJob(
+            job_id=str(uuid.uuid4()),
+            batch_id=batch_id,
+            total=len(items),
+            created_at=datetime.utcnow()
+        )
+        await asyncio.to_thread(self.store.create, job)
+        
+        task = asyncio.create_task(self._run(job, items, options or AnalysisOptions(), domain))
+        self._tasks[job.job_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job.job_id, None))
+        
+        # The running task keeps mutating its own copy
+        return job.model_copy()
+    
+    async def get(self, job_id: str) -> Optional[BatchJob]:
+        """Return job progress"""
+        return await asyncio.to_thread(self.store.get, job_id)
+    
+    async def get_results(self, job_id: str, offset: int = 0, limit: int = 100) -> Optional[BatchJobResultsPage]:
+        """Return a page of completed item results"""
+        return await asyncio.to_thread(self._results_page, job_id, offset, limit)
+    
+    def _results_page(self, job_id: str, offset: int, limit: int) -> Optional[BatchJobResultsPage]:
+        job = self.store.get(job_id)
+        if job is None:
+            return None
+        
+        results = self.store.get_results(job_id, offset, limit)
+        next_offset = offset + len(results)
+        
+        return BatchJobResultsPage(
+            job_id=job_id,
+            results=results,
+            offset=offset,
+            limit=limit,
+            processed=job.processed,
+            next_offset=next_offset if next_offset < job.total else None
+        )
+    
+    async def delete(self, job_id: str) -> bool:
+        """Stop a running job, then forget it and its results"""
+        task = self._tasks.get(job_id)
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        return await asyncio.to_thread(self.store.delete, job_id)
+    
+    async def _run(
+        self,
+        job: BatchJob,
+        items: List[BatchItem],
+        options: AnalysisOptions,
+        domain: str
+    ):
+        job.status = "running"
+        await asyncio.to_thread(self.store.update, job)
+        
+        try:
+            async for results in self.optimizer.analyze_batch_stream(
+                job.batch_id,
+                items,
+                options,
+                domain
+            ):
+                job.processed += len(results)
+                await asyncio.to_thread(self._store_results, job.model_copy(), results)
+            
+            job.status = "completed"
+        except Exception as e:
+            logger.error(f"Batch job {job.job_id} failed: {e}")
+            job.status = "failed"
+            job.error = str(e)
+        
+        job.finished_at = datetime.utcnow()
+        await asyncio.to_thread(self.store.update, job)
+    
+    def _store_results(self, job: BatchJob, results: List[AnalysisResult]):
+        self.store.append_results(job.job_id, [
+            to_model(chunk_result(metrics, optimizations), ChunkResult)
+            for metrics, optimizations in results
+        ])
+        self.store.update(job)
+    
+    async def aclose(self):
+        """Cancel running jobs and close the store"""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.store.close()
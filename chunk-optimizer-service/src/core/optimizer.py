@@ -1,41 +1,139 @@
 """Optimization engine"""
-import uuid
 import asyncio
+import uuid
+import struct
+import threading
+import time
+from array import array
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from functools import lru_cache
+from typing import List, Optional, Dict, Any, AsyncIterator, Tuple
 from loguru import logger
 
-from api.rest.schemas import (
-    Optimization,
-    Metrics,
-    Chunk,
-    AnalysisOptions,
-    OptimizationResponse,
-    OptimizationListResponse,
-    BatchOptimizationResponse,
-    BatchItem
+from api.rest.schemas import Chunk, AnalysisOptions, BatchItem
+from algorithms import ALGORITHM_VERSION
+from algorithms.segmentation import CJKSegmenter
+from algorithms.text_profile import TextProfile
+from config.domain_config import DomainConfig
+from config.settings import settings
+from core.executor import AnalysisExecutor
+from core.profiling import ACTIVE_PROFILE, RequestProfile
+from core.records import (
+    AnalysisResult,
+    BatchOptimizationRecord,
+    MetricsRecord,
+    OptimizationListRecord,
+    OptimizationRecord,
+    OptimizationResponseRecord
+)
+from core.pipeline import (
+    ALL_METRICS,
+    MINHASHER,
+    NOT_COMPUTED,
+    AnalysisPipeline,
+    Priorities,
+    Scores,
+    get_domain_pipeline,
+    get_pipeline,
+    metric_names,
+    requested_metrics,
+    scores_mask
 )
-from algorithms.quality_analyzer import QualityAnalyzer
-from algorithms.redundancy_detector import RedundancyDetector
-from algorithms.size_analyzer import SizeAnalyzer
-from algorithms.similarity_calculator import SimilarityCalculator
-from config.domain_config import (
-    get_domain_config,
-    calculate_overall_score,
-    get_optimization_priority,
-    DomainConfig
+from database.repositories.similarity_index import SimilarityIndex
+from utils.cache import BoundedCache, content_digest
+from utils.result_cache import TieredResultCache
+from utils.telemetry import (
+    BATCH_SCORE_STAGE,
+    CHUNK_SIZE_ALL,
+    OPTIMIZATION_STAGE,
+    SIGNATURE_STAGE,
+    SIMILARITY_INDEX_STAGE,
+    TOKENIZE_STAGE,
+    cache_lookups,
+    drain_worker_metrics,
+    merge_worker_metrics
 )
 
+# Cache key tag for MinHash signatures, which depend on content and stop words only
+SIGNATURE_CACHE_TAG = b"minhash"
+
+# Compact binary encoding of the five metric scores in the shared result cache
+SCORES_STRUCT = struct.Struct("<5d")
+
+# Bumped when the meaning of result cache entries changes; entries of format 2
+# may hold NaN for metrics that were not requested yet
+RESULT_CACHE_FORMAT = 2
+
+METRICS_CACHE_HIT, METRICS_CACHE_MISS = cache_lookups("metrics")
+SIGNATURE_CACHE_HIT, SIGNATURE_CACHE_MISS = cache_lookups("signature")
+RESULT_CACHE_HIT, RESULT_CACHE_MISS = cache_lookups("result")
+
 
 class Optimizer:
     """Chunk optimization engine with caching and async support"""
     
-    def __init__(self):
-        self.quality_analyzer = QualityAnalyzer()
-        self.redundancy_detector = RedundancyDetector()
-        self.size_analyzer = SizeAnalyzer()
-        self.similarity_calculator = SimilarityCalculator()
+    def __init__(self, executor: Optional[AnalysisExecutor] = None, index_similarity: bool = True):
+        # Guards lazy creation of shared resources; analysis itself holds no mutable state
+        self._lock = threading.Lock()
+        self._executor = executor
+        # Executor workers leave the similarity index to the parent process
+        self.index_similarity = index_similarity
+        self._similarity_index: Optional[SimilarityIndex] = None
+        self.metrics_cache = BoundedCache(
+            max_entries=settings.metrics_cache_max_entries,
+            max_bytes=settings.metrics_cache_max_bytes
+        )
+        self._result_cache: Optional[TieredResultCache] = None
+    
+    @property
+    def executor(self) -> AnalysisExecutor:
+        """Executor running document and batch analysis, created on first use"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = AnalysisExecutor(
+                    max_workers=settings.analysis_workers,
+                    shard_size=settings.analysis_shard_size
+                )
+            return self._executor
+    
+    @property
+    def similarity_index(self) -> Optional[SimilarityIndex]:
+        """Near-duplicate index, opened on first use when enabled"""
+        if self._similarity_index is None and self.index_similarity and settings.similarity_index_enabled:
+            with self._lock:
+                if self._similarity_index is None:
+                    self._similarity_index = SimilarityIndex(settings.similarity_index_dir, MINHASHER)
+        return self._similarity_index
+    
+    @property
+    def result_cache(self) -> TieredResultCache:
+        """Request-level result cache shared by all executor workers, with optional Redis tier"""
+        if self._result_cache is None:
+            self._result_cache = TieredResultCache.from_url(
+                BoundedCache(
+                    max_entries=settings.result_cache_max_entries,
+                    max_bytes=settings.result_cache_max_bytes
+                ),
+                settings.redis_url if settings.result_cache_redis_enabled else None,
+                connect_timeout=settings.result_cache_redis_connect_timeout,
+                timeout=settings.result_cache_redis_timeout,
+                ttl=settings.result_cache_ttl
+            )
+        return self._result_cache
+    
+    async def aclose(self):
+        """Release executor, index and cache resources"""
+        self.shutdown()
+        if self._result_cache is not None:
+            await self._result_cache.close()
+            self._result_cache = None
+    
+    def shutdown(self):
+        """Release executor and index resources"""
+        if self._executor is not None:
+            self._executor.shutdown()
+        if self._similarity_index is not None:
+            self._similarity_index.close()
+            self._similarity_index = None
     
     async def analyze_chunk(
         self,
@@ -43,66 +141,120 @@ class Optimizer:
         content: str,
         metadata: Optional[Dict[str, Any]] = None,
         domain: str = "default"
-    ) -> OptimizationResponse:
+    ) -> OptimizationResponseRecord:
         """Analyze a single chunk"""
         logger.info(f"Analyzing chunk: {chunk_id} with domain: {domain}")
         
-        config = get_domain_config(domain)
+        pipeline = get_domain_pipeline(domain)
+        CHUNK_SIZE_ALL.observe(len(content))
+        created_at = datetime.utcnow()
+        
+        profile = ACTIVE_PROFILE.get()
+        if profile is not None:
+            metrics, optimizations = (
+                await self._analyze_profiled([(chunk_id, content)], pipeline, AnalysisOptions(), profile, created_at)
+            )[0]
+            return OptimizationResponseRecord(
+                optimizations[0] if optimizations else self._create_empty_optimization(chunk_id, created_at),
+                metrics
+            )
         
-        # Update analyzers with domain config
-        self._update_analyzers_config(config)
+        digest = content_digest(content)
+        key = self._result_cache_key(domain, pipeline, digest)
+        blob = (await self.result_cache.get_many([key]))[0]
+        cached = SCORES_STRUCT.unpack(blob) if blob is not None else None
+        covered = self._covers(cached, ALL_METRICS)
+        (RESULT_CACHE_HIT if covered else RESULT_CACHE_MISS).inc()
         
-        metrics = self._calculate_metrics(chunk_id, content, config)
-        optimizations = self._generate_optimizations(
+        metrics, optimizations = self._analyze_content(
             chunk_id,
             content,
-            metrics,
-            config,
-            AnalysisOptions()
+            pipeline,
+            AnalysisOptions(),
+            digest,
+            cached,
+            created_at=created_at
         )
         
-        return OptimizationResponse(
-            optimization=optimizations[0] if optimizations else self._create_empty_optimization(chunk_id),
-            metrics=metrics
+        if not covered:
+            await self.result_cache.set_many({key: self._encode_scores(pipeline, metrics, cached)})
+        
+        return OptimizationResponseRecord(
+            optimizations[0] if optimizations else self._create_empty_optimization(chunk_id, created_at),
+            metrics
         )
     
+    async def analyze_chunks(
+        self,
+        chunks: List[Chunk],
+        domain: str = "default"
+    ) -> List[OptimizationResponseRecord]:
+        """Analyze independent chunks in one pass, answering each as ``analyze_chunk`` would"""
+        logger.info(f"Analyzing {len(chunks)} chunks with domain: {domain}")
+        
+        created_at = datetime.utcnow()
+        results = await self.analyze_many(
+            [(chunk.chunk_id, chunk.content) for chunk in chunks],
+            domain,
+            created_at=created_at
+        )
+        
+        return [
+            OptimizationResponseRecord(
+                optimizations[0] if optimizations else self._create_empty_optimization(metrics.chunk_id, created_at),
+                metrics
+            )
+            for metrics, optimizations in results
+        ]
+    
     async def analyze_document(
         self,
         document_id: str,
         chunks: List[Chunk],
         options: Optional[AnalysisOptions] = None,
         domain: str = "default"
-    ) -> OptimizationListResponse:
-        """Analyze all chunks in a document with concurrent processing"""
+    ) -> OptimizationListRecord:
+        """Analyze all chunks in a document in parallel on the executor"""
         logger.info(f"Analyzing document: {document_id} with {len(chunks)} chunks and domain: {domain}")
         
         options = options or AnalysisOptions()
-        config = get_domain_config(domain)
         
-        # Update analyzers with domain config
-        self._update_analyzers_config(config)
-        
-        # Process chunks concurrently
-        tasks = [
-            self._analyze_chunk_async(chunk, config, options)
-            for chunk in chunks
-        ]
-        results = await asyncio.gather(*tasks)
+        results = await self.analyze_many(
+            [(chunk.chunk_id, chunk.content) for chunk in chunks],
+            domain,
+            options
+        )
         
         all_optimizations = []
         high_priority_count = 0
         
-        for optimizations in results:
+        for _, optimizations in results:
             for opt in optimizations:
-                if opt.priority == "high":
+                if opt.priority == "HIGH":
                     high_priority_count += 1
                 all_optimizations.append(opt)
         
-        return OptimizationListResponse(
-            optimizations=all_optimizations,
-            total=len(all_optimizations),
-            high_priority=high_priority_count
-        )
+        return OptimizationListRecord(all_optimizations, len(all_optimizations), high_priority_count)
+    
+    async def analyze_document_stream(
+        self,
+        document_id: str,
+        chunks: List[Chunk],
+        options: Optional[AnalysisOptions] = None,
+        domain: str = "default"
+    ) -> AsyncIterator[AnalysisResult]:
+        """Yield (metrics, optimizations) per chunk in order as soon as each is computed"""
+        logger.info(f"Streaming document analysis: {document_id} with {len(chunks)} chunks and domain: {domain}")
+        
+        options = options or AnalysisOptions()
+        
+        async for results in self._iter_analysis(
+            [(chunk.chunk_id, chunk.content) for chunk in chunks],
+            domain,
+            options
+        ):
+            for result in results:
+                yield result
     
     async def analyze_batch(
         self,
@@ -110,122 +262,474 @@ class Optimizer:
         items: List[BatchItem],
         options: Optional[AnalysisOptions] = None,
         domain: str = "default"
-    ) -> BatchOptimizationResponse:
-        """Batch analyze chunks with concurrent processing"""
+    ) -> BatchOptimizationRecord:
+        """Batch analyze chunks in parallel on the executor"""
         logger.info(f"Analyzing batch: {batch_id} with {len(items)} items and domain: {domain}")
         
         options = options or AnalysisOptions()
-        config = get_domain_config(domain)
         
-        # Update analyzers with domain config
-        self._update_analyzers_config(config)
+        analyzed = await self.analyze_many(
+            [(item.chunk_id, item.content) for item in items],
+            domain,
+            options
+        )
+        
+        if not analyzed:
+            return BatchOptimizationRecord(batch_id, "", None, 0, len(items))
         
-        # Process items concurrently
-        tasks = [
-            self._analyze_batch_item_async(batch_id, item, config, options, idx)
-            for idx, item in enumerate(items)
-        ]
-        results = await asyncio.gather(*tasks)
-        
-        return results[0] if results else BatchOptimizationResponse(
-            batch_id=batch_id,
-            item_id="",
-            optimization=None,
-            processed=0,
-            total=len(items)
+        _, optimizations = analyzed[0]
+        return BatchOptimizationRecord(
+            batch_id,
+            items[0].chunk_id,
+            optimizations[0] if optimizations else None,
+            1,
+            len(items)
         )
     
-    def _update_analyzers_config(self, config: DomainConfig):
-        """Update all analyzers with domain configuration"""
-        self.quality_analyzer = QualityAnalyzer(config)
-        self.size_analyzer = SizeAnalyzer(config)
-    
-    @lru_cache(maxsize=1000)
-    def _calculate_metrics(self, chunk_id: str, content: str, config: DomainConfig) -> Metrics:
-        """Calculate quality metrics for a chunk using domain configuration with caching"""
-        quality_score = self.quality_analyzer.analyze(content)
-        redundancy_score = self.redundancy_detector.analyze(content)
-        size_score = self.size_analyzer.analyze(content)
-        similarity_score = self.similarity_calculator.analyze(content)
-        
-        overall_score = calculate_overall_score(
-            quality_score,
-            redundancy_score,
-            size_score,
-            similarity_score,
-            config
-        )
+    async def analyze_many(
+        self,
+        chunks: List[Tuple[str, str]],
+        domain: str = "default",
+        options: Optional[AnalysisOptions] = None,
+        created_at: Optional[datetime] = None
+    ) -> List[AnalysisResult]:
+        """Analyze (chunk_id, content) pairs on the executor, reusing cached scores"""
+        results = []
+        async for shard_results in self._iter_analysis(chunks, domain, options or AnalysisOptions(), created_at):
+            results.extend(shard_results)
+        return results
+    
+    async def _iter_analysis(
+        self,
+        chunks: List[Tuple[str, str]],
+        domain: str,
+        options: AnalysisOptions,
+        created_at: Optional[datetime] = None
+    ) -> AsyncIterator[List[AnalysisResult]]:
+        """Yield analysis results shard by shard, in chunk order, as the executor finishes them"""
+        pipeline = get_domain_pipeline(domain)
+        # Every optimization of a request shares one timestamp
+        created_at = created_at or datetime.utcnow()
         
-        return Metrics(
-            chunk_id=chunk_id,
-            quality_score=quality_score,
-            redundancy_score=redundancy_score,
-            size_score=size_score,
-            similarity_score=similarity_score,
-            overall_score=overall_score
+        profile = ACTIVE_PROFILE.get()
+        if profile is not None:
+            yield await self._analyze_profiled(chunks, pipeline, options, profile, created_at)
+            return
+        
+        digests = [content_digest(content) for _, content in chunks]
+        keys = [self._result_cache_key(domain, pipeline, digest) for digest in digests]
+        
+        # One lookup for the whole request; hits skip scoring in the workers,
+        # partial hits only compute the requested metrics they lack
+        metrics_requested = requested_metrics(options)
+        cached = [
+            SCORES_STRUCT.unpack(blob) if blob is not None else None
+            for blob in await self.result_cache.get_many(keys)
+        ]
+        covered = [self._covers(scores, metrics_requested) for scores in cached]
+        hits = sum(covered)
+        RESULT_CACHE_HIT.inc(hits)
+        RESULT_CACHE_MISS.inc(len(cached) - hits)
+        
+        sizes = [len(content) for _, content in chunks]
+        for size in sizes:
+            CHUNK_SIZE_ALL.observe(size)
+        
+        async for start, end, (results, signatures, worker_metrics) in self.executor.iter_shards(
+            _analyze_shard,
+            [
+                (chunk_id, content, digest, scores)
+                for (chunk_id, content), digest, scores in zip(chunks, digests, cached)
+            ],
+            sizes,
+            # Workers score with this exact config even if the domain is reloaded meanwhile
+            pipeline.config,
+            options,
+            created_at
+        ):
+            merge_worker_metrics(worker_metrics)
+            if signatures is not None and self.similarity_index is not None:
+                # Shards arrive in chunk order, so each chunk sees the earlier chunks of its request
+                results = await asyncio.to_thread(self._add_related_chunks, results, signatures, options, created_at)
+            await self.result_cache.set_many({
+                key: self._encode_scores(pipeline, metrics, scores)
+                for key, scores, hit, (metrics, _) in zip(
+                    keys[start:end],
+                    cached[start:end],
+                    covered[start:end],
+                    results
+                )
+                if not hit
+            })
+            yield results
+    
+    async def _analyze_profiled(
+        self,
+        chunks: List[Tuple[str, str]],
+        pipeline: AnalysisPipeline,
+        options: AnalysisOptions,
+        profile: RequestProfile,
+        created_at: datetime
+    ) -> List[AnalysisResult]:
+        """Analyze chunks one by one in a thread, bypassing cached scores, for a profiled request"""
+        def analyze() -> List[AnalysisResult]:
+            results = []
+            with profile.capture():
+                for chunk_id, content in chunks:
+                    profile.start_chunk(chunk_id)
+                    text_profile = self._tokenize(content)
+                    results.append(self._analyze_content(
+                        chunk_id,
+                        content,
+                        pipeline,
+                        options,
+                        scores=pipeline.score(text_profile, requested_metrics(options)),
+                        profile=text_profile,
+                        created_at=created_at
+                    ))
+                    profile.end_chunk(chunk_id)
+            return results
+        
+        # to_thread copies the context, so the analysis sees the active profile
+        return await asyncio.to_thread(analyze)
+    
+    @staticmethod
+    def _result_cache_key(domain: str, pipeline: AnalysisPipeline, digest: bytes) -> str:
+        """Shared cache key from algorithm version, domain, config and content digest"""
+        return (
+            f"chunkopt:{ALGORITHM_VERSION}.{RESULT_CACHE_FORMAT}:{domain}:"
+            f"{pipeline.fingerprint.hex()}:{digest.hex()}"
         )
     
-    async def _analyze_chunk_async(
+    @staticmethod
+    def _covers(scores: Optional[Scores], metrics: int) -> bool:
+        """Whether cached scores hold every requested metric"""
+        return scores is not None and scores_mask(scores) & metrics == metrics
+    
+    @staticmethod
+    def _metrics_scores(metrics: MetricsRecord) -> Scores:
+        """Scores of a Metrics, NaN for metrics that were not computed"""
+        return tuple(
+            NOT_COMPUTED if value is None else value
+            for value in (
+                metrics.quality_score,
+                metrics.redundancy_score,
+                metrics.size_score,
+                metrics.similarity_score,
+                metrics.overall_score
+            )
+        )
+    
+    @classmethod
+    def _encode_scores(cls, pipeline: AnalysisPipeline, metrics: MetricsRecord, cached: Optional[Scores] = None) -> bytes:
+        """Cache entry of the returned metrics plus any other metrics already cached"""
+        scores = cls._metrics_scores(metrics)
+        if cached is not None:
+            scores = pipeline.merge(scores, cached)
+        return SCORES_STRUCT.pack(*scores)
+    
+    async def analyze_batch_stream(
         self,
-        chunk: Chunk,
-        config: DomainConfig,
-        options: AnalysisOptions
-    ) -> List[Optimization]:
-        """Analyze a single chunk asynchronously"""
-        metrics = self._calculate_metrics(chunk.chunk_id, chunk.content, config)
-        return self._generate_optimizations(
-            chunk.chunk_id,
-            chunk.content,
-            metrics,
-            config,
+        batch_id: str,
+        items: List[BatchItem],
+        options: Optional[AnalysisOptions] = None,
+        domain: str = "default"
+    ) -> AsyncIterator[List[AnalysisResult]]:
+        """Yield batch item results shard by shard, in item order"""
+        logger.info(f"Streaming batch analysis: {batch_id} with {len(items)} items and domain: {domain}")
+        
+        options = options or AnalysisOptions()
+        
+        async for results in self._iter_analysis(
+            [(item.chunk_id, item.content) for item in items],
+            domain,
             options
+        ):
+            yield results
+    
+    def _calculate_metrics(
+        self,
+        chunk_id: str,
+        content: str,
+        pipeline: AnalysisPipeline,
+        digest: Optional[bytes] = None,
+        profile: Optional[TextProfile] = None,
+        scores: Optional[Scores] = None,
+        metrics: int = ALL_METRICS
+    ) -> MetricsRecord:
+        """Calculate the requested metrics for a chunk, cached by content digest and config
+        
+        Cache entries may hold only some metrics; missing requested ones are
+        computed and added to the entry.
+        """
+        key = (digest or content_digest(content), pipeline.fingerprint)
+        if not self._covers(scores, metrics):
+            cached = self.metrics_cache.get(key)
+            if cached is not None:
+                scores = pipeline.merge(scores, cached) if scores is not None else cached
+            
+            if self._covers(scores, metrics):
+                METRICS_CACHE_HIT.inc()
+            else:
+                METRICS_CACHE_MISS.inc()
+                # Tokenize once and share the profile across all analyzers
+                scores = pipeline.score(profile or self._tokenize(content), metrics, scores)
+                self.metrics_cache.put(key, scores)
+        
+        return self._metrics_record(chunk_id, pipeline.project(scores, metrics), metrics)
+    
+    @staticmethod
+    def _metrics_record(chunk_id: str, scores: Scores, metrics: int) -> MetricsRecord:
+        """Response metrics, with null for metrics that were not computed"""
+        return MetricsRecord(
+            chunk_id,
+            *(None if value != value else float(value) for value in scores),
+            metric_names(metrics)
         )
     
-    async def _analyze_batch_item_async(
+    def _analyze_content(
         self,
-        batch_id: str,
-        item: BatchItem,
-        config: DomainConfig,
+        chunk_id: str,
+        content: str,
+        pipeline: AnalysisPipeline,
         options: AnalysisOptions,
-        idx: int
-    ) -> BatchOptimizationResponse:
-        """Analyze a batch item asynchronously"""
-        metrics = self._calculate_metrics(item.chunk_id, item.content, config)
+        digest: Optional[bytes] = None,
+        scores: Optional[Scores] = None,
+        profile: Optional[TextProfile] = None,
+        priorities: Optional[Priorities] = None,
+        created_at: Optional[datetime] = None
+    ) -> AnalysisResult:
+        """Calculate metrics and optimizations for a single chunk"""
+        digest = digest or content_digest(content)
+        signature = None
+        signature_seconds = 0.0
+        
+        if options.check_similarity and self.similarity_index is not None:
+            signature, signature_seconds, profile = self._signature(content, digest, pipeline, profile)
+        
+        metrics = self._calculate_metrics(
+            chunk_id,
+            content,
+            pipeline,
+            digest,
+            profile,
+            scores,
+            requested_metrics(options)
+        )
+        start = time.perf_counter()
+        related_chunks = (
+            self._find_related_chunks(chunk_id, signature, options)
+            if signature is not None else []
+        )
+        related_done = time.perf_counter()
         optimizations = self._generate_optimizations(
-            item.chunk_id,
-            item.content,
+            chunk_id,
+            content,
             metrics,
-            config,
-            options
+            pipeline,
+            options,
+            related_chunks,
+            priorities,
+            created_at,
+            profile
         )
+        optimizations_done = time.perf_counter()
         
-        return BatchOptimizationResponse(
-            batch_id=batch_id,
-            item_id=item.chunk_id,
-            optimization=optimizations[0] if optimizations else None,
-            processed=idx + 1,
-            total=0  # Will be updated by caller
-        )
+        if signature is not None:
+            SIMILARITY_INDEX_STAGE.observe(related_done - start)
+        OPTIMIZATION_STAGE.observe(optimizations_done - related_done)
+        
+        active_profile = ACTIVE_PROFILE.get()
+        if active_profile is not None:
+            active_profile.record(
+                signature=signature_seconds,
+                similarity_index=related_done - start,
+                optimization=optimizations_done - related_done
+            )
+        return metrics, optimizations
+    
+    def _analyze_items(
+        self,
+        items: List[Tuple[str, str, bytes, Optional[Scores]]],
+        pipeline: AnalysisPipeline,
+        options: AnalysisOptions,
+        created_at: Optional[datetime] = None
+    ) -> List[AnalysisResult]:
+        """Analyze (chunk_id, content, digest, cached scores) items, scoring uncached ones in one vectorized pass"""
+        created_at = created_at or datetime.utcnow()
+        batch_scorer = pipeline.batch_scorer
+        if batch_scorer is None:
+            return [
+                self._analyze_content(chunk_id, content, pipeline, options, digest, scores, created_at=created_at)
+                for chunk_id, content, digest, scores in items
+            ]
+        
+        metrics = requested_metrics(options)
+        fingerprint = pipeline.fingerprint
+        scores: List[Optional[Scores]] = []
+        lookups = 0
+        for _, _, digest, cached in items:
+            if not self._covers(cached, metrics):
+                lookups += 1
+                entry = self.metrics_cache.get((digest, fingerprint))
+                if entry is not None:
+                    cached = pipeline.merge(cached, entry) if cached is not None else entry
+            scores.append(cached)
+        profiles: List[Optional[TextProfile]] = [None] * len(items)
+        
+        missing = [idx for idx, item_scores in enumerate(scores) if not self._covers(item_scores, metrics)]
+        METRICS_CACHE_HIT.inc(lookups - len(missing))
+        METRICS_CACHE_MISS.inc(len(missing))
+        
+        if missing:
+            for idx in missing:
+                profiles[idx] = self._tokenize(items[idx][1])
+            
+            # Vectorized scoring has no per-analyzer split; record its per-chunk share
+            start = time.perf_counter()
+            needed = [metrics & ~scores_mask(scores[idx]) for idx in missing]
+            features = [
+                batch_scorer.features(profiles[idx], item_needed)
+                for idx, item_needed in zip(missing, needed)
+            ]
+            rows = batch_scorer.score(features, pipeline.config).tolist()
+            BATCH_SCORE_STAGE.observe((time.perf_counter() - start) / len(missing), len(missing))
+            
+            for idx, item_needed, row in zip(missing, needed, rows):
+                computed = pipeline.project(tuple(row), item_needed)
+                if scores[idx] is not None:
+                    computed = pipeline.merge(computed, scores[idx])
+                scores[idx] = computed
+                self.metrics_cache.put((items[idx][2], fingerprint), computed)
+        
+        priorities = batch_scorer.priorities(scores, pipeline.config)
+        
+        return [
+            self._analyze_content(
+                chunk_id,
+                content,
+                pipeline,
+                options,
+                digest,
+                item_scores,
+                profile,
+                item_priorities,
+                created_at
+            )
+            for (chunk_id, content, digest, _), item_scores, profile, item_priorities
+            in zip(items, scores, profiles, priorities)
+        ]
+    
+    @staticmethod
+    def _tokenize(content: str) -> TextProfile:
+        start = time.perf_counter()
+        profile = TextProfile.from_text(content)
+        elapsed = time.perf_counter() - start
+        TOKENIZE_STAGE.observe(elapsed)
+        
+        active_profile = ACTIVE_PROFILE.get()
+        if active_profile is not None:
+            active_profile.record(tokenize=elapsed)
+        return profile
+    
+    def _signature(
+        self,
+        content: str,
+        digest: bytes,
+        pipeline: AnalysisPipeline,
+        profile: Optional[TextProfile] = None
+    ) -> Tuple[Tuple[int, ...], float, Optional[TextProfile]]:
+        """MinHash signature of a chunk, the seconds spent computing it and the profile
+        
+        The profile is tokenized on a signature cache miss, so metric calculation
+        can share it.
+        """
+        # Signatures skip stop words, so they depend on the stop-word lexicon too
+        signature_key = (digest, SIGNATURE_CACHE_TAG, pipeline.similarity_calculator.stop_words.fingerprint)
+        cached = self.metrics_cache.get(signature_key)
+        if cached is not None:
+            SIGNATURE_CACHE_HIT.inc()
+            return tuple(cached), 0.0, profile
+        
+        SIGNATURE_CACHE_MISS.inc()
+        profile = profile or self._tokenize(content)
+        start = time.perf_counter()
+        signature = pipeline.similarity_calculator.signature(profile)
+        elapsed = time.perf_counter() - start
+        SIGNATURE_STAGE.observe(elapsed)
+        self.metrics_cache.put(signature_key, array("Q", signature))
+        return signature, elapsed, profile
+    
+    def _add_related_chunks(
+        self,
+        results: List[AnalysisResult],
+        signatures: List[Tuple[int, ...]],
+        options: AnalysisOptions,
+        created_at: datetime
+    ) -> List[AnalysisResult]:
+        """Fill in related chunks of worker results from this process's similarity index, in order"""
+        updated = []
+        for (metrics, optimizations), signature in zip(results, signatures):
+            start = time.perf_counter()
+            related_chunks = self._find_related_chunks(metrics.chunk_id, signature, options)
+            SIMILARITY_INDEX_STAGE.observe(time.perf_counter() - start)
+            if not related_chunks:
+                updated.append((metrics, optimizations))
+                continue
+            
+            similarity = next((idx for idx, opt in enumerate(optimizations) if opt.type == "similarity"), None)
+            optimizations = list(optimizations)
+            if similarity is None:
+                optimizations.append(
+                    self._near_duplicate_optimization(metrics.chunk_id, related_chunks, options, created_at)
+                )
+            else:
+                optimizations[similarity] = optimizations[similarity]._replace(related_chunks=related_chunks)
+            updated.append((metrics, optimizations))
+        return updated
+    
+    def _find_related_chunks(
+        self,
+        chunk_id: str,
+        signature: Tuple[int, ...],
+        options: AnalysisOptions
+    ) -> List[str]:
+        """Look up near-duplicates of a chunk in the index, then index the chunk itself"""
+        index = self.similarity_index
+        matches = index.query(signature, options.similarity_threshold, exclude=chunk_id)
+        index.add(chunk_id, signature)
+        
+        return [related_id for related_id, _ in matches]
     
     def _generate_optimizations(
         self,
         chunk_id: str,
         content: str,
-        metrics: Metrics,
-        config: DomainConfig,
-        options: Optional[AnalysisOptions] = None
-    ) -> List[Optimization]:
-        """Generate optimization suggestions based on metrics using domain configuration"""
+        metrics: MetricsRecord,
+        pipeline: AnalysisPipeline,
+        options: Optional[AnalysisOptions] = None,
+        related_chunks: Optional[List[str]] = None,
+        priorities: Optional[Priorities] = None,
+        created_at: Optional[datetime] = None,
+        profile: Optional[TextProfile] = None
+    ) -> List[OptimizationRecord]:
+        """Generate optimization suggestions based on metrics using domain configuration
+        
+        ``profile`` is the chunk's tokenization when scoring already built it,
+        so repeated spans reuse its words and suffix structure.
+        """
+        config = pipeline.config
         options = options or AnalysisOptions()
+        created_at = created_at or datetime.utcnow()
         optimizations = []
+        quality_priority, redundancy_priority, size_priority, similarity_priority = (
+            priorities or pipeline.priorities(self._metrics_scores(metrics))
+        )
         
         if options.check_quality:
-            priority = get_optimization_priority(
-                metrics.quality_score,
-                config.quality_threshold
-            )
+            priority = quality_priority
             if priority in ["HIGH", "MEDIUM"]:
-                optimizations.append(Optimization(
+                optimizations.append(OptimizationRecord(
                     id=str(uuid.uuid4()),
                     chunk_id=chunk_id,
                     type="quality",
@@ -233,34 +737,39 @@ class Optimizer:
                     title="Chunk quality needs improvement",
                     description=f"Quality score is {metrics.quality_score:.2f}, which is below recommended threshold of {config.quality_threshold}",
                     suggested_action="Review and rewrite the chunk to improve clarity, coherence, and completeness",
-                    created_at=datetime.utcnow()
+                    related_chunks=[],
+                    created_at=created_at
                 ))
         
         if options.check_redundancy:
-            priority = get_optimization_priority(
-                metrics.redundancy_score,
-                config.redundancy_threshold,
-                high_threshold=config.redundancy_threshold * 1.2
-            )
+            priority = redundancy_priority
             if priority in ["HIGH", "MEDIUM"]:
-                optimizations.append(Optimization(
+                description = f"Redundancy score is {metrics.redundancy_score:.2f}, indicating significant repetitive content"
+                profile = TextProfile.coerce(profile or content)
+                spans = pipeline.redundancy_detector.find_repeated_spans(profile, limit=1)
+                if spans:
+                    unit = "character" if profile.script == CJKSegmenter.script else "word"
+                    offsets = ", ".join(str(offset) for offset, _, _ in spans)
+                    _, length, passage = spans[0]
+                    if len(passage) > 120:
+                        passage = passage[:117] + "..."
+                    description += f"; longest repeated passage ({length} {unit}s, at {unit} offsets {offsets}): \"{passage}\""
+                optimizations.append(OptimizationRecord(
                     id=str(uuid.uuid4()),
                     chunk_id=chunk_id,
                     type="redundancy",
                     priority=priority,
                     title="Redundant content detected",
-                    description=f"Redundancy score is {metrics.redundancy_score:.2f}, indicating significant repetitive content",
+                    description=description,
                     suggested_action="Remove or consolidate redundant information to improve efficiency",
-                    created_at=datetime.utcnow()
+                    related_chunks=[],
+                    created_at=created_at
                 ))
         
         if options.check_size:
-            priority = get_optimization_priority(
-                metrics.size_score,
-                config.size_threshold
-            )
+            priority = size_priority
             if priority in ["HIGH", "MEDIUM"]:
-                optimizations.append(Optimization(
+                optimizations.append(OptimizationRecord(
                     id=str(uuid.uuid4()),
                     chunk_id=chunk_id,
                     type="size",
@@ -268,17 +777,14 @@ class Optimizer:
                     title="Chunk size is suboptimal",
                     description=f"Size score is {metrics.size_score:.2f}, indicating that chunk may be too short or too long",
                     suggested_action=f"Adjust chunk size to optimal range ({config.optimal_length[0]}-{config.optimal_length[1]} characters)",
-                    created_at=datetime.utcnow()
+                    related_chunks=[],
+                    created_at=created_at
                 ))
         
         if options.check_similarity:
-            priority = get_optimization_priority(
-                metrics.similarity_score,
-                config.similarity_threshold,
-                high_threshold=config.similarity_threshold * 1.1
-            )
+            priority = similarity_priority
             if priority in ["HIGH", "MEDIUM"]:
-                optimizations.append(Optimization(
+                optimizations.append(OptimizationRecord(
                     id=str(uuid.uuid4()),
                     chunk_id=chunk_id,
                     type="similarity",
@@ -286,14 +792,39 @@ class Optimizer:
                     title="Highly similar content detected",
                     description=f"Similarity score is {metrics.similarity_score:.2f}, indicating potential duplicate content",
                     suggested_action="Review and merge with similar chunks to avoid redundancy",
-                    created_at=datetime.utcnow()
+                    related_chunks=list(related_chunks or []),
+                    created_at=created_at
                 ))
+            elif related_chunks:
+                optimizations.append(
+                    self._near_duplicate_optimization(chunk_id, related_chunks, options, created_at)
+                )
         
         return optimizations
     
-    def _create_empty_optimization(self, chunk_id: str) -> Optimization:
+    @staticmethod
+    def _near_duplicate_optimization(
+        chunk_id: str,
+        related_chunks: List[str],
+        options: AnalysisOptions,
+        created_at: datetime
+    ) -> OptimizationRecord:
+        """Optimization listing indexed near-duplicates of a chunk that scored as dissimilar"""
+        return OptimizationRecord(
+            id=str(uuid.uuid4()),
+            chunk_id=chunk_id,
+            type="similarity",
+            priority="MEDIUM",
+            title="Near-duplicate chunks detected",
+            description=f"Found {len(related_chunks)} indexed chunks with estimated similarity of at least {options.similarity_threshold}",
+            suggested_action="Review and merge with similar chunks to avoid redundancy",
+            related_chunks=list(related_chunks),
+            created_at=created_at
+        )
+    
+    def _create_empty_optimization(self, chunk_id: str, created_at: Optional[datetime] = None) -> OptimizationRecord:
         """Create an empty optimization when no issues are found"""
-        return Optimization(
+        return OptimizationRecord(
             id=str(uuid.uuid4()),
             chunk_id=chunk_id,
             type="info",
@@ -301,6 +832,39 @@ class Optimizer:
             title="No optimization needed",
             description="This chunk meets all quality standards",
             suggested_action="No action required",
-            created_at=datetime.utcnow(),
+            related_chunks=[],
+            created_at=created_at or datetime.utcnow(),
             status="applied"
         )
+
+
+# Per-process optimizer used by executor workers
+_worker_optimizer: Optional[Optimizer] = None
+
+
+def _analyze_shard(
+    shard: List[Tuple[str, str, bytes, Optional[Scores]]],
+    config: DomainConfig,
+    options: AnalysisOptions,
+    created_at: datetime
+) -> Tuple[List[AnalysisResult], Optional[List[Tuple[int, ...]]], Tuple[Dict, ...]]:
+    """Analyze a shard of (chunk_id, content, digest, cached scores) inside an executor worker
+    
+    Returns the results, the chunks' MinHash signatures when the parent keeps a
+    similarity index, and the metrics the worker recorded meanwhile. Only the
+    parent queries and updates the index, so workers never contend for it.
+    """
+    global _worker_optimizer
+    if _worker_optimizer is None:
+        _worker_optimizer = Optimizer(index_similarity=False)
+    
+    pipeline = get_pipeline(config)
+    results = _worker_optimizer._analyze_items(shard, pipeline, options, created_at)
+    
+    signatures = None
+    if options.check_similarity and settings.similarity_index_enabled:
+        signatures = [
+            _worker_optimizer._signature(content, digest, pipeline)[0]
+            for _, content, digest, _ in shard
+        ]
+    return results, signatures, drain_worker_metrics()
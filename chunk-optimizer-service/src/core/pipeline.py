@@ -0,0 +1,203 @@
+"""Immutable per-domain analyzer pipelines"""
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple
+
+from algorithms.minhash import MinHasher
+from algorithms.quality_analyzer import QualityAnalyzer
+from algorithms.redundancy_detector import RedundancyDetector
+from algorithms.similarity_calculator import SimilarityCalculator
+from algorithms.size_analyzer import SizeAnalyzer
+from algorithms.text_profile import TextProfile
+from config.domain_config import (
+    DomainConfig,
+    calculate_overall_score,
+    config_fingerprint,
+    get_optimization_priority
+)
+from config.domain_registry import get_domain_registry
+from core.profiling import ACTIVE_PROFILE
+from core.scoring import (
+    ALL_METRICS,
+    METRIC_NAMES,
+    NOT_COMPUTED,
+    QUALITY_METRIC,
+    REDUNDANCY_METRIC,
+    SIMILARITY_METRIC,
+    SIZE_METRIC,
+    BatchScorer,
+    metric_names,
+    scores_mask
+)
+from utils.telemetry import QUALITY_STAGE, REDUNDANCY_STAGE, SIMILARITY_STAGE, SIZE_STAGE
+
+Scores = Tuple[float, float, float, float, float]
+
+Priorities = Tuple[str, str, str, str]
+
+# Signatures must be comparable across domains, so every pipeline shares one hasher
+MINHASHER = MinHasher()
+
+
+def requested_metrics(options) -> int:
+    """Flags of the metrics an AnalysisOptions asks for"""
+    return (
+        (QUALITY_METRIC if options.check_quality else 0) |
+        (REDUNDANCY_METRIC if options.check_redundancy else 0) |
+        (SIZE_METRIC if options.check_size else 0) |
+        (SIMILARITY_METRIC if options.check_similarity else 0)
+    )
+
+
+@dataclass(frozen=True)
+class AnalysisPipeline:
+    """Analyzers configured for one DomainConfig, built once and shared read-only"""
+    
+    config: DomainConfig
+    fingerprint: bytes
+    quality_analyzer: QualityAnalyzer
+    redundancy_detector: RedundancyDetector
+    size_analyzer: SizeAnalyzer
+    similarity_calculator: SimilarityCalculator
+    batch_scorer: Optional[BatchScorer]
+    
+    @classmethod
+    def build(cls, config: DomainConfig) -> "AnalysisPipeline":
+        """Construct every analyzer for a configuration"""
+        quality_analyzer = QualityAnalyzer(config)
+        redundancy_detector = RedundancyDetector()
+        similarity_calculator = SimilarityCalculator(config, MINHASHER)
+        
+        return cls(
+            config=config,
+            fingerprint=config_fingerprint(config),
+            quality_analyzer=quality_analyzer,
+            redundancy_detector=redundancy_detector,
+            size_analyzer=SizeAnalyzer(config),
+            similarity_calculator=similarity_calculator,
+            batch_scorer=(
+                BatchScorer(quality_analyzer, redundancy_detector, similarity_calculator)
+                if BatchScorer.available() else None
+            )
+        )
+    
+    @property
+    def minhasher(self) -> MinHasher:
+        return self.similarity_calculator.minhasher
+    
+    def score(
+        self,
+        profile: TextProfile,
+        metrics: int = ALL_METRICS,
+        base: Optional[Scores] = None
+    ) -> Scores:
+        """Run the analyzers of requested metrics missing from ``base``, timing each stage
+        
+        Metrics neither requested nor in ``base`` are NaN, and the overall score
+        covers every metric present.
+        """
+        values = list(base[:4]) if base is not None else [NOT_COMPUTED] * 4
+        missing = metrics & ~scores_mask(base)
+        active_profile = ACTIVE_PROFILE.get()
+        clock = time.perf_counter
+        
+        for idx, (analyzer, stage) in enumerate((
+            (self.quality_analyzer, QUALITY_STAGE),
+            (self.redundancy_detector, REDUNDANCY_STAGE),
+            (self.size_analyzer, SIZE_STAGE),
+            (self.similarity_calculator, SIMILARITY_STAGE)
+        )):
+            if missing & (1 << idx):
+                start = clock()
+                values[idx] = analyzer.analyze(profile)
+                elapsed = clock() - start
+                stage.observe(elapsed)
+                if active_profile is not None:
+                    active_profile.record(**{METRIC_NAMES[idx]: elapsed})
+        
+        return (*values, self.overall_score(values))
+    
+    def overall_score(self, values: Sequence[float]) -> float:
+        """Weighted overall score, renormalized over the metrics that were computed"""
+        quality_score, redundancy_score, size_score, similarity_score = values
+        if scores_mask(values) == ALL_METRICS:
+            return calculate_overall_score(
+                quality_score,
+                redundancy_score,
+                size_score,
+                similarity_score,
+                self.config
+            )
+        
+        config = self.config
+        terms = [
+            (value, weight)
+            for value, weight in (
+                (quality_score, config.quality_weight),
+                (1 - redundancy_score, config.redundancy_weight),
+                (size_score, config.size_weight),
+                (1 - similarity_score, config.similarity_weight)
+            )
+            if value == value
+        ]
+        total_weight = sum(weight for _, weight in terms)
+        if not total_weight:
+            return NOT_COMPUTED
+        return sum(value * weight for value, weight in terms) / total_weight
+    
+    def project(self, scores: Scores, metrics: int) -> Scores:
+        """Keep only the requested metrics, renormalizing the overall score"""
+        if scores_mask(scores) == metrics:
+            return scores
+        values = [
+            value if metrics & (1 << idx) else NOT_COMPUTED
+            for idx, value in enumerate(scores[:4])
+        ]
+        return (*values, self.overall_score(values))
+    
+    def merge(self, scores: Scores, base: Scores) -> Scores:
+        """Metrics of ``scores``, topped up with those only ``base`` has"""
+        if scores_mask(scores) == ALL_METRICS:
+            return scores
+        values = [
+            value if value == value else fallback
+            for value, fallback in zip(scores[:4], base[:4])
+        ]
+        return (*values, self.overall_score(values))
+    
+    def priorities(self, scores: Scores) -> Priorities:
+        """Quality, redundancy, size and similarity priorities of one chunk"""
+        config = self.config
+        quality_score, redundancy_score, size_score, similarity_score, _ = scores
+        return (
+            get_optimization_priority(quality_score, config.quality_threshold),
+            get_optimization_priority(
+                redundancy_score,
+                config.redundancy_threshold,
+                high_threshold=config.redundancy_threshold * 1.2
+            ),
+            get_optimization_priority(size_score, config.size_threshold),
+            get_optimization_priority(
+                similarity_score,
+                config.similarity_threshold,
+                high_threshold=config.similarity_threshold * 1.1
+            )
+        )
+
+
+@lru_cache(maxsize=256)
+def get_pipeline(config: DomainConfig) -> AnalysisPipeline:
+    """Cached pipeline for a configuration"""
+    return AnalysisPipeline.build(config)
+
+
+def get_domain_pipeline(domain: str) -> AnalysisPipeline:
+    """Pipeline precompiled by the domain registry when the domain was loaded"""
+    registry = get_domain_registry()
+    pipeline = registry.compiled(domain)
+    if pipeline is None:
+        # First lookup in this process: compile every domain now and on each reload
+        registry.set_compiler(get_pipeline)
+        pipeline = registry.compiled(domain)
+    return pipeline
@@ -0,0 +1,135 @@
+"""Opt-in per-request profiling of chunk analysis"""
+import cProfile
+import io
+import marshal
+import pstats
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+from config.settings import settings
+from utils.cache import BoundedCache
+
+PROFILE_MODES = ("stages", "cprofile")
+
+# Captured cProfile dumps, kept per process until evicted
+PROFILE_DUMPS = BoundedCache(max_entries=settings.profiling_max_dumps, max_bytes=64 * 1024 * 1024)
+
+# Python 3.12+ allows one enabled cProfile.Profile per process, so captures take turns
+_CAPTURE_LOCK = threading.Lock()
+
+
+class RequestProfile:
+    """Per-chunk stage timings of one request, plus an optional cProfile dump
+    
+    Analysis code reports stage timings through ``ACTIVE_PROFILE``; a profiled
+    request is analyzed in-process, one chunk at a time and without cached
+    scores, so every analyzer runs and is attributed to its chunk.
+    """
+    
+    def __init__(self, mode: str = "stages"):
+        self.profile_id = uuid.uuid4().hex
+        self.mode = mode
+        self.chunks: Dict[str, Dict[str, float]] = {}
+        self.chunk_totals: Dict[str, float] = {}
+        self._current: Optional[Dict[str, float]] = None
+        self._chunk_started = 0.0
+        self._started = time.perf_counter()
+        self._elapsed: Optional[float] = None
+    
+    def start_chunk(self, chunk_id: str):
+        self._current = self.chunks.setdefault(chunk_id, {})
+        self._chunk_started = time.perf_counter()
+    
+    def end_chunk(self, chunk_id: str):
+        elapsed = time.perf_counter() - self._chunk_started
+        self.chunk_totals[chunk_id] = self.chunk_totals.get(chunk_id, 0.0) + elapsed
+        self._current = None
+    
+    def record(self, **stages: float):
+        """Add stage durations in seconds to the current chunk"""
+        current = self._current
+        if current is not None:
+            for stage, seconds in stages.items():
+                current[stage] = current.get(stage, 0.0) + seconds
+    
+    @contextmanager
+    def capture(self) -> Iterator[None]:
+        """Run the enclosed analysis under cProfile when requested, one capture at a time"""
+        if self.mode != "cprofile":
+            yield
+            return
+        
+        # Captures run in worker threads, so waiting here never blocks the event loop
+        with _CAPTURE_LOCK:
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                yield
+            finally:
+                profiler.disable()
+                profiler.create_stats()
+                dump = marshal.dumps(profiler.stats)
+                PROFILE_DUMPS.put(self.profile_id, dump, len(dump))
+    
+    def finish(self):
+        self._elapsed = time.perf_counter() - self._started
+    
+    def report(self) -> Dict[str, Any]:
+        """JSON-ready breakdown in milliseconds, slowest chunk first"""
+        elapsed = self._elapsed if self._elapsed is not None else time.perf_counter() - self._started
+        totals: Dict[str, float] = {}
+        chunks = []
+        for chunk_id, stages in self.chunks.items():
+            for stage, seconds in stages.items():
+                totals[stage] = totals.get(stage, 0.0) + seconds
+            chunks.append({
+                "chunk_id": chunk_id,
+                "total_ms": round(self.chunk_totals.get(chunk_id, 0.0) * 1000, 3),
+                "stages_ms": {stage: round(seconds * 1000, 3) for stage, seconds in stages.items()}
+            })
+        chunks.sort(key=lambda chunk: chunk["total_ms"], reverse=True)
+        
+        return {
+            "profile_id": self.profile_id,
+            "mode": self.mode,
+            "elapsed_ms": round(elapsed * 1000, 3),
+            "stages_ms": {stage: round(seconds * 1000, 3) for stage, seconds in totals.items()},
+            "chunks": chunks,
+            "dump_url": f"/debug/profiles/{self.profile_id}" if self.mode == "cprofile" else None
+        }
+
+
+ACTIVE_PROFILE: ContextVar[Optional[RequestProfile]] = ContextVar("active_profile", default=None)
+
+
+@contextmanager
+def profiling(profile: Optional[RequestProfile]) -> Iterator[Optional[RequestProfile]]:
+    """Make ``profile`` active for the enclosed analysis"""
+    token = ACTIVE_PROFILE.set(profile)
+    try:
+        yield profile
+    finally:
+        ACTIVE_PROFILE.reset(token)
+        if profile is not None:
+            profile.finish()
+
+
+def format_dump(dump: bytes, sort: str = "cumulative", limit: int = 60) -> str:
+    """Human-readable pstats listing of a stored dump"""
+    stats = pstats.Stats(_LoadedProfile(marshal.loads(dump)), stream=io.StringIO())
+    stats.sort_stats(sort).print_stats(limit)
+    return stats.stream.getvalue()
+
+
+class _LoadedProfile:
+    """Adapter letting pstats.Stats read stats loaded from a dump"""
+    
+    def __init__(self, stats: dict):
+        self.stats = stats
+    
+    def create_stats(self):
+        pass
@@ -0,0 +1,82 @@
+"""Lightweight internal analysis results
+
+Analysis builds plain named tuples instead of Pydantic models: they are cheap
+to create, to pickle back from executor workers and to encode. Each record
+mirrors a response schema field for field and in the same order, so encoding
+it yields the same JSON as the schema; ``to_model`` validates a record into
+its schema where a model is really needed.
+"""
+from datetime import datetime
+from typing import List, NamedTuple, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class MetricsRecord(NamedTuple):
+    """Record of ``Metrics``"""
+    chunk_id: str
+    quality_score: Optional[float]
+    redundancy_score: Optional[float]
+    size_score: Optional[float]
+    similarity_score: Optional[float]
+    overall_score: Optional[float]
+    computed_metrics: List[str]
+
+
+class OptimizationRecord(NamedTuple):
+    """Record of ``Optimization``"""
+    id: str
+    chunk_id: str
+    type: str
+    priority: str
+    title: str
+    description: str
+    suggested_action: str
+    related_chunks: List[str]
+    created_at: datetime
+    status: str = "pending"
+
+
+AnalysisResult = Tuple[MetricsRecord, List[OptimizationRecord]]
+
+
+class OptimizationResponseRecord(NamedTuple):
+    """Record of ``OptimizationResponse``"""
+    optimization: OptimizationRecord
+    metrics: MetricsRecord
+
+
+class OptimizationListRecord(NamedTuple):
+    """Record of ``OptimizationListResponse``"""
+    optimizations: List[OptimizationRecord]
+    total: int
+    high_priority: int
+
+
+class BatchOptimizationRecord(NamedTuple):
+    """Record of ``BatchOptimizationResponse``"""
+    batch_id: str
+    item_id: str
+    optimization: Optional[OptimizationRecord]
+    processed: int
+    total: int
+
+
+class ChunkResultRecord(NamedTuple):
+    """Record of ``ChunkResult``"""
+    type: str
+    chunk_id: str
+    metrics: MetricsRecord
+    optimizations: List[OptimizationRecord]
+
+
+def chunk_result(metrics: MetricsRecord, optimizations: List[OptimizationRecord]) -> ChunkResultRecord:
+    """Per-chunk result line of streams and batch jobs"""
+    return ChunkResultRecord("result", metrics.chunk_id, metrics, optimizations)
+
+
+def to_model(record: NamedTuple, schema: Type[ModelT]) -> ModelT:
+    """Validate a record, with the records nested in it, into its response schema"""
+    return schema.model_validate(record, from_attributes=True)
@@ -0,0 +1,262 @@
+"""Vectorized batch scoring of chunk features"""
+from typing import List, Optional, Sequence, Tuple
+
+from algorithms.quality_analyzer import QualityAnalyzer
+from algorithms.redundancy_detector import RedundancyDetector
+from algorithms.similarity_calculator import SimilarityCalculator
+from algorithms.text_profile import TextProfile
+from config.domain_config import DomainConfig
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    np = None
+
+# Raw per-chunk features, one column each in the feature matrix
+FEATURES = (
+    "blank",
+    "length",
+    "words",
+    "unique_words",
+    "sentences",
+    "sentence_words",
+    "has_transitions",
+    "repeated_phrases",
+    "distinct_phrases",
+    "repeated_sentences",
+    "meaningful_words",
+    "repeated_meaningful_words"
+)
+
+Features = Tuple[int, ...]
+
+PRIORITIES = np.array(["HIGH", "MEDIUM", "LOW"]) if np is not None else None
+
+# Bit flags of the four metrics, in score column order
+QUALITY_METRIC = 1
+REDUNDANCY_METRIC = 2
+SIZE_METRIC = 4
+SIMILARITY_METRIC = 8
+ALL_METRICS = QUALITY_METRIC | REDUNDANCY_METRIC | SIZE_METRIC | SIMILARITY_METRIC
+
+METRIC_NAMES = ("quality", "redundancy", "size", "similarity")
+
+# Score of a metric that was not requested
+NOT_COMPUTED = float("nan")
+
+
+def scores_mask(scores: Optional[Sequence[float]]) -> int:
+    """Flags of the metrics present (not NaN) in a score tuple"""
+    if scores is None:
+        return 0
+    return sum(1 << idx for idx, value in enumerate(scores[:4]) if value == value)
+
+
+def metric_names(metrics: int) -> List[str]:
+    """Names of the metrics in a set of flags"""
+    return [name for idx, name in enumerate(METRIC_NAMES) if metrics & (1 << idx)]
+
+
+class BatchScorer:
+    """Score many chunks at once with NumPy array operations
+    
+    Tokenization and repetition counting stay per chunk; every piecewise score,
+    the weighting and the priority bucketing then run over whole columns and
+    reproduce the scalar analyzers bit for bit.
+    """
+    
+    def __init__(
+        self,
+        quality_analyzer: QualityAnalyzer,
+        redundancy_detector: RedundancyDetector,
+        similarity_calculator: SimilarityCalculator
+    ):
+        if np is None:
+            raise RuntimeError("numpy is required for batch scoring")
+        
+        self.quality_analyzer = quality_analyzer
+        self.redundancy_detector = redundancy_detector
+        self.similarity_calculator = similarity_calculator
+    
+    @staticmethod
+    def available() -> bool:
+        """Whether numpy is installed"""
+        return np is not None
+    
+    def features(self, profile: TextProfile, metrics: int = ALL_METRICS) -> Features:
+        """Extract the raw counts the requested scores are derived from
+        
+        Counts only other metrics need are left at zero, so the columns of
+        metrics that were not requested are meaningless.
+        """
+        if profile.is_blank:
+            return (1,) + (0,) * (len(FEATURES) - 1)
+        
+        has_transitions = 0
+        if metrics & QUALITY_METRIC:
+            has_transitions = int(len(profile.lowered_sentences) >= 2 and self.quality_analyzer.has_transitions(profile))
+        
+        repeated_phrases = distinct_phrases = repeated_sentences = 0
+        if metrics & REDUNDANCY_METRIC:
+            repeated_phrases, distinct_phrases = self.redundancy_detector.phrase_repetition_counts(profile)
+            repeated_sentences = len(profile.lowered_sentences) - len(set(profile.lowered_sentences))
+        
+        meaningful = self.similarity_calculator._extract_words(profile) if metrics & SIMILARITY_METRIC else ()
+        
+        return (
+            0,
+            profile.length,
+            len(profile.words),
+            len(profile.word_counts),
+            len(profile.sentences),
+            profile.sentence_word_count,
+            has_transitions,
+            repeated_phrases,
+            distinct_phrases,
+            repeated_sentences,
+            len(meaningful),
+            len(meaningful) - len(set(meaningful))
+        )
+    
+    def score(self, features: Sequence[Features], config: DomainConfig) -> "np.ndarray":
+        """Return an (n, 5) array of quality, redundancy, size, similarity and overall scores"""
+        columns = np.asarray(features, dtype=np.float64).reshape(-1, len(FEATURES)).T
+        (
+            blank, length, words, unique_words, sentences, sentence_words, has_transitions,
+            repeated_phrases, distinct_phrases, repeated_sentences,
+            meaningful_words, repeated_meaningful_words
+        ) = columns
+        present = blank == 0
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            quality = (
+                self._length_score(length, config, 0.8) +
+                self._sentence_structure_score(sentences, sentence_words) +
+                self._vocabulary_score(words, unique_words) +
+                np.where(has_transitions > 0, 0.8 + 0.2, 0.8)
+            ) / 4
+            
+            redundancy = (
+                self._ratio_score(repeated_phrases, distinct_phrases * 0.5) +
+                np.where(
+                    sentences >= 2,
+                    self._ratio_score(repeated_sentences, sentences * 0.5),
+                    0.0
+                ) +
+                self._word_repetition_score(words, unique_words)
+            ) / 3
+            
+            size = self._size_score(length, config)
+            
+            similarity = np.where(
+                meaningful_words >= 5,
+                self._ratio_score(repeated_meaningful_words, meaningful_words * 0.3),
+                0.0
+            )
+        
+        quality = np.where(present, quality, 0.0)
+        redundancy = np.where(present, redundancy, 0.0)
+        size = np.where(present, size, 0.0)
+        similarity = np.where(present, similarity, 0.0)
+        
+        overall = (
+            quality * config.quality_weight +
+            (1 - redundancy) * config.redundancy_weight +
+            size * config.size_weight +
+            (1 - similarity) * config.similarity_weight
+        )
+        
+        return np.stack([quality, redundancy, size, similarity, overall], axis=1)
+    
+    @staticmethod
+    def priorities(scores: Sequence[Sequence[float]], config: DomainConfig) -> List[Tuple[str, str, str, str]]:
+        """Bucket quality, redundancy, size and similarity scores into optimization priorities"""
+        scores = np.asarray(scores, dtype=np.float64).reshape(-1, 5)
+        buckets = [
+            PRIORITIES[np.select(
+                [scores[:, column] < high_threshold, scores[:, column] < threshold],
+                [0, 1],
+                2
+            )]
+            for column, threshold, high_threshold in (
+                (0, config.quality_threshold, config.quality_threshold * 0.8),
+                (1, config.redundancy_threshold, config.redundancy_threshold * 1.2),
+                (2, config.size_threshold, config.size_threshold * 0.8),
+                (3, config.similarity_threshold, config.similarity_threshold * 1.1)
+            )
+        ]
+        return list(zip(*(bucket.tolist() for bucket in buckets)))
+    
+    @staticmethod
+    def _length_score(length: "np.ndarray", config: DomainConfig, in_range: float) -> "np.ndarray":
+        """Shared length ladder of the quality analyzer"""
+        optimal_min, optimal_max = config.optimal_length
+        return np.select(
+            [
+                length < config.min_length,
+                length > config.max_length,
+                (optimal_min <= length) & (length <= optimal_max)
+            ],
+            [
+                length / config.min_length,
+                np.maximum(0, 1 - (length - config.max_length) / config.max_length),
+                1.0
+            ],
+            in_range
+        )
+    
+    @classmethod
+    def _size_score(cls, length: "np.ndarray", config: DomainConfig) -> "np.ndarray":
+        """Size analyzer ladder: quality's length ladder with linear ramps around the optimum"""
+        optimal_min, optimal_max = config.optimal_length
+        ramp = np.where(
+            length < optimal_min,
+            0.6 + 0.4 * (length - config.min_length) / (optimal_min - config.min_length),
+            0.6 + 0.4 * (config.max_length - length) / (config.max_length - optimal_max)
+        )
+        return np.where(
+            (length < config.min_length) | (length > config.max_length) |
+            ((optimal_min <= length) & (length <= optimal_max)),
+            cls._length_score(length, config, 0.0),
+            ramp
+        )
+    
+    @staticmethod
+    def _sentence_structure_score(sentences: "np.ndarray", sentence_words: "np.ndarray") -> "np.ndarray":
+        average = sentence_words / sentences
+        return np.select(
+            [
+                sentences == 0,
+                (10 <= average) & (average <= 25),
+                ((5 <= average) & (average < 10)) | ((25 < average) & (average <= 35))
+            ],
+            [0.0, 1.0, 0.7],
+            0.5
+        )
+    
+    @staticmethod
+    def _vocabulary_score(words: "np.ndarray", unique_words: "np.ndarray") -> "np.ndarray":
+        diversity = unique_words / words
+        return np.select(
+            [words == 0, diversity >= 0.6, diversity >= 0.4],
+            [0.0, 1.0, 0.8],
+            0.5
+        )
+    
+    @staticmethod
+    def _word_repetition_score(words: "np.ndarray", unique_words: "np.ndarray") -> "np.ndarray":
+        diversity = unique_words / words
+        return np.select(
+            [words < 10, diversity >= 0.7, diversity >= 0.5, diversity >= 0.3],
+            [0.0, 0.0, 0.3, 0.6],
+            1.0
+        )
+    
+    @staticmethod
+    def _ratio_score(repeated: "np.ndarray", max_possible: "np.ndarray") -> "np.ndarray":
+        """min(1, repeated / max_possible), zero without repetitions"""
+        return np.where(
+            (repeated > 0) & (max_possible > 0),
+            np.minimum(1.0, repeated / max_possible),
+            0.0
+        )
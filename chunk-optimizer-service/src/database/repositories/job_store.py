@@ -0,0 +1,207 @@
+"""Pluggable stores for batch analysis jobs"""
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, List, Optional, Type
+
+from pydantic import BaseModel
+
+# Job statuses after which a job no longer changes
+FINISHED_STATUSES = ("completed", "failed")
+
+
+class JobStore(ABC):
+    """Storage for batch job state and per-item results
+    
+    Jobs are models with ``job_id``, ``status`` and ``error`` fields and
+    results are any models; the store does not depend on their schemas.
+    Updates and results for unknown jobs, such as jobs deleted while still
+    running, are ignored.
+    """
+    
+    @abstractmethod
+    def create(self, job: BaseModel):
+        """Register a new job"""
+    
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[BaseModel]:
+        """Return job state, or None if unknown"""
+    
+    @abstractmethod
+    def update(self, job: BaseModel):
+        """Persist updated job state"""
+    
+    @abstractmethod
+    def append_results(self, job_id: str, results: List[BaseModel]):
+        """Append item results in processing order"""
+    
+    @abstractmethod
+    def get_results(self, job_id: str, offset: int, limit: int) -> List[BaseModel]:
+        """Return a page of item results"""
+    
+    @abstractmethod
+    def delete(self, job_id: str) -> bool:
+        """Remove a job and its results, returning whether it existed"""
+    
+    def close(self):
+        """Release store resources"""
+
+
+class InMemoryJobStore(JobStore):
+    """Process-local job store, lost on restart
+    
+    Only the ``max_finished_jobs`` most recently finished jobs are kept; older
+    ones are dropped with their results as new jobs finish.
+    """
+    
+    def __init__(self, max_finished_jobs: int = 1000):
+        self.max_finished_jobs = max_finished_jobs
+        self._jobs: Dict[str, BaseModel] = {}
+        self._results: Dict[str, List[BaseModel]] = {}
+        # Finished job ids, oldest first
+        self._finished: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def create(self, job: BaseModel):
+        with self._lock:
+            self._jobs[job.job_id] = job.model_copy()
+            self._results[job.job_id] = []
+    
+    def get(self, job_id: str) -> Optional[BaseModel]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.model_copy() if job else None
+    
+    def update(self, job: BaseModel):
+        with self._lock:
+            if job.job_id not in self._jobs:
+                return
+            self._jobs[job.job_id] = job.model_copy()
+            
+            if job.status in FINISHED_STATUSES and job.job_id not in self._finished:
+                self._finished[job.job_id] = None
+                while len(self._finished) > self.max_finished_jobs:
+                    evicted, _ = self._finished.popitem(last=False)
+                    self._jobs.pop(evicted, None)
+                    self._results.pop(evicted, None)
+    
+    def append_results(self, job_id: str, results: List[BaseModel]):
+        with self._lock:
+            if job_id in self._results:
+                self._results[job_id].extend(results)
+    
+    def get_results(self, job_id: str, offset: int, limit: int) -> List[BaseModel]:
+        with self._lock:
+            return self._results.get(job_id, [])[offset:offset + limit]
+    
+    def delete(self, job_id: str) -> bool:
+        with self._lock:
+            self._finished.pop(job_id, None)
+            self._results.pop(job_id, None)
+            return self._jobs.pop(job_id, None) is not None
+
+
+class SQLiteJobStore(JobStore):
+    """Job store persisted in SQLite, surviving restarts"""
+    
+    FILENAME = "jobs.sqlite3"
+    
+    def __init__(self, directory: str, job_model: Type[BaseModel], result_model: Type[BaseModel]):
+        self.job_model = job_model
+        self.result_model = result_model
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, self.FILENAME)
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                state TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS job_results (
+                job_id TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                result TEXT NOT NULL,
+                PRIMARY KEY (job_id, position)
+            ) WITHOUT ROWID;
+            """
+        )
+        self._conn.commit()
+        self._fail_interrupted()
+    
+    def _fail_interrupted(self):
+        """Mark jobs left unfinished by a previous process as failed"""
+        with self._lock:
+            rows = self._conn.execute("SELECT state FROM jobs").fetchall()
+        for (state,) in rows:
+            job = self.job_model.model_validate_json(state)
+            if job.status in ("pending", "running"):
+                job.status = "failed"
+                job.error = "Interrupted by service restart"
+                self.update(job)
+    
+    def create(self, job: BaseModel):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO jobs (job_id, state) VALUES (?, ?)",
+                (job.job_id, job.model_dump_json())
+            )
+    
+    def get(self, job_id: str) -> Optional[BaseModel]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT state FROM jobs WHERE job_id = ?",
+                (job_id,)
+            ).fetchone()
+        return self.job_model.model_validate_json(row[0]) if row else None
+    
+    def update(self, job: BaseModel):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET state = ? WHERE job_id = ?",
+                (job.model_dump_json(), job.job_id)
+            )
+    
+    def append_results(self, job_id: str, results: List[BaseModel]):
+        with self._lock, self._conn:
+            if self._conn.execute("SELECT 1 FROM jobs WHERE job_id = ?", (job_id,)).fetchone() is None:
+                return
+            (start,) = self._conn.execute(
+                "SELECT COALESCE(MAX(position) + 1, 0) FROM job_results WHERE job_id = ?",
+                (job_id,)
+            ).fetchone()
+            self._conn.executemany(
+                "INSERT INTO job_results (job_id, position, result) VALUES (?, ?, ?)",
+                [
+                    (job_id, start + idx, result.model_dump_json())
+                    for idx, result in enumerate(results)
+                ]
+            )
+    
+    def get_results(self, job_id: str, offset: int, limit: int) -> List[BaseModel]:
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT result FROM job_results
+                WHERE job_id = ? AND position >= ? AND position < ?
+                ORDER BY position
+                """,
+                (job_id, offset, offset + limit)
+            ).fetchall()
+        return [self.result_model.model_validate_json(row[0]) for row in rows]
+    
+    def delete(self, job_id: str) -> bool:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM job_results WHERE job_id = ?", (job_id,))
+            cursor = self._conn.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+            return cursor.rowcount > 0
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,126 @@
+"""Persistent MinHash/LSH near-duplicate index"""
+import os
+import sqlite3
+import threading
+from array import array
+from typing import List, Optional, Tuple
+
+from algorithms.minhash import MinHasher
+
+
+class SimilarityIndex:
+    """Corpus-level near-duplicate index stored in SQLite
+    
+    Signatures are bucketed by LSH band so a lookup is one indexed query over
+    ``bands`` keys followed by a signature comparison of the few candidates.
+    
+    Matches depend on arrival order: a chunk is queried against what was
+    indexed before it and then added. Chunks of one request are indexed in
+    order, but results across concurrent requests or replicas vary with
+    scheduling.
+    """
+    
+    FILENAME = "similarity_index.sqlite3"
+    
+    def __init__(self, directory: str, minhasher: Optional[MinHasher] = None):
+        self.minhasher = minhasher or MinHasher()
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, self.FILENAME)
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS signatures (
+                chunk_id TEXT PRIMARY KEY,
+                signature BLOB NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS lsh_buckets (
+                bucket INTEGER NOT NULL,
+                chunk_id TEXT NOT NULL,
+                PRIMARY KEY (bucket, chunk_id)
+            ) WITHOUT ROWID;
+            """
+        )
+        self._conn.commit()
+    
+    @staticmethod
+    def _encode(signature: Tuple[int, ...]) -> bytes:
+        return array("Q", signature).tobytes()
+    
+    @staticmethod
+    def _decode(blob: bytes) -> Tuple[int, ...]:
+        values = array("Q")
+        values.frombytes(blob)
+        return tuple(values)
+    
+    def query(
+        self,
+        signature: Tuple[int, ...],
+        threshold: float,
+        exclude: Optional[str] = None,
+        limit: int = 50
+    ) -> List[Tuple[str, float]]:
+        """Find indexed chunks whose estimated similarity is at least ``threshold``"""
+        if not signature:
+            return []
+        
+        keys = self.minhasher.band_keys(signature)
+        placeholders = ",".join("?" * len(keys))
+        
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT s.chunk_id, s.signature FROM signatures s
+                WHERE s.chunk_id IN (
+                    SELECT DISTINCT chunk_id FROM lsh_buckets WHERE bucket IN ({placeholders})
+                )
+                """,
+                keys
+            ).fetchall()
+        
+        matches = []
+        for chunk_id, blob in rows:
+            if chunk_id == exclude:
+                continue
+            similarity = self.minhasher.estimate_similarity(signature, self._decode(blob))
+            if similarity >= threshold:
+                matches.append((chunk_id, similarity))
+        
+        matches.sort(key=lambda match: match[1], reverse=True)
+        return matches[:limit]
+    
+    def add(self, chunk_id: str, signature: Tuple[int, ...]):
+        """Insert or replace the signature of a chunk"""
+        if not signature:
+            return
+        
+        keys = self.minhasher.band_keys(signature)
+        
+        with self._lock:
+            with self._conn:
+                previous = self._conn.execute(
+                    "SELECT signature FROM signatures WHERE chunk_id = ?",
+                    (chunk_id,)
+                ).fetchone()
+                if previous is not None:
+                    old_keys = self.minhasher.band_keys(self._decode(previous[0]))
+                    self._conn.executemany(
+                        "DELETE FROM lsh_buckets WHERE bucket = ? AND chunk_id = ?",
+                        [(key, chunk_id) for key in old_keys]
+                    )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO signatures (chunk_id, signature) VALUES (?, ?)",
+                    (chunk_id, self._encode(signature))
+                )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO lsh_buckets (bucket, chunk_id) VALUES (?, ?)",
+                    [(key, chunk_id) for key in keys]
+                )
+    
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,132 @@
+"""Two-tier result cache: in-process LRU in front of an optional Redis tier"""
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from loguru import logger
+
+from utils.cache import BoundedCache
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # pragma: no cover - redis is an optional dependency
+    aioredis = None
+
+
+class TieredResultCache:
+    """Look up encoded results locally first, then in Redis with one MGET per call
+    
+    Redis errors never fail a request: the tier is skipped for
+    ``retry_interval`` seconds and lookups fall back to the local tier.
+    """
+    
+    def __init__(
+        self,
+        local: BoundedCache,
+        client: Optional[Any] = None,
+        ttl: int = 7 * 24 * 3600,
+        retry_interval: float = 30.0
+    ):
+        self.local = local
+        self.client = client
+        self.ttl = ttl
+        self.retry_interval = retry_interval
+        self._retry_at = 0.0
+        
+        self.remote_hits = 0
+        self.remote_misses = 0
+        self.remote_errors = 0
+    
+    @classmethod
+    def from_url(
+        cls,
+        local: BoundedCache,
+        redis_url: Optional[str],
+        connect_timeout: float = 0.25,
+        timeout: float = 0.25,
+        **kwargs
+    ) -> "TieredResultCache":
+        """Build a cache backed by Redis at ``redis_url``, or local-only without it
+        
+        Short socket timeouts turn an unreachable or stalled Redis into an
+        error, so requests fall back to the local tier instead of hanging.
+        """
+        client = None
+        if redis_url:
+            if aioredis is None:
+                logger.warning("redis package is not installed, using local result cache only")
+            else:
+                client = aioredis.Redis.from_url(
+                    redis_url,
+                    socket_connect_timeout=connect_timeout,
+                    socket_timeout=timeout
+                )
+        return cls(local, client, **kwargs)
+    
+    @property
+    def remote_available(self) -> bool:
+        return self.client is not None and time.monotonic() >= self._retry_at
+    
+    def _mark_unavailable(self, error: Exception):
+        self.remote_errors += 1
+        self._retry_at = time.monotonic() + self.retry_interval
+        logger.warning(f"Redis result cache unavailable, using local tier only: {error}")
+    
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        """Return cached values in key order, None for misses"""
+        values = [self.local.get(key) for key in keys]
+        missing = [idx for idx, value in enumerate(values) if value is None]
+        
+        if not missing or not self.remote_available:
+            return values
+        
+        try:
+            remote = await self.client.mget([keys[idx] for idx in missing])
+        except Exception as e:
+            self._mark_unavailable(e)
+            return values
+        
+        for idx, value in zip(missing, remote):
+            if value is None:
+                self.remote_misses += 1
+                continue
+            self.remote_hits += 1
+            values[idx] = value
+            self.local.put(keys[idx], value)
+        
+        return values
+    
+    async def set_many(self, items: Dict[str, bytes]):
+        """Store values in both tiers, writing Redis in a single pipeline"""
+        if not items:
+            return
+        
+        for key, value in items.items():
+            self.local.put(key, value)
+        
+        if not self.remote_available:
+            return
+        
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(key, value, ex=self.ttl)
+                await pipe.execute()
+        except Exception as e:
+            self._mark_unavailable(e)
+    
+    async def close(self):
+        """Close the Redis connection pool"""
+        if self.client is not None:
+            await self.client.aclose()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Counters of both tiers"""
+        return {
+            "local": self.local.stats(),
+            "remote": {
+                "enabled": self.client is not None,
+                "hits": self.remote_hits,
+                "misses": self.remote_misses,
+                "errors": self.remote_errors
+            }
+        }
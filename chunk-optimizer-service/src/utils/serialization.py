@@ -0,0 +1,129 @@
+"""Encoding of request and response bodies: JSON, MessagePack and Arrow IPC"""
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - msgpack is an optional dependency
+    msgpack = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - pyarrow is an optional dependency
+    pa = None
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# Also accepted for MessagePack request bodies
+MSGPACK_MEDIA_TYPES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack")
+
+SCORE_COLUMNS = ("quality_score", "redundancy_score", "size_score", "similarity_score", "overall_score")
+
+
+def _named_tuple(value: Any) -> dict:
+    # Named tuples encode as objects, like the schemas they mirror
+    if hasattr(value, "_asdict"):
+        return value._asdict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _plain(value: Any) -> Any:
+    """Named tuples and datetimes converted for the standard library encoder"""
+    if hasattr(value, "_asdict"):
+        return {key: _plain(item) for key, item in zip(value._fields, value)}
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def dumps(content: Any) -> bytes:
+    """Compact UTF-8 JSON of plain values, named tuples and datetimes
+    
+    With orjson installed the output is byte-identical to Pydantic's
+    ``model_dump_json``; otherwise it is that of FastAPI's default encoder.
+    """
+    if orjson is not None:
+        return orjson.dumps(content, default=_named_tuple)
+    return json.dumps(
+        _plain(content),
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _msgpack_default(value: Any) -> Any:
+    # Strict types route named tuples here instead of packing them as arrays
+    if hasattr(value, "_asdict"):
+        return value._asdict()
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, tuple):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not MessagePack serializable")
+
+
+def packb(content: Any) -> bytes:
+    """MessagePack of the same value tree ``dumps`` encodes, datetimes as ISO 8601 strings"""
+    return msgpack.packb(content, default=_msgpack_default, strict_types=True, datetime=False)
+
+
+def unpackb(data: bytes) -> Any:
+    """Decode a MessagePack request body"""
+    return msgpack.unpackb(data)
+
+
+def _optimization_type() -> "pa.DataType":
+    return pa.struct([
+        ("id", pa.string()),
+        ("chunk_id", pa.string()),
+        ("type", pa.string()),
+        ("priority", pa.string()),
+        ("title", pa.string()),
+        ("description", pa.string()),
+        ("suggested_action", pa.string()),
+        ("related_chunks", pa.list_(pa.string())),
+        ("created_at", pa.timestamp("us")),
+        ("status", pa.string())
+    ])
+
+
+def results_to_arrow(results: Sequence[Tuple[Any, List[Any]]], metadata: Optional[Dict[str, str]] = None) -> bytes:
+    """Arrow IPC stream of per-chunk (metrics, optimizations) results, one row per chunk
+    
+    Scores are float64 columns, null where a metric was not computed; the
+    optimizations of each chunk are a list of structs.
+    """
+    metrics = [chunk_metrics for chunk_metrics, _ in results]
+    columns = [pa.array([chunk_metrics.chunk_id for chunk_metrics in metrics], pa.string())]
+    columns.extend(
+        pa.array([getattr(chunk_metrics, name) for chunk_metrics in metrics], pa.float64())
+        for name in SCORE_COLUMNS
+    )
+    columns.append(pa.array([chunk_metrics.computed_metrics for chunk_metrics in metrics], pa.list_(pa.string())))
+    columns.append(pa.array(
+        [[optimization._asdict() for optimization in optimizations] for _, optimizations in results],
+        pa.list_(_optimization_type())
+    ))
+    
+    table = pa.Table.from_arrays(
+        columns,
+        names=["chunk_id", *SCORE_COLUMNS, "computed_metrics", "optimizations"],
+        metadata=metadata
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
@@ -0,0 +1,360 @@
+"""In-process metrics rendered in the Prometheus text exposition format
+
+Every metric child holds its own lock and a few plain numbers, so an update
+costs a lock round-trip plus an addition (and a bisect for histograms), about
+a microsecond. Executor worker processes record into their own copies;
+``drain_worker_metrics`` ships those deltas back with each shard and
+``merge_worker_metrics`` folds them into the parent's metrics. That keeps
+worker metrics in the shard results instead of the per-process mmap files
+``prometheus_client``'s multiprocess mode would need.
+"""
+import math
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Latency buckets in seconds, from 10µs up to 10s
+LATENCY_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025,
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+# Chunk size buckets in characters
+SIZE_BUCKETS = (64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384, 32768, 65536, 262144, 1048576)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)) + "}"
+
+
+class _CounterChild:
+    __slots__ = ("_lock", "value")
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0.0
+    
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+
+class _GaugeChild(_CounterChild):
+    __slots__ = ()
+    
+    def dec(self, amount: float = 1.0):
+        with self._lock:
+            self.value -= amount
+    
+    def set(self, value: float):
+        self.value = value
+
+
+class _HistogramChild:
+    __slots__ = ("_lock", "bounds", "counts", "sum")
+    
+    def __init__(self, bounds: Sequence[float]):
+        self._lock = threading.Lock()
+        self.bounds = bounds
+        # One count per bucket plus the +Inf bucket; cumulated at render time
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+    
+    def observe(self, value: float, count: int = 1):
+        """Record ``count`` observations of ``value``"""
+        idx = bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[idx] += count
+            self.sum += value * count
+    
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+
+class Metric(ABC):
+    """A named metric family with a fixed set of label names"""
+    
+    kind = "untyped"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[LabelValues, object] = {}
+        self._lock = threading.Lock()
+    
+    @abstractmethod
+    def _new_child(self):
+        """Fresh state for one combination of label values"""
+    
+    def labels(self, *values: str):
+        """Child metric for one combination of label values; bind it once on hot paths"""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+    
+    @abstractmethod
+    def _samples(self) -> Iterator[Tuple[str, LabelValues, Sequence[str], float]]:
+        """Suffix, label values, extra label names and value of each exposed sample"""
+    
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for suffix, values, extra_names, value in self._samples():
+            labels = _format_labels(self.labelnames + tuple(extra_names), values)
+            lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+        return lines
+    
+    @abstractmethod
+    def drain(self) -> Dict[LabelValues, object]:
+        """Take and reset every child's state"""
+    
+    @abstractmethod
+    def merge(self, state: Dict[LabelValues, object]):
+        """Add state taken by ``drain`` in another process"""
+
+
+class Counter(Metric):
+    kind = "counter"
+    
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+    
+    def _samples(self):
+        for values, child in list(self._children.items()):
+            yield "_total", values, (), child.value
+    
+    def drain(self) -> Dict[LabelValues, float]:
+        state = {}
+        for values, child in list(self._children.items()):
+            with child._lock:
+                if child.value:
+                    state[values] = child.value
+                    child.value = 0.0
+        return state
+    
+    def merge(self, state: Dict[LabelValues, float]):
+        for values, amount in state.items():
+            self.labels(*values).inc(amount)
+
+
+class Gauge(Metric):
+    kind = "gauge"
+    
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+    
+    def _samples(self):
+        for values, child in list(self._children.items()):
+            yield "", values, (), child.value
+    
+    def drain(self) -> Dict[LabelValues, float]:
+        # A gauge is a current value of the process that owns it, not a delta
+        return {}
+    
+    def merge(self, state: Dict[LabelValues, float]):
+        for values, value in state.items():
+            self.labels(*values).set(value)
+
+
+class Histogram(Metric):
+    kind = "histogram"
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+    
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+    
+    def _samples(self):
+        for values, child in list(self._children.items()):
+            with child._lock:
+                counts = list(child.counts)
+                total = child.sum
+            
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                yield "_bucket", values + (_format_value(bound),), ("le",), cumulative
+            yield "_count", values, (), cumulative
+            yield "_sum", values, (), total
+    
+    def drain(self) -> Dict[LabelValues, Tuple[List[int], float]]:
+        state = {}
+        for values, child in list(self._children.items()):
+            with child._lock:
+                if any(child.counts):
+                    state[values] = (child.counts, child.sum)
+                    child.counts = [0] * len(child.counts)
+                    child.sum = 0.0
+        return state
+    
+    def merge(self, state: Dict[LabelValues, Tuple[List[int], float]]):
+        for values, (counts, total) in state.items():
+            child = self.labels(*values)
+            with child._lock:
+                child.counts = [a + b for a, b in zip(child.counts, counts)]
+                child.sum += total
+
+
+class Registry:
+    """Metric families plus callbacks producing derived lines at scrape time"""
+    
+    def __init__(self):
+        self._metrics: List[Metric] = []
+        self._collectors: List[Callable[[], List[str]]] = []
+    
+    def register(self, metric: Metric) -> Metric:
+        self._metrics.append(metric)
+        return metric
+    
+    def add_collector(self, collector: Callable[[], List[str]]):
+        self._collectors.append(collector)
+    
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+REQUESTS = REGISTRY.register(Counter(
+    "chunkopt_http_requests",
+    "HTTP requests by route and status",
+    ("method", "route", "status")
+))
+
+REQUEST_SECONDS = REGISTRY.register(Histogram(
+    "chunkopt_http_request_duration_seconds",
+    "HTTP request latency by route",
+    ("method", "route")
+))
+
+REQUESTS_IN_FLIGHT = REGISTRY.register(Gauge(
+    "chunkopt_http_requests_in_flight",
+    "HTTP requests currently being served",
+    ("method", "route")
+))
+
+STAGE_SECONDS = REGISTRY.register(Histogram(
+    "chunkopt_stage_duration_seconds",
+    "Per-chunk time spent in each analysis stage",
+    ("stage",)
+))
+
+CHUNK_SIZE = REGISTRY.register(Histogram(
+    "chunkopt_chunk_size_chars",
+    "Size of analyzed chunks in characters",
+    buckets=SIZE_BUCKETS
+))
+
+CACHE_LOOKUPS = REGISTRY.register(Counter(
+    "chunkopt_cache_lookups",
+    "Cache lookups by cache and result",
+    ("cache", "result")
+))
+
+# Children bound once for the analysis hot path
+TOKENIZE_STAGE = STAGE_SECONDS.labels("tokenize")
+QUALITY_STAGE = STAGE_SECONDS.labels("quality")
+REDUNDANCY_STAGE = STAGE_SECONDS.labels("redundancy")
+SIZE_STAGE = STAGE_SECONDS.labels("size")
+SIMILARITY_STAGE = STAGE_SECONDS.labels("similarity")
+BATCH_SCORE_STAGE = STAGE_SECONDS.labels("batch_score")
+SIGNATURE_STAGE = STAGE_SECONDS.labels("signature")
+SIMILARITY_INDEX_STAGE = STAGE_SECONDS.labels("similarity_index")
+OPTIMIZATION_STAGE = STAGE_SECONDS.labels("optimization")
+
+CHUNK_SIZE_ALL = CHUNK_SIZE.labels()
+
+# Metrics recorded inside executor workers and merged back into the parent
+WORKER_METRICS = (STAGE_SECONDS, CACHE_LOOKUPS)
+
+
+def cache_lookups(cache: str) -> Tuple[_CounterChild, _CounterChild]:
+    """Bound (hit, miss) counters of one cache"""
+    return CACHE_LOOKUPS.labels(cache, "hit"), CACHE_LOOKUPS.labels(cache, "miss")
+
+
+# Process serving /metrics; thread-mode workers record straight into its metrics
+_parent_pid = os.getpid()
+
+
+def drain_worker_metrics() -> Tuple[Dict, ...]:
+    if os.getpid() == _parent_pid:
+        return ()
+    return tuple(metric.drain() for metric in WORKER_METRICS)
+
+
+def merge_worker_metrics(states: Optional[Tuple[Dict, ...]]):
+    if states:
+        for metric, state in zip(WORKER_METRICS, states):
+            metric.merge(state)
+
+
+def _reset_worker_metrics():
+    # A forked worker must not report the counts it inherited from its parent
+    for metric in WORKER_METRICS:
+        metric.drain()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_worker_metrics)
+
+
+def _cache_hit_ratios() -> List[str]:
+    lookups: Dict[str, List[float]] = {}
+    for (cache, result), child in list(CACHE_LOOKUPS._children.items()):
+        counts = lookups.setdefault(cache, [0.0, 0.0])
+        counts[0 if result == "hit" else 1] += child.value
+    
+    name = "chunkopt_cache_hit_ratio"
+    lines = [f"# HELP {name} Fraction of cache lookups that hit", f"# TYPE {name} gauge"]
+    for cache, (hits, misses) in sorted(lookups.items()):
+        ratio = hits / (hits + misses) if hits + misses else 0.0
+        lines.append(f"{name}{_format_labels(('cache',), (cache,))} {_format_value(ratio)}")
+    return lines
+
+
+REGISTRY.add_collector(_cache_hit_ratios)
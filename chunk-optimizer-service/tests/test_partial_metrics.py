@@ -0,0 +1,122 @@
+"""Partial metric requests: cache top-up, reweighted overall scores and batch/scalar parity"""
+import math
+
+import pytest
+
+from api.rest.schemas import AnalysisOptions
+from config.domain_config import calculate_overall_score
+from config.settings import settings
+from core.optimizer import SCORES_STRUCT, Optimizer
+from core.pipeline import get_domain_pipeline, requested_metrics
+from core.scoring import ALL_METRICS, QUALITY_METRIC, SIZE_METRIC
+from utils.cache import content_digest
+from algorithms.text_profile import TextProfile
+
+CHUNKS = [
+    ("plain", "The server restarts nightly. However, logs are kept for a week. Therefore disk usage stays low."),
+    ("repetitive", "restart the node and check the log. " * 12),
+    ("short", "ok."),
+    ("blank", "   "),
+    ("chinese", "服务器重启后，日志保留一周。因此磁盘占用较低。但是内存需要监控。")
+]
+
+PARTIAL = AnalysisOptions(check_redundancy=False, check_similarity=False)
+
+
+@pytest.fixture(autouse=True)
+def no_similarity_index(monkeypatch):
+    # Keep tests off disk and independent of previously indexed chunks
+    monkeypatch.setattr(settings, "similarity_index_enabled", False)
+
+
+@pytest.fixture(params=["default", "medical"])
+def pipeline(request):
+    return get_domain_pipeline(request.param)
+
+
+def same_scores(left, right) -> bool:
+    return all(
+        (math.isnan(a) and math.isnan(b)) or a == b
+        for a, b in zip(left, right)
+    )
+
+
+@pytest.mark.parametrize("chunk_id, content", CHUNKS)
+def test_partial_entry_topped_up_equals_full_computation(pipeline, chunk_id, content):
+    optimizer = Optimizer()
+    partial = optimizer._calculate_metrics(chunk_id, content, pipeline, metrics=QUALITY_METRIC | SIZE_METRIC)
+    assert partial.computed_metrics == ["quality", "size"]
+    assert partial.redundancy_score is None and partial.similarity_score is None
+    
+    topped_up = optimizer._calculate_metrics(chunk_id, content, pipeline)
+    full = Optimizer()._calculate_metrics(chunk_id, content, pipeline)
+    assert topped_up == full
+
+
+@pytest.mark.parametrize("chunk_id, content", CHUNKS)
+def test_partial_scores_top_up_from_cached_entry(pipeline, chunk_id, content):
+    profile = TextProfile.from_text(content)
+    partial = pipeline.score(profile, QUALITY_METRIC)
+    
+    assert same_scores(pipeline.score(profile, ALL_METRICS, base=partial), pipeline.score(profile))
+    assert same_scores(pipeline.merge(pipeline.score(profile, SIZE_METRIC), partial), pipeline.score(profile, QUALITY_METRIC | SIZE_METRIC))
+
+
+def test_merge_keeps_computed_scores_and_fills_missing_from_base(pipeline):
+    nan = float("nan")
+    merged = pipeline.merge((0.25, nan, 0.5, nan, nan), (0.9, 0.1, 0.9, 0.2, 0.7))
+    
+    assert merged[:4] == (0.25, 0.1, 0.5, 0.2)
+    assert merged[4] == pipeline.overall_score(merged[:4])
+
+
+@pytest.mark.parametrize("chunk_id, content", CHUNKS)
+def test_overall_score_of_all_metrics_is_unchanged(pipeline, chunk_id, content):
+    profile = TextProfile.from_text(content)
+    quality, redundancy, size, similarity, overall = pipeline.score(profile)
+    
+    assert overall == calculate_overall_score(quality, redundancy, size, similarity, pipeline.config)
+    assert overall == pipeline.overall_score((quality, redundancy, size, similarity))
+
+
+def test_partial_overall_score_is_reweighted_over_computed_metrics(pipeline):
+    config = pipeline.config
+    quality, _, size, _, overall = pipeline.score(TextProfile.from_text(CHUNKS[0][1]), QUALITY_METRIC | SIZE_METRIC)
+    
+    expected = (quality * config.quality_weight + size * config.size_weight) / (config.quality_weight + config.size_weight)
+    assert overall == pytest.approx(expected)
+
+
+def test_no_requested_metrics_yields_null_scores(pipeline):
+    options = AnalysisOptions(check_quality=False, check_redundancy=False, check_size=False, check_similarity=False)
+    metrics, _ = Optimizer()._analyze_content("plain", CHUNKS[0][1], pipeline, options)
+    
+    assert metrics.computed_metrics == []
+    assert metrics.quality_score is None
+    assert metrics.redundancy_score is None
+    assert metrics.size_score is None
+    assert metrics.similarity_score is None
+    assert metrics.overall_score is None
+
+
+def test_cached_entry_keeps_metrics_beyond_the_request(pipeline):
+    optimizer = Optimizer()
+    full = optimizer._calculate_metrics("plain", CHUNKS[0][1], pipeline)
+    partial = optimizer._calculate_metrics("plain", CHUNKS[0][1], pipeline, metrics=QUALITY_METRIC)
+    
+    entry = SCORES_STRUCT.unpack(optimizer._encode_scores(pipeline, partial, optimizer._metrics_scores(full)))
+    assert optimizer._covers(entry, ALL_METRICS)
+    assert not optimizer._covers(optimizer._metrics_scores(partial), ALL_METRICS)
+    assert optimizer._metrics_record("plain", entry, ALL_METRICS) == full
+
+
+@pytest.mark.skipif(get_domain_pipeline("default").batch_scorer is None, reason="batch scoring needs numpy")
+@pytest.mark.parametrize("options", [PARTIAL, AnalysisOptions(check_quality=False, check_size=False), AnalysisOptions()])
+def test_batch_scorer_matches_scalar_path(pipeline, options):
+    items = [(chunk_id, content, content_digest(content), None) for chunk_id, content in CHUNKS]
+    batch = Optimizer()._analyze_items(items, pipeline, options)
+    
+    scalar_optimizer = Optimizer()
+    for (chunk_id, content, _, _), (metrics, _) in zip(items, batch):
+        expected = scalar_optimizer._calculate_metrics(chunk_id, content, pipeline, metrics=requested_metrics(options))
+        assert metrics == expected
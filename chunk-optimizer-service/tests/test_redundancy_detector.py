@@ -0,0 +1,47 @@
+"""Repeated passages reported by the redundancy detector"""
+import pytest
+
+from algorithms.redundancy_detector import RedundancyDetector
+from config.settings import settings
+from core.optimizer import Optimizer
+from core.pipeline import get_domain_pipeline
+
+SENTENCE = "服务器每天凌晨自动备份数据"
+CHINESE = f"{SENTENCE}。运维人员需要检查日志。{SENTENCE}。"
+
+
+@pytest.fixture(autouse=True)
+def no_similarity_index(monkeypatch):
+    monkeypatch.setattr(settings, "similarity_index_enabled", False)
+
+
+def test_repeated_chinese_sentence_is_reported_in_characters():
+    spans = RedundancyDetector().find_repeated_spans(CHINESE)
+    
+    second = CHINESE.index(SENTENCE, 1)
+    assert spans == [(0, len(SENTENCE), SENTENCE), (second, len(SENTENCE), SENTENCE)]
+
+
+def test_latin_passage_is_sliced_from_the_original_text():
+    content = "Restart the Node, then check logs. Restart the node then check logs again."
+    
+    spans = RedundancyDetector().find_repeated_spans(content)
+    
+    assert spans == [(0, 6, "Restart the Node, then check logs"), (6, 6, "Restart the Node, then check logs")]
+
+
+def test_chinese_redundancy_description_quotes_the_passage():
+    pipeline = get_domain_pipeline("default")
+    optimizer = Optimizer()
+    metrics = optimizer._calculate_metrics("zh", CHINESE, pipeline)
+    
+    optimizations = optimizer._generate_optimizations(
+        "zh", CHINESE, metrics, pipeline, priorities=("LOW", "HIGH", "LOW", "LOW")
+    )
+    
+    (redundancy,) = [opt for opt in optimizations if opt.type == "redundancy"]
+    second = CHINESE.index(SENTENCE, 1)
+    assert (
+        f"({len(SENTENCE)} characters, at character offsets 0, {second}): \"{SENTENCE}\""
+        in redundancy.description
+    )
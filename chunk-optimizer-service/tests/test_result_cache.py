@@ -0,0 +1,124 @@
+"""Two-tier result cache against an in-process fake Redis"""
+import asyncio
+
+import fakeredis
+import pytest
+
+from utils.cache import BoundedCache
+from utils.result_cache import TieredResultCache
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+def make_cache(server, **kwargs) -> TieredResultCache:
+    client = fakeredis.FakeAsyncRedis(server=server)
+    return TieredResultCache(BoundedCache(max_entries=100), client, **kwargs)
+
+
+def count_calls(monkeypatch, obj, name: str) -> list:
+    calls = []
+    original = getattr(obj, name)
+    
+    def wrapper(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+    
+    monkeypatch.setattr(obj, name, wrapper)
+    return calls
+
+
+def test_local_misses_are_topped_up_with_one_mget(server, monkeypatch):
+    async def run():
+        cache = make_cache(server)
+        cache.local.put("local", b"L")
+        await cache.client.set("remote", b"R")
+        mget_calls = count_calls(monkeypatch, cache.client, "mget")
+        
+        values = await cache.get_many(["local", "remote", "absent"])
+        
+        assert values == [b"L", b"R", None]
+        assert mget_calls == [(["remote", "absent"],)]
+        assert cache.local.get("remote") == b"R"
+        assert (cache.remote_hits, cache.remote_misses) == (1, 1)
+        
+        # The remote hit now comes from the local tier
+        assert await cache.get_many(["local", "remote"]) == [b"L", b"R"]
+        assert len(mget_calls) == 1
+    
+    asyncio.run(run())
+
+
+def test_set_many_writes_both_tiers_in_one_pipeline_with_ttl(server, monkeypatch):
+    async def run():
+        cache = make_cache(server, ttl=60)
+        pipelines = count_calls(monkeypatch, cache.client, "pipeline")
+        
+        await cache.set_many({"a": b"1", "b": b"2"})
+        
+        assert len(pipelines) == 1
+        assert cache.local.get("a") == b"1"
+        assert await cache.client.mget(["a", "b"]) == [b"1", b"2"]
+        for key in ("a", "b"):
+            assert 0 < await cache.client.ttl(key) <= 60
+    
+    asyncio.run(run())
+
+
+def test_a_second_replica_reads_values_written_by_the_first(server):
+    async def run():
+        await make_cache(server).set_many({"shared": b"S"})
+        
+        replica = make_cache(server)
+        assert await replica.get_many(["shared"]) == [b"S"]
+        assert replica.remote_hits == 1
+    
+    asyncio.run(run())
+
+
+def test_redis_errors_fall_back_to_the_local_tier(server, monkeypatch):
+    async def run():
+        cache = make_cache(server, retry_interval=30.0)
+        cache.local.put("local", b"L")
+        server.connected = False
+        
+        assert await cache.get_many(["local", "remote"]) == [b"L", None]
+        assert cache.remote_errors == 1
+        assert not cache.remote_available
+        
+        # While the tier is skipped, writes stay local and lookups never reach Redis
+        mget_calls = count_calls(monkeypatch, cache.client, "mget")
+        await cache.set_many({"new": b"N"})
+        assert await cache.get_many(["new", "remote"]) == [b"N", None]
+        assert mget_calls == []
+        assert cache.remote_errors == 1
+    
+    asyncio.run(run())
+
+
+def test_redis_is_retried_after_the_retry_interval(server):
+    async def run():
+        cache = make_cache(server, retry_interval=0.0)
+        server.connected = False
+        await cache.set_many({"a": b"1"})
+        assert cache.remote_errors == 1
+        
+        server.connected = True
+        await cache.set_many({"b": b"2"})
+        assert await cache.client.get("b") == b"2"
+        assert cache.remote_errors == 1
+    
+    asyncio.run(run())
+
+
+def test_local_only_cache_without_client():
+    async def run():
+        cache = TieredResultCache(BoundedCache(max_entries=10))
+        await cache.set_many({"a": b"1"})
+        
+        assert await cache.get_many(["a", "b"]) == [b"1", None]
+        assert cache.stats()["remote"]["enabled"] is False
+    
+    asyncio.run(run())
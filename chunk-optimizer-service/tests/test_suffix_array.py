@@ -0,0 +1,88 @@
+"""Suffix/LCP arrays and the phrase counts derived from them"""
+import random
+
+import pytest
+
+from algorithms.redundancy_detector import RedundancyDetector
+from algorithms.suffix_array import RepeatedSpan, build_lcp_array, build_suffix_array, longest_repeats
+from algorithms.text_profile import TextProfile
+
+CORPUS = [
+    "The server restarts nightly. However, logs are kept for a week. Therefore disk usage stays low.",
+    "restart the node and check the log. " * 12,
+    "check the log then restart the node, check the log then restart the node again and again",
+    "a b c a b c a b c d a b c",
+    "one two three four five six",
+    "服务器每天凌晨自动备份数据。运维人员需要检查日志。服务器每天凌晨自动备份数据。",
+    "Deploy the service with the new config. The new config enables caching. Deploy the service again."
+]
+
+
+def naive_lcp(tokens, suffixes):
+    lcp = [0] * len(suffixes)
+    for idx in range(1, len(suffixes)):
+        a, b = tokens[suffixes[idx - 1]:], tokens[suffixes[idx]:]
+        while lcp[idx] < min(len(a), len(b)) and a[lcp[idx]] == b[lcp[idx]]:
+            lcp[idx] += 1
+    return lcp
+
+
+def ngram_phrase_counts(words, min_length=3, max_length=8, threshold=2):
+    """The n-gram dictionary count the suffix structure replaced"""
+    phrase_counts = {}
+    window_size = min(max_length, len(words))
+    for i in range(len(words)):
+        for j in range(i + min_length, min(i + window_size + 1, len(words) + 1)):
+            phrase = ' '.join(words[i:j])
+            phrase_counts[phrase] = phrase_counts.get(phrase, 0) + 1
+    repeated = sum(c - 1 for c in phrase_counts.values() if c >= threshold)
+    return repeated, len(phrase_counts)
+
+
+@pytest.mark.parametrize("tokens", [[], [7], [1, 1, 1, 1, 1], [3, 2, 1], [1, 2, 1, 2, 1, 2, 3]])
+def test_small_sequences_match_naive_sort(tokens):
+    suffixes = build_suffix_array(tokens)
+    
+    assert suffixes == sorted(range(len(tokens)), key=lambda i: tokens[i:])
+    assert build_lcp_array(tokens, suffixes) == naive_lcp(tokens, suffixes)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_sequences_match_naive_sort(seed):
+    rng = random.Random(seed)
+    tokens = [rng.randrange(rng.choice((2, 4, 50))) for _ in range(rng.randrange(1, 200))]
+    
+    suffixes = build_suffix_array(tokens)
+    
+    assert suffixes == sorted(range(len(tokens)), key=lambda i: tokens[i:])
+    assert build_lcp_array(tokens, suffixes) == naive_lcp(tokens, suffixes)
+
+
+def test_longest_repeats_reports_every_occurrence_and_skips_nested_spans():
+    #         0  1  2  3  4  5  6  7  8  9
+    tokens = [1, 2, 3, 4, 9, 1, 2, 3, 4, 8]
+    suffixes = build_suffix_array(tokens)
+    
+    repeats = longest_repeats(suffixes, build_lcp_array(tokens, suffixes), min_length=2)
+    
+    # [2, 3, 4] and [3, 4] repeat too, but only inside [1, 2, 3, 4]
+    assert repeats == [RepeatedSpan(4, (0, 5))]
+
+
+def test_longest_repeats_respects_min_length_and_limit():
+    tokens = [1, 2, 0, 1, 2, 0, 5, 6, 7, 0, 5, 6, 7]
+    suffixes = build_suffix_array(tokens)
+    lcp = build_lcp_array(tokens, suffixes)
+    
+    assert longest_repeats(suffixes, lcp, min_length=5) == []
+    assert longest_repeats(suffixes, lcp, min_length=2, limit=1) == [RepeatedSpan(4, (5, 9))]
+
+
+@pytest.mark.parametrize("content", CORPUS)
+def test_phrase_counts_match_ngram_dictionary(content):
+    profile = TextProfile.from_text(content)
+    
+    counts = RedundancyDetector().phrase_repetition_counts(profile)
+    
+    expected = ngram_phrase_counts(profile.words) if len(profile.words) >= 6 else (0, 0)
+    assert counts == expected